@@ -1,7 +1,7 @@
 import tempfile
 import warnings
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 
 import numpy as np
 from torch import nn
@@ -342,6 +342,54 @@ class TTS(nn.Module):
         self.synthesizer.save_wav(wav=wav, path=file_path, pipe_out=pipe_out)
         return file_path
 
+    def tts_stream(
+        self,
+        text: str,
+        speaker: str = None,
+        language: str = None,
+        speaker_wav: str = None,
+        split_sentences: bool = True,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Convert text to speech and stream it as a WAV file, one sentence at a time.
+
+        Audio for the first sentence is available as soon as it is synthesized, instead of after the whole text.
+
+        Example:
+            >>> with open("output.wav", "wb") as f:
+            >>>     for chunk in tts.tts_stream("A long text. With many sentences."):
+            >>>         f.write(chunk)
+
+        Args:
+            text (str):
+                Input text to synthesize.
+            speaker (str, optional):
+                Speaker name for multi-speaker. You can check whether loaded model is multi-speaker by
+                `tts.is_multi_speaker` and list speakers by `tts.speakers`. Defaults to None.
+            language (str, optional):
+                Language code for multi-lingual models. You can check whether loaded model is multi-lingual
+                `tts.is_multi_lingual` and list available languages by `tts.languages`. Defaults to None.
+            speaker_wav (str, optional):
+                Path to a reference wav file to use for voice cloning with supporting models like YourTTS.
+                Defaults to None.
+            split_sentences (bool, optional):
+                Split text into sentences and yield the audio of each as soon as it is ready. Defaults to True.
+            kwargs (dict, optional):
+                Additional arguments for the model.
+
+        Returns:
+            Iterator[bytes]: the WAV header followed by one chunk of 16-bit PCM samples per sentence.
+        """
+        self._check_arguments(speaker=speaker, language=language, speaker_wav=speaker_wav, **kwargs)
+        return self.synthesizer.tts_stream_wav(
+            text=text,
+            speaker_name=speaker,
+            language_name=language,
+            speaker_wav=speaker_wav,
+            split_sentences=split_sentences,
+            **kwargs,
+        )
+
     def voice_conversion(
         self,
         source_wav: str,
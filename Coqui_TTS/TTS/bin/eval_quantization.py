@@ -0,0 +1,126 @@
+import argparse
+import time
+from argparse import RawTextHelpFormatter
+from pathlib import Path
+
+import librosa
+import numpy as np
+import torch
+
+from TTS.utils.manage import ModelManager
+from TTS.utils.synthesizer import Synthesizer
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "She sells seashells by the seashore, and the shells she sells are surely seashells.",
+    "It was a bright cold day in April, and the clocks were striking thirteen.",
+    "How much wood would a woodchuck chuck if a woodchuck could chuck wood?",
+    "Please call Stella and ask her to bring these things with her from the store.",
+]
+
+
+def log_spectral_distance(ref_wav: np.ndarray, wav: np.ndarray, n_fft: int = 1024, hop_length: int = 256) -> float:
+    """Log-spectral distance in dB between two waveforms over their common frames."""
+    ref_spec = np.abs(librosa.stft(ref_wav.astype(np.float32), n_fft=n_fft, hop_length=hop_length)) ** 2
+    spec = np.abs(librosa.stft(wav.astype(np.float32), n_fft=n_fft, hop_length=hop_length)) ** 2
+    num_frames = min(ref_spec.shape[1], spec.shape[1])
+    diff = 10 * np.log10(ref_spec[:, :num_frames] + 1e-10) - 10 * np.log10(spec[:, :num_frames] + 1e-10)
+    return float(np.mean(np.sqrt(np.mean(diff**2, axis=0))))
+
+
+def synthesize_sentences(synthesizer, sentences, runs, **kwargs):
+    """Synthesize each sentence with a fixed seed, returning the waveforms and the best time of `runs` runs."""
+    wavs, times = [], []
+    synthesizer.tts(sentences[0], **kwargs)  # warm up
+    for sentence in sentences:
+        best = float("inf")
+        for _ in range(runs):
+            torch.manual_seed(0)
+            start = time.perf_counter()
+            wav = synthesizer.tts(sentence, split_sentences=False, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        wavs.append(wav)
+        times.append(best)
+    return wavs, times
+
+
+def compare_quantization(synthesizer_args, sentences, runs=3, **kwargs):
+    """Synthesize `sentences` with fp32 and int8 models and report the speedup and spectral distance."""
+    fp32 = Synthesizer(**synthesizer_args)
+    ref_wavs, ref_times = synthesize_sentences(fp32, sentences, runs, **kwargs)
+    sample_rate = fp32.output_sample_rate
+    del fp32
+
+    int8 = Synthesizer(**synthesizer_args, quantize=True)
+    wavs, times = synthesize_sentences(int8, sentences, runs, **kwargs)
+
+    print(f"\n{'fp32 (s)':>9} {'int8 (s)':>9} {'speedup':>8} {'LSD (dB)':>9} {'length':>7}  sentence")
+    distances = []
+    for sentence, ref_wav, wav, ref_time, int8_time in zip(sentences, ref_wavs, wavs, ref_times, times):
+        distances.append(log_spectral_distance(ref_wav, wav))
+        print(
+            f"{ref_time:9.3f} {int8_time:9.3f} {ref_time / int8_time:8.2f} {distances[-1]:9.2f} "
+            f"{len(wav) / len(ref_wav):7.3f}  {sentence[:40]}"
+        )
+    audio_seconds = sum(len(wav) for wav in ref_wavs) / sample_rate
+    print(
+        f"\nTotal: fp32 {sum(ref_times):.2f}s (RTF {sum(ref_times) / audio_seconds:.3f}), "
+        f"int8 {sum(times):.2f}s (RTF {sum(times) / audio_seconds:.3f}), "
+        f"speedup {sum(ref_times) / sum(times):.2f}x, mean LSD {np.mean(distances):.2f} dB"
+    )
+    return {"speedup": sum(ref_times) / sum(times), "lsd": float(np.mean(distances))}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="""Compare int8 quantized CPU inference against fp32 on a fixed sentence set.\n\n"""
+        """
+        Reports the synthesis time, speedup and log-spectral distance (LSD) of each sentence. Outputs are seeded the
+        same way, so the LSD only reflects the quantization error.
+
+        Example runs:
+        python TTS/bin/eval_quantization.py --model_name tts_models/en/ljspeech/tacotron2-DDC
+        python TTS/bin/eval_quantization.py --model_path model.pth --config_path config.json --sentences text.txt
+        """,
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument("--model_name", type=str, default=None, help="Name of one of the released tts models.")
+    parser.add_argument("--vocoder_name", type=str, default=None, help="Name of one of the released vocoder models.")
+    parser.add_argument("--model_path", type=str, default=None, help="Path to model checkpoint file.")
+    parser.add_argument("--config_path", type=str, default=None, help="Path to model config file.")
+    parser.add_argument("--vocoder_path", type=str, default=None, help="Path to vocoder checkpoint file.")
+    parser.add_argument("--vocoder_config_path", type=str, default=None, help="Path to vocoder config file.")
+    parser.add_argument("--speakers_file_path", type=str, default=None, help="JSON file for multi-speaker model.")
+    parser.add_argument("--speaker_idx", type=str, default=None, help="Speaker of a multi-speaker model.")
+    parser.add_argument("--language_idx", type=str, default=None, help="Language of a multi-lingual model.")
+    parser.add_argument("--sentences", type=str, default=None, help="Text file with one sentence per line.")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per sentence, the fastest one is kept.")
+    args = parser.parse_args()
+
+    model_path, config_path = args.model_path, args.config_path
+    vocoder_path, vocoder_config_path = args.vocoder_path, args.vocoder_config_path
+    if args.model_name is not None and model_path is None:
+        manager = ModelManager(Path(__file__).parent / "../.models.json")
+        model_path, config_path, model_item = manager.download_model(args.model_name)
+        args.vocoder_name = model_item.get("default_vocoder") if args.vocoder_name is None else args.vocoder_name
+        if args.vocoder_name is not None and vocoder_path is None:
+            vocoder_path, vocoder_config_path, _ = manager.download_model(args.vocoder_name)
+
+    sentences = SENTENCES
+    if args.sentences is not None:
+        with open(args.sentences, "r", encoding="utf-8") as f:
+            sentences = [line.strip() for line in f if line.strip()]
+
+    compare_quantization(
+        {
+            "tts_checkpoint": model_path,
+            "tts_config_path": config_path,
+            "tts_speakers_file": args.speakers_file_path,
+            "vocoder_checkpoint": vocoder_path,
+            "vocoder_config": vocoder_config_path,
+        },
+        sentences,
+        runs=args.runs,
+        speaker_name=args.speaker_idx,
+        language_name=args.language_idx,
+    )
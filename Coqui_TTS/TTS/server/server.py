@@ -4,16 +4,27 @@ import io
 import json
 import os
 import sys
+from functools import partial
 from pathlib import Path
-from threading import Lock
 from typing import Union
 from urllib.parse import parse_qs
 
-from flask import Flask, render_template, render_template_string, request, send_file
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    render_template_string,
+    request,
+    send_file,
+    stream_with_context,
+)
 
 from TTS.config import load_config
+from TTS.utils.audio.numpy_transforms import wav_stream_header, wav_to_pcm16
 from TTS.utils.manage import ModelManager
 from TTS.utils.synthesizer import Synthesizer
+from TTS.utils.worker_pool import ModelWorkerPool
 
 
 def create_argparser():
@@ -55,6 +66,25 @@ def create_argparser():
     parser.add_argument("--speakers_file_path", type=str, help="JSON file for multi-speaker model.", default=None)
     parser.add_argument("--port", type=int, default=5002, help="port to listen on.")
     parser.add_argument("--use_cuda", type=convert_boolean, default=False, help="true to use CUDA.")
+    parser.add_argument(
+        "--quantize",
+        type=convert_boolean,
+        default=False,
+        help="true to run the models in int8 on CPU.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of model worker processes serving requests in parallel. 0 serves from the server process. "
+        "CUDA models are always served from the server process.",
+    )
+    parser.add_argument(
+        "--threads_per_worker",
+        type=int,
+        default=None,
+        help="torch threads of each worker. Defaults to an even share of the CPU cores.",
+    )
     parser.add_argument("--debug", type=convert_boolean, default=False, help="true to enable Flask debug mode.")
     parser.add_argument("--show_details", type=convert_boolean, default=False, help="Generate model detail page.")
     return parser
@@ -101,7 +131,7 @@ if args.vocoder_path is not None:
     vocoder_config_path = args.vocoder_config_path
 
 # load models
-synthesizer = Synthesizer(
+synthesizer_args = dict(
     tts_checkpoint=model_path,
     tts_config_path=config_path,
     tts_speakers_file=speakers_file_path,
@@ -111,6 +141,17 @@ synthesizer = Synthesizer(
     encoder_checkpoint="",
     encoder_config="",
     use_cuda=args.use_cuda,
+    quantize=args.quantize,
+)
+synthesizer = Synthesizer(**synthesizer_args)
+
+# serve requests from worker processes forked with the loaded model, sharing its weights;
+# a worker that dies is replaced by a fresh process loading the model from the checkpoint
+pool = ModelWorkerPool(
+    lambda: synthesizer,
+    num_workers=0 if args.use_cuda else args.workers,
+    threads_per_worker=args.threads_per_worker,
+    reload_model=partial(Synthesizer, **synthesizer_args),
 )
 
 use_multi_speaker = hasattr(synthesizer.tts_model, "num_speakers") and (
@@ -185,27 +226,66 @@ def details():
     )
 
 
-lock = Lock()
-
-
 @app.route("/api/tts", methods=["GET", "POST"])
 def tts():
-    with lock:
-        text = request.headers.get("text") or request.values.get("text", "")
-        speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
-        language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
-        style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
-        style_wav = style_wav_uri_to_dict(style_wav)
-
-        print(f" > Model input: {text}")
-        print(f" > Speaker Idx: {speaker_idx}")
-        print(f" > Language Idx: {language_idx}")
-        wavs = synthesizer.tts(text, speaker_name=speaker_idx, language_name=language_idx, style_wav=style_wav)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
+    text = request.headers.get("text") or request.values.get("text", "")
+    speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
+    language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
+    style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
+    style_wav = style_wav_uri_to_dict(style_wav)
+
+    print(f" > Model input: {text}")
+    print(f" > Speaker Idx: {speaker_idx}")
+    print(f" > Language Idx: {language_idx}")
+    wavs = pool.run("tts", text, speaker_name=speaker_idx, language_name=language_idx, style_wav=style_wav)
+    out = io.BytesIO()
+    synthesizer.save_wav(wavs, out)
     return send_file(out, mimetype="audio/wav")
 
 
+@app.route("/api/tts-stream", methods=["GET", "POST"])
+def tts_stream():
+    """Stream the WAV response sentence by sentence with chunked transfer encoding"""
+    text = request.headers.get("text") or request.values.get("text", "")
+    speaker_idx = request.headers.get("speaker-id") or request.values.get("speaker_id", "")
+    language_idx = request.headers.get("language-id") or request.values.get("language_id", "")
+    style_wav = request.headers.get("style-wav") or request.values.get("style_wav", "")
+    style_wav = style_wav_uri_to_dict(style_wav)
+
+    print(f" > Model input (stream): {text}")
+    if not text:
+        return Response("Missing `text`.", status=400)
+
+    def generate():
+        # sentences are queued at once so idle workers render ahead, and are sent in order
+        futures = [
+            pool.submit(
+                "tts",
+                sen,
+                speaker_name=speaker_idx,
+                language_name=language_idx,
+                style_wav=style_wav,
+                split_sentences=False,
+            )
+            for sen in synthesizer.split_into_sentences(text)
+        ]
+        try:
+            yield wav_stream_header(sample_rate=synthesizer.output_sample_rate)
+            for future in futures:
+                yield wav_to_pcm16(wav=future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return Response(stream_with_context(generate()), mimetype="audio/wav")
+
+
+@app.route("/api/workers", methods=["GET"])
+def workers():
+    """Queue depth and per-worker latency of the model worker pool"""
+    return jsonify(pool.stats())
+
+
 # Basic MaryTTS compatibility layer
 
 
@@ -236,17 +316,16 @@ def mary_tts_api_voices():
 @app.route("/process", methods=["GET", "POST"])
 def mary_tts_api_process():
     """MaryTTS-compatible /process endpoint"""
-    with lock:
-        if request.method == "POST":
-            data = parse_qs(request.get_data(as_text=True))
-            # NOTE: we ignore param. LOCALE and VOICE for now since we have only one active model
-            text = data.get("INPUT_TEXT", [""])[0]
-        else:
-            text = request.args.get("INPUT_TEXT", "")
-        print(f" > Model input: {text}")
-        wavs = synthesizer.tts(text)
-        out = io.BytesIO()
-        synthesizer.save_wav(wavs, out)
+    if request.method == "POST":
+        data = parse_qs(request.get_data(as_text=True))
+        # NOTE: we ignore param. LOCALE and VOICE for now since we have only one active model
+        text = data.get("INPUT_TEXT", [""])[0]
+    else:
+        text = request.args.get("INPUT_TEXT", "")
+    print(f" > Model input: {text}")
+    wavs = pool.run("tts", text)
+    out = io.BytesIO()
+    synthesizer.save_wav(wavs, out)
     return send_file(out, mimetype="audio/wav")
 
 
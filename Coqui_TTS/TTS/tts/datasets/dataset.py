@@ -594,6 +594,8 @@ class PhonemeDataset(Dataset):
             Number of workers used for pre-computing the phonemes. Defaults to 0.
     """
 
+    PRECOMPUTE_CHUNK_SIZE = 64
+
     def __init__(
         self,
         samples: Union[List[Dict], List[List]],
@@ -617,13 +619,15 @@ class PhonemeDataset(Dataset):
     def __len__(self):
         return len(self.samples)
 
+    def _phoneme_path(self, file_name):
+        return os.path.join(self.cache_path, file_name + "_phoneme.npy")
+
     def compute_or_load(self, file_name, text, language):
         """Compute phonemes for the given text.
 
         If the phonemes are already cached, load them from cache.
         """
-        file_ext = "_phoneme.npy"
-        cache_path = os.path.join(self.cache_path, file_name + file_ext)
+        cache_path = self._phoneme_path(file_name)
         try:
             ids = np.load(cache_path)
         except FileNotFoundError:
@@ -638,16 +642,34 @@ class PhonemeDataset(Dataset):
     def precompute(self, num_workers=1):
         """Precompute phonemes for all samples.
 
-        We use pytorch dataloader because we are lazy.
+        Samples are phonemized in chunks of `PRECOMPUTE_CHUNK_SIZE`, so each phonemizer call converts many
+        utterances. We use pytorch dataloader to spread the chunks over workers because we are lazy.
         """
         print("[*] Pre-computing phonemes...")
+        chunks = [
+            list(range(start, min(start + self.PRECOMPUTE_CHUNK_SIZE, len(self))))
+            for start in range(0, len(self), self.PRECOMPUTE_CHUNK_SIZE)
+        ]
         with tqdm.tqdm(total=len(self)) as pbar:
-            batch_size = num_workers if num_workers > 0 else 1
             dataloder = torch.utils.data.DataLoader(
-                batch_size=batch_size, dataset=self, shuffle=False, num_workers=num_workers, collate_fn=self.collate_fn
+                batch_size=1, dataset=chunks, shuffle=False, num_workers=num_workers, collate_fn=self._precompute_chunks
             )
-            for _ in dataloder:
-                pbar.update(batch_size)
+            for count in dataloder:
+                pbar.update(count)
+
+    def _precompute_chunks(self, chunks):
+        """Phonemize and cache chunks of samples, one tokenizer batch per language. Returns the sample count."""
+        count = 0
+        for indices in chunks:
+            by_language = collections.defaultdict(list)
+            for index in indices:
+                by_language[self.samples[index]["language"]].append(self.samples[index])
+            for language, items in by_language.items():
+                token_ids = self.tokenizer.texts_to_ids([item["text"] for item in items], language=language)
+                for item, ids in zip(items, token_ids):
+                    np.save(self._phoneme_path(string2filename(item["audio_unique_name"])), ids)
+            count += len(indices)
+        return count
 
     def collate_fn(self, batch):
         ids = [item["token_ids"] for item in batch]
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from TTS.utils.generic_utils import get_user_data_dir
+
+
+def encoder_fingerprint(model_path: str, config_path: str) -> str:
+    """Identify a speaker encoder checkpoint by path, size and modification time of its files.
+
+    Replacing or retraining the checkpoint changes the fingerprint, so embeddings computed by an older encoder are
+    never served for the new one.
+
+    Args:
+        model_path (str): encoder checkpoint path.
+        config_path (str): encoder config path.
+
+    Returns:
+        str: hex digest identifying the encoder.
+    """
+    digest = hashlib.sha256()
+    for path in (model_path, config_path):
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+class EmbeddingCache:
+    """Content addressed cache of speaker embeddings computed from reference clips.
+
+    Embeddings are keyed by the SHA-256 of the clip bytes and stored per encoder fingerprint, in an in-memory LRU
+    backed by `.npy` files under `cache_dir/<fingerprint>/`. File digests are memoized by path, size and
+    modification time, so a clip that is reused thousands of times is read once.
+
+    Args:
+        cache_dir (str, optional): on-disk store. Defaults to `$TTS_EMBEDDING_CACHE_DIR` or the 🐸TTS user data dir.
+        max_entries (int, optional): embeddings kept in memory. Defaults to 256.
+    """
+
+    def __init__(self, cache_dir: str = None, max_entries: int = 256):
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                "TTS_EMBEDDING_CACHE_DIR", os.path.join(get_user_data_dir("tts"), "speaker_embeddings")
+            )
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._file_digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def clip_key(self, wav_file: Union[str, List[str]]) -> str:
+        """Content hash of a clip, or of a set of clips averaged into one embedding."""
+        if isinstance(wav_file, list):
+            digests = sorted(self._file_digest(wf) for wf in wav_file)
+            return hashlib.sha256("".join(digests).encode()).hexdigest()
+        return self._file_digest(wav_file)
+
+    def _file_digest(self, path: str) -> str:
+        stat = os.stat(path)
+        stat_key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_digests.get(stat_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._file_digests[stat_key] = digest
+        return digest
+
+    def _path(self, fingerprint: str, key: str) -> str:
+        return os.path.join(self.cache_dir, fingerprint, f"{key}.npy")
+
+    def get(self, fingerprint: str, key: str) -> Optional[np.ndarray]:
+        """Cached embedding, from memory or disk, or None."""
+        with self._lock:
+            embedding = self._memory.get((fingerprint, key))
+            if embedding is not None:
+                self._memory.move_to_end((fingerprint, key))
+                return embedding
+
+        path = self._path(fingerprint, key)
+        if not os.path.exists(path):
+            return None
+        try:
+            embedding = np.load(path)
+        except (OSError, ValueError):
+            return None
+        self._remember(fingerprint, key, embedding)
+        return embedding
+
+    def put(self, fingerprint: str, key: str, embedding) -> np.ndarray:
+        """Store an embedding in memory and on disk. Raises `OSError` if the disk store is not writable."""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        self._remember(fingerprint, key, embedding)
+
+        path = self._path(fingerprint, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return embedding
+
+    def _remember(self, fingerprint: str, key: str, embedding: np.ndarray) -> None:
+        with self._lock:
+            self._memory[(fingerprint, key)] = embedding
+            self._memory.move_to_end((fingerprint, key))
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def prune(self, keep_fingerprints: List[str]) -> int:
+        """Delete on-disk entries of encoders not in `keep_fingerprints`. Returns the number of removed stores."""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name not in keep_fingerprints and os.path.isdir(os.path.join(self.cache_dir, name)):
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+                removed += 1
+        with self._lock:
+            for memory_key in [k for k in self._memory if k[0] not in keep_fingerprints]:
+                del self._memory[memory_key]
+        return removed
+
+
+_default_cache = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide embedding cache shared by `Synthesizer`, `api.TTS` and the speaker managers."""
+    global _default_cache  # pylint: disable=global-statement
+    if _default_cache is None:
+        _default_cache = EmbeddingCache()
+    return _default_cache
@@ -1,4 +1,5 @@
 import json
+import logging
 import random
 from typing import Any, Dict, List, Tuple, Union
 
@@ -8,8 +9,11 @@ import torch
 
 from TTS.config import load_config
 from TTS.encoder.utils.generic_utils import setup_encoder_model
+from TTS.tts.utils.embedding_cache import encoder_fingerprint, get_embedding_cache
 from TTS.utils.audio import AudioProcessor
 
+logger = logging.getLogger(__name__)
+
 
 def load_file(path: str):
     if path.endswith(".json"):
@@ -142,6 +146,8 @@ class EmbeddingManager(BaseIDManager):
         self.clip_ids = []
         self.encoder = None
         self.encoder_ap = None
+        self.encoder_fingerprint = None
+        self.embedding_cache = get_embedding_cache()
         self.use_cuda = use_cuda
 
         if embedding_file_path:
@@ -327,16 +333,27 @@ class EmbeddingManager(BaseIDManager):
             self.encoder_config, model_path, eval=True, use_cuda=use_cuda, cache=True
         )
         self.encoder_ap = AudioProcessor(**self.encoder_config.audio)
+        try:
+            self.encoder_fingerprint = encoder_fingerprint(model_path, config_path)
+        except OSError:
+            # remote checkpoints cannot be fingerprinted, embeddings are then always recomputed
+            self.encoder_fingerprint = None
 
     def compute_embedding_from_clip(self, wav_file: Union[str, List[str]]) -> list:
         """Compute a embedding from a given audio file.
 
+        Embeddings are looked up in `embedding_cache` by clip content and encoder fingerprint first, so repeated
+        calls with the same clip skip the encoder.
+
         Args:
             wav_file (Union[str, List[str]]): Target file path.
 
         Returns:
             list: Computed embedding.
         """
+        cache_key, cached = self._cached_embedding(wav_file)
+        if cached is not None:
+            return cached
 
         def _compute(wav_file: str):
             waveform = self.encoder_ap.load_wav(wav_file, sr=self.encoder_ap.sample_rate)
@@ -361,9 +378,33 @@ class EmbeddingManager(BaseIDManager):
                     embeddings = embedding
                 else:
                     embeddings += embedding
-            return (embeddings / len(wav_file))[0].tolist()
-        embedding = _compute(wav_file)
-        return embedding[0].tolist()
+            embedding = (embeddings / len(wav_file))[0].tolist()
+        else:
+            embedding = _compute(wav_file)[0].tolist()
+
+        self._cache_embedding(cache_key, embedding)
+        return embedding
+
+    def _cached_embedding(self, wav_file: Union[str, List[str]]) -> Tuple[str, list]:
+        """Look up the embedding of a clip in `embedding_cache`.
+
+        Returns:
+            Tuple[str, list]: cache key, or None when caching is off, and the cached embedding or None.
+        """
+        if self.embedding_cache is None or self.encoder_fingerprint is None:
+            return None, None
+        cache_key = self.embedding_cache.clip_key(wav_file)
+        cached = self.embedding_cache.get(self.encoder_fingerprint, cache_key)
+        return cache_key, cached.tolist() if cached is not None else None
+
+    def _cache_embedding(self, cache_key: str, embedding: list) -> None:
+        """Store a computed embedding, logging instead of failing if the cache is not writable."""
+        if cache_key is None:
+            return
+        try:
+            self.embedding_cache.put(self.encoder_fingerprint, cache_key, embedding)
+        except OSError as e:
+            logger.warning("Could not write speaker embedding cache at %s: %s", self.embedding_cache.cache_dir, e)
 
     def compute_embeddings(self, feats: Union[torch.Tensor, np.ndarray]) -> List:
         """Compute embedding from features.
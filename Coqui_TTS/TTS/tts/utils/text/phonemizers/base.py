@@ -90,6 +90,13 @@ class BasePhonemizer(abc.ABC):
     def _phonemize(self, text, separator):
         """The main phonemization method"""
 
+    def _phonemize_batch(self, texts: List[str], separator) -> List[str]:
+        """Phonemize several preprocessed segments
+
+        Override this if the backend can convert many segments in one call
+        """
+        return [self._phonemize(t, separator) for t in texts]
+
     def _phonemize_preprocess(self, text) -> Tuple[List[str], List]:
         """Preprocess the text before phonemization
 
@@ -127,13 +134,32 @@ class BasePhonemizer(abc.ABC):
             (str): Phonemized text
         """
         text, punctuations = self._phonemize_preprocess(text)
-        phonemized = []
-        for t in text:
-            p = self._phonemize(t, separator)
-            phonemized.append(p)
+        phonemized = self._phonemize_batch(text, separator)
         phonemized = self._phonemize_postprocess(phonemized, punctuations)
         return phonemized
 
+    def phonemize_batch(self, texts: List[str], separator="|", language: str = None) -> List[str]:
+        """Returns each of `texts` phonemized, converting the segments of all texts in one backend call
+
+        Args:
+            texts (List[str]):
+                Texts to be phonemized.
+
+            separator (str):
+                string separator used between phonemes. Default to '|'.
+
+        Returns:
+            (List[str]): Phonemized texts, in input order
+        """
+        if type(self).phonemize is not BasePhonemizer.phonemize:
+            # the subclass has its own phonemization pipeline
+            return [self.phonemize(text, separator, language=language) for text in texts]
+
+        prepared = [self._phonemize_preprocess(text) for text in texts]
+        segments = [segment for parts, _ in prepared for segment in parts]
+        phonemized = iter(self._phonemize_batch(segments, separator))
+        return [self._phonemize_postprocess([next(phonemized) for _ in parts], puncs) for parts, puncs in prepared]
+
     def print_logs(self, level: int = 0):
         indent = "\t" * level
         print(f"{indent}| > phoneme language: {self.language}")
@@ -1,7 +1,12 @@
+import ctypes
+import ctypes.util
 import logging
+import os
 import re
 import subprocess
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from packaging.version import Version
 
@@ -80,9 +85,133 @@ def _espeak_exe(espeak_lib: str, args: List, sync=False) -> List[str]:
     return res2
 
 
+class ESpeakLibrary:
+    """In-process binding to `libespeak-ng` through `espeak_TextToPhonemes`.
+
+    The library is initialized once per process, so phonemizing costs a function call instead of an `espeak-ng`
+    process spawn. eSpeak keeps global state, so calls are serialized and the voice is only switched when the
+    language changes.
+
+    Args:
+        library_path (str): path to the shared library.
+    """
+
+    AUDIO_OUTPUT_SYNCHRONOUS = 0x02  # never opens an audio device
+    INITIALIZE_DONT_EXIT = 0x8000
+    CHARS_UTF8 = 1
+    PHONEMES_IPA = 0x02
+
+    def __init__(self, library_path: str):
+        self._lib = ctypes.cdll.LoadLibrary(library_path)
+        self._lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        self._lib.espeak_Initialize.restype = ctypes.c_int
+        self._lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        self._lib.espeak_SetVoiceByName.restype = ctypes.c_int
+        self._lib.espeak_TextToPhonemes.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_int, ctypes.c_int]
+        self._lib.espeak_TextToPhonemes.restype = ctypes.c_char_p
+
+        if self._lib.espeak_Initialize(self.AUDIO_OUTPUT_SYNCHRONOUS, 0, None, self.INITIALIZE_DONT_EXIT) <= 0:
+            raise OSError(f"espeak_Initialize failed for {library_path}")
+        self._voice = None
+        self._lock = threading.Lock()
+
+    def text_to_phonemes(self, texts: List[str], voice: str, separator: str = "_") -> List[str]:
+        """Convert several utterances to IPA phonemes in one call.
+
+        Args:
+            texts (List[str]): utterances to convert.
+            voice (str): eSpeak voice name, e.g. `en-us`.
+            separator (str): character placed between phonemes of a word. Defaults to "_".
+
+        Returns:
+            List[str]: phonemes per utterance, clauses joined by a space.
+        """
+        phoneme_mode = self.PHONEMES_IPA | (ord(separator) << 8)
+        results = []
+        with self._lock:
+            if voice != self._voice:
+                self._voice = None
+                if self._lib.espeak_SetVoiceByName(voice.encode("utf8")) != 0:
+                    raise ValueError(f"espeak voice not found: {voice}")
+                self._voice = voice
+
+            for text in texts:
+                buffer = ctypes.create_string_buffer(text.encode("utf8"))
+                text_ptr = ctypes.c_void_p(ctypes.addressof(buffer))
+                clauses = []
+                # each call converts one clause and advances text_ptr, which is NULL at the end of the text
+                while text_ptr.value is not None:
+                    phonemes = self._lib.espeak_TextToPhonemes(ctypes.byref(text_ptr), self.CHARS_UTF8, phoneme_mode)
+                    if phonemes:
+                        clauses.append(phonemes.decode("utf8"))
+                results.append(" ".join(clauses))
+        return results
+
+
+_espeak_library = None
+_espeak_library_lock = threading.Lock()
+
+
+def get_espeak_library() -> Optional[ESpeakLibrary]:
+    """Shared `ESpeakLibrary`, or None if `libespeak-ng` cannot be loaded.
+
+    The library is looked up from `$TTS_ESPEAK_LIBRARY`, then on the system library path.
+    """
+    global _espeak_library  # pylint: disable=global-statement
+    with _espeak_library_lock:
+        if _espeak_library is None:
+            library_path = os.environ.get("TTS_ESPEAK_LIBRARY") or ctypes.util.find_library("espeak-ng")
+            try:
+                if library_path is None:
+                    raise OSError("libespeak-ng not found")
+                _espeak_library = ESpeakLibrary(library_path)
+            except (OSError, AttributeError) as e:
+                logging.debug("espeak library unavailable, using the espeak executable: %s", e)
+                _espeak_library = False
+        return _espeak_library or None
+
+
+class PhonemeCache:
+    """Bounded LRU of phonemized text keyed by (backend, language, tie, text).
+
+    Args:
+        max_entries (int): entries kept before the least recently used are dropped.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            phonemes = self._entries.get(key)
+            if phonemes is not None:
+                self._entries.move_to_end(key)
+            return phonemes
+
+    def put(self, key: Tuple, phonemes: str) -> None:
+        with self._lock:
+            self._entries[key] = phonemes
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+phoneme_cache = PhonemeCache(int(os.environ.get("TTS_PHONEME_CACHE_SIZE", 100000)))
+
+
 class ESpeak(BasePhonemizer):
     """ESpeak wrapper calling `espeak` or `espeak-ng` from the command-line the perform G2P
 
+    With `espeak-ng`, phonemes are computed in-process through `libespeak-ng` when it can be loaded (see
+    `get_espeak_library()`), and results are kept in the shared `phoneme_cache`, so repeated text never reaches
+    espeak twice.
+
     Args:
         language (str):
             Valid language code for the used backend.
@@ -164,6 +293,45 @@ class ESpeak(BasePhonemizer):
                 consecutive characters of a single phoneme. Else separate phoneme
                 with '_'. This option requires espeak>=1.49. Default to False.
         """
+        return self.phonemize_espeak_batch([text], separator, tie=tie)[0]
+
+    def phonemize_espeak_batch(self, texts: List[str], separator: str = "|", tie=False) -> List[str]:
+        """Convert several texts to phonemes, converting only those not in the phoneme cache.
+
+        Args:
+            texts (List[str]):
+                Texts to be converted to phonemes.
+
+            tie (bool, optional) : See `phonemize_espeak()`. Default to False.
+        """
+        keys = [(self.backend, self._language, tie, text) for text in texts]
+        phonemes = [phoneme_cache.get(key) for key in keys]
+
+        missing = list(dict.fromkeys(text for text, ph in zip(texts, phonemes) if ph is None))
+        if missing:
+            computed = dict(zip(missing, self._espeak_phonemes(missing, tie)))
+            for idx, key in enumerate(keys):
+                if phonemes[idx] is None:
+                    phonemes[idx] = computed[key[-1]]
+                    phoneme_cache.put(key, phonemes[idx])
+
+        return [ph.replace("_", separator) for ph in phonemes]
+
+    def _espeak_phonemes(self, texts: List[str], tie=False) -> List[str]:
+        """Phonemes separated by '_' for each text, from libespeak-ng if loaded else the executable."""
+        library = get_espeak_library() if self.backend == "espeak-ng" and not tie else None
+        if library is not None:
+            try:
+                # remove the language flags as in `_espeak_exe_phonemes()`
+                return [
+                    re.sub(r"\(.+?\)", "", ph).strip() for ph in library.text_to_phonemes(texts, self._language)
+                ]
+            except ValueError as e:
+                logging.debug("%s, using the espeak executable", e)
+        return [self._espeak_exe_phonemes(text, tie) for text in texts]
+
+    def _espeak_exe_phonemes(self, text: str, tie=False) -> str:
+        """Run the espeak executable on a single text."""
         # set arguments
         args = ["-v", f"{self._language}"]
         # espeak and espeak-ng parses `ipa` differently
@@ -203,11 +371,14 @@ class ESpeak(BasePhonemizer):
             ph_decoded = re.sub(r"\(.+?\)", "", ph_decoded)
 
             phonemes += ph_decoded.strip()
-        return phonemes.replace("_", separator)
+        return phonemes
 
     def _phonemize(self, text, separator=None):
         return self.phonemize_espeak(text, separator, tie=False)
 
+    def _phonemize_batch(self, texts, separator=None):
+        return self.phonemize_espeak_batch(texts, separator, tie=False)
+
     @staticmethod
     def supported_languages() -> Dict:
         """Get a dictionary of supported languages.
@@ -41,6 +41,11 @@ class MultiPhonemizer:
             raise ValueError("Language must be set for multi-phonemizer to phonemize.")
         return self.lang_to_phonemizer[language].phonemize(text, separator)
 
+    def phonemize_batch(self, texts, separator="|", language=""):
+        if language == "":
+            raise ValueError("Language must be set for multi-phonemizer to phonemize.")
+        return self.lang_to_phonemizer[language].phonemize_batch(texts, separator)
+
     def supported_languages(self) -> List:
         return list(self.lang_to_phonemizer.keys())
 
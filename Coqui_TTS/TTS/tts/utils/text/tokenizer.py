@@ -108,6 +108,24 @@ class TTSTokenizer:
             text = self.text_cleaner(text)
         if self.use_phonemes:
             text = self.phonemizer.phonemize(text, separator="", language=language)
+        return self._encode_with_specials(text)
+
+    def texts_to_ids(self, texts: List[str], language: str = None) -> List[List[int]]:
+        """Converts several texts of the same language to token IDs, phonemizing them in one batch.
+
+        Same output as calling `text_to_ids()` on each text.
+        """
+        if self.text_cleaner is not None:
+            texts = [self.text_cleaner(text) for text in texts]
+        if self.use_phonemes:
+            phonemize_batch = getattr(self.phonemizer, "phonemize_batch", None)
+            if phonemize_batch is not None:
+                texts = phonemize_batch(texts, separator="", language=language)
+            else:
+                texts = [self.phonemizer.phonemize(text, separator="", language=language) for text in texts]
+        return [self._encode_with_specials(text) for text in texts]
+
+    def _encode_with_specials(self, text: str) -> List[int]:
         text = self.encode(text)
         if self.add_blank:
             text = self.intersperse_blank_char(text, True)
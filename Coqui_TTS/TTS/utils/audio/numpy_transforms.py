@@ -1,3 +1,4 @@
+import struct
 from io import BytesIO
 from typing import Tuple
 
@@ -447,6 +448,35 @@ def save_wav(*, wav: np.ndarray, path: str, sample_rate: int = None, pipe_out=No
     scipy.io.wavfile.write(path, sample_rate, wav_norm)
 
 
+def wav_stream_header(*, sample_rate: int, num_channels: int = 1, **kwargs) -> bytes:
+    """Header of a 16-bit PCM WAV stream whose length is not known in advance.
+
+    The RIFF and data chunk sizes are set to their maximum, which players read as "until the end of the stream".
+
+    Args:
+        sample_rate (int): Sampling rate of the stream.
+        num_channels (int, optional): Number of interleaved channels. Defaults to 1.
+    """
+    block_align = num_channels * 2
+    return (
+        b"RIFF"
+        + struct.pack("<I", 0xFFFFFFFF)
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 1, num_channels, sample_rate, sample_rate * block_align, block_align, 16)
+        + b"data"
+        + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+def wav_to_pcm16(*, wav: np.ndarray, **kwargs) -> bytes:
+    """Encode a float waveform as little-endian 16-bit PCM samples for a WAV stream.
+
+    Unlike `save_wav`, the waveform is not peak normalized, since later chunks of a stream are unknown. Values out of
+    [-1, 1] are clipped.
+    """
+    return (np.clip(wav, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
 def mulaw_encode(*, wav: np.ndarray, mulaw_qc: int, **kwargs) -> np.ndarray:
     mu = 2**mulaw_qc - 1
     signal = np.sign(wav) * np.log(1 + mu * np.abs(wav)) / np.log(1.0 + mu)
@@ -1,11 +1,13 @@
 import os
 import time
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
 import pysbd
 import torch
 from torch import nn
+from torch.nn import functional as F
+from torch.nn.utils import parametrize
 
 from TTS.config import load_config
 from TTS.tts.configs.vits_config import VitsConfig
@@ -14,11 +16,12 @@ from TTS.tts.models.vits import Vits
 
 # pylint: disable=unused-wildcard-import
 # pylint: disable=wildcard-import
-from TTS.tts.utils.synthesis import synthesis, transfer_voice, trim_silence
+from TTS.tts.utils.synthesis import embedding_to_torch, synthesis, transfer_voice, trim_silence
 from TTS.utils.audio import AudioProcessor
-from TTS.utils.audio.numpy_transforms import save_wav
+from TTS.utils.audio.numpy_transforms import save_wav, wav_stream_header, wav_to_pcm16
 from TTS.vc.models import setup_model as setup_vc_model
 from TTS.vocoder.models import setup_model as setup_vocoder_model
+from TTS.vocoder.models.gan import GAN
 from TTS.vocoder.utils.generic_utils import interpolate_vocoder_input
 
 
@@ -38,6 +41,7 @@ class Synthesizer(nn.Module):
         model_dir: str = "",
         voice_dir: str = None,
         use_cuda: bool = False,
+        quantize: bool = False,
     ) -> None:
         """General 🐸 TTS interface for inference. It takes a tts and a vocoder
         model and synthesize speech from the provided text.
@@ -60,6 +64,9 @@ class Synthesizer(nn.Module):
             vc_checkpoint (str, optional): path to the voice conversion model file. Defaults to `""`,
             vc_config (str, optional): path to the voice conversion config file. Defaults to `""`,
             use_cuda (bool, optional): enable/disable cuda. Defaults to False.
+            quantize (bool, optional): run the models in int8 on CPU. Weight norm is folded into the weights and
+                linear and recurrent layers are dynamically quantized. GAN vocoders are cached as a TorchScript
+                generator next to their checkpoint. Defaults to False.
         """
         super().__init__()
         self.tts_checkpoint = tts_checkpoint
@@ -85,9 +92,12 @@ class Synthesizer(nn.Module):
         self.d_vector_dim = 0
         self.seg = self._get_segmenter("en")
         self.use_cuda = use_cuda
+        self.quantize = quantize
         self.voice_dir = voice_dir
         if self.use_cuda:
             assert torch.cuda.is_available(), "CUDA is not availabe on this machine."
+            if self.quantize:
+                raise ValueError(" [!] Quantized inference runs on CPU only, `quantize` requires `use_cuda=False`.")
 
         if tts_checkpoint:
             self._load_tts(tts_checkpoint, tts_config_path, use_cuda)
@@ -162,6 +172,8 @@ class Synthesizer(nn.Module):
         self.tts_config = config
         self.tts_model = setup_tts_model(config)
         self.tts_model.load_checkpoint(config, checkpoint_dir=model_dir, eval=True)
+        if self.quantize:
+            self._quantize_model(self.tts_model)
         if use_cuda:
             self.tts_model.cuda()
 
@@ -190,6 +202,8 @@ class Synthesizer(nn.Module):
             self._set_speaker_encoder_paths_from_tts_config()
 
         self.tts_model.load_checkpoint(self.tts_config, tts_checkpoint, eval=True)
+        if self.quantize:
+            self._quantize_model(self.tts_model)
         if use_cuda:
             self.tts_model.cuda()
 
@@ -210,7 +224,8 @@ class Synthesizer(nn.Module):
         1. Load the vocoder config.
         2. Init the AudioProcessor for the vocoder.
         3. Init the vocoder model from the config.
-        4. Move the model to the GPU if CUDA is enabled.
+        4. Load the model weights, or the cached int8 generator in quantized mode.
+        5. Move the model to the GPU if CUDA is enabled.
 
         Args:
             model_file (str): path to the model checkpoint.
@@ -220,10 +235,76 @@ class Synthesizer(nn.Module):
         self.vocoder_config = load_config(model_config)
         self.vocoder_ap = AudioProcessor(verbose=False, **self.vocoder_config.audio)
         self.vocoder_model = setup_vocoder_model(self.vocoder_config)
-        self.vocoder_model.load_checkpoint(self.vocoder_config, model_file, eval=True)
+        if self.quantize and isinstance(self.vocoder_model, GAN):
+            self._load_quantized_generator(model_file)
+        else:
+            self.vocoder_model.load_checkpoint(self.vocoder_config, model_file, eval=True)
+            if self.quantize:
+                self._quantize_model(self.vocoder_model)
         if use_cuda:
             self.vocoder_model.cuda()
 
+    @staticmethod
+    def _quantize_model(model: nn.Module) -> nn.Module:
+        """Prepare a loaded model for int8 inference on CPU.
+
+        Weight norm parametrizations are folded into plain weights, which is exact and saves recomputing the weights on
+        every call. Linear, LSTM and GRU layers are then dynamically quantized to int8. Convolutions
+        stay in fp32 since torch has no fast dynamic int8 kernel for them.
+
+        Args:
+            model (nn.Module): model loaded for inference.
+
+        Returns:
+            nn.Module: the same model, converted in place.
+        """
+        for module in list(model.modules()):
+            if parametrize.is_parametrized(module):
+                for name in list(module.parametrizations):
+                    parametrize.remove_parametrizations(module, name)
+        return torch.ao.quantization.quantize_dynamic(
+            model, {nn.Linear, nn.LSTM, nn.LSTMCell, nn.GRU, nn.GRUCell}, dtype=torch.qint8, inplace=True
+        )
+
+    def _load_quantized_generator(self, model_file: str) -> None:
+        """Load the quantized generator of a GAN vocoder, caching it as TorchScript next to the checkpoint.
+
+        The cache is tagged with the size and modification time of `model_file` and rebuilt when the checkpoint
+        changes. A cache hit skips loading the fp32 checkpoint, which also holds the discriminator. Generators whose
+        traced graph does not match the eager model on a second input length are used eagerly and not cached.
+
+        Args:
+            model_file (str): path to the vocoder checkpoint.
+        """
+        cache_path = os.path.splitext(model_file)[0] + "_int8.pt"
+        source = f"{os.path.getsize(model_file)}:{os.path.getmtime(model_file)}"
+        self.vocoder_model.model_d = None
+        self.vocoder_model.eval()
+
+        if os.path.isfile(cache_path):
+            extra_files = {"source": ""}
+            generator = torch.jit.load(cache_path, map_location="cpu", _extra_files=extra_files)
+            if extra_files["source"].decode() == source:
+                print(f" > Using quantized vocoder {cache_path}")
+                self.vocoder_model.model_g = generator
+                return
+
+        self.vocoder_model.load_checkpoint(self.vocoder_config, model_file, eval=True)
+        generator = self._quantize_model(self.vocoder_model.model_g)
+        num_mels = self.vocoder_config.audio["num_mels"]
+        with torch.no_grad():
+            traced = torch.jit.trace_module(generator, {"inference": torch.randn(1, num_mels, 32)}, check_trace=False)
+            check_input = torch.randn(1, num_mels, 45)
+            if not torch.allclose(traced.inference(check_input), generator.inference(check_input), atol=1e-5):
+                print(" > The traced vocoder does not match the model, running it without TorchScript.")
+                return
+        try:
+            torch.jit.save(traced, cache_path, _extra_files={"source": source})
+            print(f" > Cached quantized vocoder at {cache_path}")
+        except OSError as e:
+            print(f" > Could not cache the quantized vocoder: {e}")
+        self.vocoder_model.model_g = traced
+
     def split_into_sentences(self, text) -> List[str]:
         """Split give text into sentences.
 
@@ -235,11 +316,11 @@ class Synthesizer(nn.Module):
         """
         return self.seg.segment(text)
 
-    def save_wav(self, wav: List[int], path: str, pipe_out=None) -> None:
+    def save_wav(self, wav: np.ndarray, path: str, pipe_out=None) -> None:
         """Save the waveform as a file.
 
         Args:
-            wav (List[int]): waveform as a list of values.
+            wav (np.ndarray): waveform as returned by `tts()`. Tensors and lists of values are converted.
             path (str): output path to save the waveform.
             pipe_out (BytesIO, optional): Flag to stdout the generated TTS wav file for shell pipe.
         """
@@ -254,50 +335,210 @@ class Synthesizer(nn.Module):
         output_wav = self.vc_model.voice_conversion(source_wav, target_wav)
         return output_wav
 
-    def tts(
+    def _to_vocoder_input(self, model_outputs: torch.Tensor) -> torch.Tensor:
+        """Convert a TTS model spectrogram into vocoder input.
+
+        Args:
+            model_outputs (torch.Tensor): spectrogram of shape `[T, C]`.
+
+        Returns:
+            torch.Tensor: vocoder input of shape `[1, C, T]`.
+        """
+        mel_postnet_spec = model_outputs.detach().cpu().numpy()
+        # denormalize tts output based on tts audio config
+        mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
+        # renormalize spectrogram based on vocoder config
+        vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
+        # compute scale factor for possible sample rate mismatch
+        scale_factor = [
+            1,
+            self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
+        ]
+        if scale_factor[1] != 1:
+            print(" > interpolating tts model output.")
+            vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
+        else:
+            vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
+        return vocoder_input
+
+    @staticmethod
+    def _length_buckets(lengths: List[int], batch_size: int) -> List[List[int]]:
+        """Group item indices into batches of similar length to minimize padding.
+
+        Args:
+            lengths (List[int]): length of each item.
+            batch_size (int): maximum number of items per batch.
+
+        Returns:
+            List[List[int]]: indices of the items in each batch, longest batch first.
+        """
+        order = sorted(range(len(lengths)), key=lambda idx: lengths[idx], reverse=True)
+        return [order[start : start + batch_size] for start in range(0, len(order), batch_size)]
+
+    @staticmethod
+    def _assemble_wavs(waveforms: List[np.ndarray], silence: int) -> np.ndarray:
+        """Copy sentence waveforms into one preallocated buffer, each followed by `silence` zero samples.
+
+        Args:
+            waveforms (List[np.ndarray]): sentence waveforms in output order.
+            silence (int): number of silent samples inserted after each sentence.
+
+        Returns:
+            np.ndarray: float32 waveform.
+        """
+        wav = np.zeros(sum(len(waveform) for waveform in waveforms) + silence * len(waveforms), dtype=np.float32)
+        offset = 0
+        for waveform in waveforms:
+            wav[offset : offset + len(waveform)] = waveform
+            offset += len(waveform) + silence
+        return wav
+
+    def _can_batch(self, use_gl: bool) -> bool:
+        """Whether `tts()` can run sentences in batches with the loaded models.
+
+        End-to-end VITS models batch the whole text-to-waveform pass. Two-stage models batch the vocoder pass.
+        Models with their own `synthesize()` (XTTS, Bark, Tortoise) and Griffin-Lim output are run per sentence.
+        """
+        if hasattr(self.tts_model, "synthesize"):
+            return False
+        if isinstance(self.tts_model, Vits):
+            return use_gl
+        return not use_gl
+
+    def _batch_vits_inference(
         self,
-        text: str = "",
-        speaker_name: str = "",
-        language_name: str = "",
-        speaker_wav=None,
+        sens: List[str],
+        batch_size: int,
+        speaker_id=None,
+        speaker_embedding=None,
+        language_id=None,
+    ) -> List[np.ndarray]:
+        """Run a VITS model on length-bucketed batches of sentences.
+
+        Token sequences are zero padded and masked by `x_lengths`; each waveform is cut back to its own decoder
+        length.
+
+        Returns:
+            List[np.ndarray]: one waveform per sentence, in input order.
+        """
+        device = next(self.tts_model.parameters()).device
+        language_name = None
+        if language_id is not None:
+            language_name = [k for k, v in self.tts_model.language_manager.name_to_id.items() if v == language_id][0]
+
+        token_ids = self.tts_model.tokenizer.texts_to_ids(sens, language=language_name)
+        lengths = [len(ids) for ids in token_ids]
+        waveforms = [None] * len(sens)
+
+        for batch in self._length_buckets(lengths, batch_size):
+            inputs = torch.zeros(len(batch), lengths[batch[0]], dtype=torch.long)
+            for row, idx in enumerate(batch):
+                inputs[row, : lengths[idx]] = torch.as_tensor(token_ids[idx], dtype=torch.long)
+
+            aux_input = {
+                "x_lengths": torch.tensor([lengths[idx] for idx in batch], device=device),
+                "speaker_ids": None,
+                "d_vectors": None,
+                "language_ids": None,
+            }
+            if speaker_id is not None:
+                aux_input["speaker_ids"] = torch.full((len(batch),), speaker_id, dtype=torch.long, device=device)
+            if speaker_embedding is not None:
+                aux_input["d_vectors"] = embedding_to_torch(speaker_embedding, device=device).expand(len(batch), -1)
+            if language_id is not None:
+                aux_input["language_ids"] = torch.full((len(batch),), language_id, dtype=torch.long, device=device)
+
+            outputs = self.tts_model.inference(inputs.to(device), aux_input=aux_input)
+            wavs = outputs["model_outputs"].cpu().numpy()  # [B, 1, T_wav]
+            frames = outputs["y_mask"].sum(dim=(1, 2)).long().tolist()
+            samples_per_frame = wavs.shape[-1] // outputs["y_mask"].shape[-1]
+            for row, idx in enumerate(batch):
+                waveforms[idx] = wavs[row, 0, : frames[row] * samples_per_frame]
+        return waveforms
+
+    def _batch_vocoder_inference(
+        self, vocoder_inputs: List[torch.Tensor], batch_size: int, vocoder_device
+    ) -> List[np.ndarray]:
+        """Run the vocoder on length-bucketed batches of spectrograms.
+
+        Shorter spectrograms are padded by repeating their last frame, which is how the GAN generators pad at
+        inference, and each output is trimmed by `hop_length` samples per padded frame. Vocoders other than GAN
+        generators are run one spectrogram at a time.
+
+        Args:
+            vocoder_inputs (List[torch.Tensor]): spectrograms of shape `[1, C, T]`.
+            batch_size (int): maximum number of spectrograms per vocoder call.
+            vocoder_device: device the vocoder runs on.
+
+        Returns:
+            List[np.ndarray]: one waveform per spectrogram, in input order.
+        """
+        if not isinstance(self.vocoder_model, GAN):
+            batch_size = 1
+
+        hop_length = self.vocoder_ap.hop_length
+        lengths = [vocoder_input.shape[-1] for vocoder_input in vocoder_inputs]
+        waveforms = [None] * len(vocoder_inputs)
+
+        for batch in self._length_buckets(lengths, batch_size):
+            max_length = lengths[batch[0]]
+            padded = torch.cat(
+                [F.pad(vocoder_inputs[idx], (0, max_length - lengths[idx]), mode="replicate") for idx in batch]
+            )
+            with torch.no_grad():
+                outputs = self.vocoder_model.inference(padded.to(vocoder_device))
+            if torch.is_tensor(outputs):
+                outputs = outputs.cpu().numpy()
+            outputs = outputs.reshape(len(batch), -1)
+            for row, idx in enumerate(batch):
+                waveforms[idx] = outputs[row, : outputs.shape[-1] - (max_length - lengths[idx]) * hop_length]
+        return waveforms
+
+    def _batch_tts(
+        self,
+        sens: List[str],
+        batch_size: int,
+        use_gl: bool,
+        vocoder_device,
+        speaker_id=None,
+        speaker_embedding=None,
+        language_id=None,
         style_wav=None,
         style_text=None,
-        reference_wav=None,
-        reference_speaker_name=None,
-        split_sentences: bool = True,
-        **kwargs,
-    ) -> List[int]:
-        """🐸 TTS magic. Run all the models and generate speech.
+    ) -> List[np.ndarray]:
+        """Synthesize sentences in batches. See `_can_batch()` for the supported models.
 
-        Args:
-            text (str): input text.
-            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
-            language_name (str, optional): language id for multi-language models. Defaults to "".
-            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
-            style_wav ([type], optional): style waveform for GST. Defaults to None.
-            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
-            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
-            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
-            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
-            **kwargs: additional arguments to pass to the TTS model.
         Returns:
-            List[int]: [description]
+            List[np.ndarray]: one waveform per sentence, in input order.
         """
-        start_time = time.time()
-        wavs = []
+        if use_gl:
+            return self._batch_vits_inference(
+                sens, batch_size, speaker_id=speaker_id, speaker_embedding=speaker_embedding, language_id=language_id
+            )
 
-        if not text and not reference_wav:
-            raise ValueError(
-                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
+        vocoder_inputs = []
+        for sen in sens:
+            outputs = synthesis(
+                model=self.tts_model,
+                text=sen,
+                CONFIG=self.tts_config,
+                use_cuda=self.use_cuda,
+                speaker_id=speaker_id,
+                style_wav=style_wav,
+                style_text=style_text,
+                use_griffin_lim=use_gl,
+                d_vector=speaker_embedding,
+                language_id=language_id,
             )
+            vocoder_inputs.append(self._to_vocoder_input(outputs["outputs"]["model_outputs"][0]))
+        return self._batch_vocoder_inference(vocoder_inputs, batch_size, vocoder_device)
 
-        if text:
-            sens = [text]
-            if split_sentences:
-                print(" > Text splitted to sentences.")
-                sens = self.split_into_sentences(text)
-            print(sens)
+    def _resolve_speaker_and_language(self, speaker_name: str, language_name: str, speaker_wav, kwargs: dict) -> Tuple:
+        """Resolve the speaker and language arguments of `tts()` into model inputs.
 
+        Returns:
+            Tuple: speaker id, speaker embedding and language id, None where unused.
+        """
         # handle multi-speaker
         if "voice_dir" in kwargs:
             self.voice_dir = kwargs["voice_dir"]
@@ -372,73 +613,170 @@ class Synthesizer(nn.Module):
             and self.tts_model.speaker_manager.encoder_ap is not None
         ):
             speaker_embedding = self.tts_model.speaker_manager.compute_embedding_from_clip(speaker_wav)
+        return speaker_id, speaker_embedding, language_id
 
+    def _vocoder_device(self) -> Tuple:
+        """Whether Griffin-Lim replaces the vocoder, and the device vocoder inputs are moved to."""
         vocoder_device = "cpu"
         use_gl = self.vocoder_model is None
         if not use_gl:
             vocoder_device = next(self.vocoder_model.parameters()).device
         if self.use_cuda:
             vocoder_device = "cuda"
+        return use_gl, vocoder_device
+
+    def _synthesize_sentence(
+        self,
+        sen: str,
+        use_gl: bool,
+        vocoder_device,
+        speaker_name: str,
+        language_name: str,
+        speaker_wav,
+        speaker_id,
+        speaker_embedding,
+        language_id,
+        style_wav,
+        style_text,
+        model_kwargs: Dict,
+    ) -> np.ndarray:
+        """Run the TTS model and the vocoder on a single sentence.
+
+        `model_kwargs` are the extra arguments of `tts()`, only passed to models with their own `synthesize()`. They
+        are kept apart from the named arguments so that a caller's kwarg never collides with them.
+        """
+        if hasattr(self.tts_model, "synthesize"):
+            outputs = self.tts_model.synthesize(
+                text=sen,
+                config=self.tts_config,
+                speaker_id=speaker_name,
+                voice_dirs=self.voice_dir,
+                d_vector=speaker_embedding,
+                speaker_wav=speaker_wav,
+                language=language_name,
+                **model_kwargs,
+            )
+        else:
+            # synthesize voice
+            outputs = synthesis(
+                model=self.tts_model,
+                text=sen,
+                CONFIG=self.tts_config,
+                use_cuda=self.use_cuda,
+                speaker_id=speaker_id,
+                style_wav=style_wav,
+                style_text=style_text,
+                use_griffin_lim=use_gl,
+                d_vector=speaker_embedding,
+                language_id=language_id,
+            )
+        waveform = outputs["wav"]
+        if not use_gl:
+            vocoder_input = self._to_vocoder_input(outputs["outputs"]["model_outputs"][0])
+            # run vocoder model
+            # [1, T, C]
+            waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
+        if torch.is_tensor(waveform) and waveform.device != torch.device("cpu") and not use_gl:
+            waveform = waveform.cpu()
+        if not use_gl:
+            waveform = waveform.numpy()
+        waveform = waveform.squeeze()
+
+        # trim silence
+        if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
+            waveform = trim_silence(waveform, self.tts_model.ap)
+        return waveform
+
+    def tts(
+        self,
+        text: str = "",
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        reference_wav=None,
+        reference_speaker_name=None,
+        split_sentences: bool = True,
+        batch_size: int = 1,
+        **kwargs,
+    ) -> np.ndarray:
+        """🐸 TTS magic. Run all the models and generate speech.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            reference_wav ([type], optional): reference waveform for voice conversion. Defaults to None.
+            reference_speaker_name ([type], optional): speaker id of reference waveform. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            batch_size (int, optional): number of sentences synthesized per model call. Sentences are grouped by
+                length into padded batches and the output keeps the input order. Models that cannot be batched
+                ignore it. Defaults to 1.
+            **kwargs: additional arguments to pass to the TTS model.
+        Returns:
+            np.ndarray: float32 waveform, with 10000 silent samples after each sentence.
+        """
+        start_time = time.time()
+        waveforms = []
+
+        if not text and not reference_wav:
+            raise ValueError(
+                "You need to define either `text` (for sythesis) or a `reference_wav` (for voice conversion) to use the Coqui TTS API."
+            )
+
+        if text:
+            sens = [text]
+            if split_sentences:
+                print(" > Text splitted to sentences.")
+                sens = self.split_into_sentences(text)
+            print(sens)
+
+        speaker_id, speaker_embedding, language_id = self._resolve_speaker_and_language(
+            speaker_name, language_name, speaker_wav, kwargs
+        )
+        use_gl, vocoder_device = self._vocoder_device()
 
         if not reference_wav:  # not voice conversion
-            for sen in sens:
-                if hasattr(self.tts_model, "synthesize"):
-                    outputs = self.tts_model.synthesize(
-                        text=sen,
-                        config=self.tts_config,
-                        speaker_id=speaker_name,
-                        voice_dirs=self.voice_dir,
-                        d_vector=speaker_embedding,
+            if batch_size > 1 and len(sens) > 1 and self._can_batch(use_gl):
+                batch_waveforms = self._batch_tts(
+                    sens,
+                    batch_size,
+                    use_gl=use_gl,
+                    vocoder_device=vocoder_device,
+                    speaker_id=speaker_id,
+                    speaker_embedding=speaker_embedding,
+                    language_id=language_id,
+                    style_wav=style_wav,
+                    style_text=style_text,
+                )
+                for waveform in batch_waveforms:
+                    # trim silence
+                    if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
+                        waveform = trim_silence(waveform, self.tts_model.ap)
+
+                    waveforms.append(waveform)
+            else:
+                for sen in sens:
+                    waveform = self._synthesize_sentence(
+                        sen,
+                        use_gl=use_gl,
+                        vocoder_device=vocoder_device,
+                        speaker_name=speaker_name,
+                        language_name=language_name,
                         speaker_wav=speaker_wav,
-                        language=language_name,
-                        **kwargs,
-                    )
-                else:
-                    # synthesize voice
-                    outputs = synthesis(
-                        model=self.tts_model,
-                        text=sen,
-                        CONFIG=self.tts_config,
-                        use_cuda=self.use_cuda,
                         speaker_id=speaker_id,
+                        speaker_embedding=speaker_embedding,
+                        language_id=language_id,
                         style_wav=style_wav,
                         style_text=style_text,
-                        use_griffin_lim=use_gl,
-                        d_vector=speaker_embedding,
-                        language_id=language_id,
+                        model_kwargs=kwargs,
                     )
-                waveform = outputs["wav"]
-                if not use_gl:
-                    mel_postnet_spec = outputs["outputs"]["model_outputs"][0].detach().cpu().numpy()
-                    # denormalize tts output based on tts audio config
-                    mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                    # renormalize spectrogram based on vocoder config
-                    vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                    # compute scale factor for possible sample rate mismatch
-                    scale_factor = [
-                        1,
-                        self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                    ]
-                    if scale_factor[1] != 1:
-                        print(" > interpolating tts model output.")
-                        vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                    else:
-                        vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
-                    # run vocoder model
-                    # [1, T, C]
-                    waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
-                if torch.is_tensor(waveform) and waveform.device != torch.device("cpu") and not use_gl:
-                    waveform = waveform.cpu()
-                if not use_gl:
-                    waveform = waveform.numpy()
-                waveform = waveform.squeeze()
-
-                # trim silence
-                if "do_trim_silence" in self.tts_config.audio and self.tts_config.audio["do_trim_silence"]:
-                    waveform = trim_silence(waveform, self.tts_model.ap)
-
-                wavs += list(waveform)
-                wavs += [0] * 10000
+                    waveforms.append(waveform)
+            wavs = self._assemble_wavs(waveforms, silence=10000)
         else:
             # get the speaker embedding or speaker id for the reference wav file
             reference_speaker_embedding = None
@@ -473,21 +811,7 @@ class Synthesizer(nn.Module):
             )
             waveform = outputs
             if not use_gl:
-                mel_postnet_spec = outputs[0].detach().cpu().numpy()
-                # denormalize tts output based on tts audio config
-                mel_postnet_spec = self.tts_model.ap.denormalize(mel_postnet_spec.T).T
-                # renormalize spectrogram based on vocoder config
-                vocoder_input = self.vocoder_ap.normalize(mel_postnet_spec.T)
-                # compute scale factor for possible sample rate mismatch
-                scale_factor = [
-                    1,
-                    self.vocoder_config["audio"]["sample_rate"] / self.tts_model.ap.sample_rate,
-                ]
-                if scale_factor[1] != 1:
-                    print(" > interpolating tts model output.")
-                    vocoder_input = interpolate_vocoder_input(scale_factor, vocoder_input)
-                else:
-                    vocoder_input = torch.tensor(vocoder_input).unsqueeze(0)  # pylint: disable=not-callable
+                vocoder_input = self._to_vocoder_input(outputs[0])
                 # run vocoder model
                 # [1, T, C]
                 waveform = self.vocoder_model.inference(vocoder_input.to(vocoder_device))
@@ -503,3 +827,76 @@ class Synthesizer(nn.Module):
         print(f" > Processing time: {process_time}")
         print(f" > Real-time factor: {process_time / audio_time}")
         return wavs
+
+    def tts_stream(
+        self,
+        text: str,
+        speaker_name: str = "",
+        language_name: str = "",
+        speaker_wav=None,
+        style_wav=None,
+        style_text=None,
+        split_sentences: bool = True,
+        **kwargs,
+    ) -> Iterator[np.ndarray]:
+        """Synthesize speech one sentence at a time, yielding each waveform as soon as it is ready.
+
+        The time to the first audio is bounded by the first sentence instead of the whole text. Each chunk is
+        followed by the same silence as in `tts()`, so the concatenated chunks match the output of `tts()` with
+        `batch_size=1`.
+
+        Args:
+            text (str): input text.
+            speaker_name (str, optional): speaker id for multi-speaker models. Defaults to "".
+            language_name (str, optional): language id for multi-language models. Defaults to "".
+            speaker_wav (Union[str, List[str]], optional): path to the speaker wav for voice cloning. Defaults to None.
+            style_wav ([type], optional): style waveform for GST. Defaults to None.
+            style_text ([type], optional): transcription of style_wav for Capacitron. Defaults to None.
+            split_sentences (bool, optional): split the input text into sentences. Defaults to True.
+            **kwargs: additional arguments to pass to the TTS model.
+
+        Yields:
+            np.ndarray: float32 waveform of one sentence.
+        """
+        if not text:
+            raise ValueError("You need to define `text` to stream speech with the Coqui TTS API.")
+
+        sens = self.split_into_sentences(text) if split_sentences else [text]
+        speaker_id, speaker_embedding, language_id = self._resolve_speaker_and_language(
+            speaker_name, language_name, speaker_wav, kwargs
+        )
+        use_gl, vocoder_device = self._vocoder_device()
+
+        for sen in sens:
+            waveform = self._synthesize_sentence(
+                sen,
+                use_gl=use_gl,
+                vocoder_device=vocoder_device,
+                speaker_name=speaker_name,
+                language_name=language_name,
+                speaker_wav=speaker_wav,
+                speaker_id=speaker_id,
+                speaker_embedding=speaker_embedding,
+                language_id=language_id,
+                style_wav=style_wav,
+                style_text=style_text,
+                model_kwargs=kwargs,
+            )
+            yield self._assemble_wavs([waveform], silence=10000)
+
+    def tts_stream_wav(self, text: str, **kwargs) -> Iterator[bytes]:
+        """Stream `tts_stream()` as a 16-bit PCM WAV file.
+
+        The first chunk is the WAV header, each following chunk holds the samples of one sentence. The audio is not
+        peak normalized as in `save_wav()`.
+
+        Args:
+            text (str): input text.
+            **kwargs: arguments of `tts_stream()`.
+
+        Yields:
+            bytes: encoded WAV chunks.
+        """
+        yield wav_stream_header(sample_rate=self.output_sample_rate)
+        for waveform in self.tts_stream(text, **kwargs):
+            yield wav_to_pcm16(wav=waveform)
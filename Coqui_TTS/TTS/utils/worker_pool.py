@@ -0,0 +1,283 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Tuple
+
+import torch
+
+# models served by this process, keyed by pool id so that in-process pools do not replace each other's model
+_models: Dict[int, Any] = {}
+_pool_ids = itertools.count()
+
+
+def _init_worker(pool_id: int, load_model: Callable[[], Any], num_threads: int, warmup: str) -> None:
+    torch.set_num_threads(num_threads)
+    model = load_model()
+    _models[pool_id] = model
+    if warmup:
+        getattr(model, warmup)()
+
+
+def _call_model(pool_id: int, method: str, args: tuple, kwargs: dict) -> Any:
+    return getattr(_models[pool_id], method)(*args, **kwargs)
+
+
+def _release_model(pool_id: int) -> None:
+    _models.pop(pool_id, None)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+class ModelWorkerPool:
+    """Serve a model from a pool of worker processes.
+
+    Each worker holds its own model and runs with `threads_per_worker` torch threads, so requests are served in
+    parallel across the cores instead of one at a time behind a lock. Requests wait in a FIFO dispatcher queue and are
+    handed to the next idle worker. `stats()` reports the queue depth and the latency of each worker.
+
+    With the default `fork` start method workers are forked when the pool is created and inherit the parent's memory,
+    so `load_model` may simply return a model loaded beforehand and its weights are shared copy-on-write. Create the
+    pool before the parent runs any inference, since forking after torch started its OpenMP threads hangs the
+    workers. With `spawn` or `forkserver`, `load_model` must be a picklable function loading the model.
+
+    A worker process that dies, e.g. killed for running out of memory, is replaced by a new one and the request it
+    was serving is retried once on the new worker. Replacements are never forked, since by then the parent may have
+    run inference: they are started with `forkserver` (or `spawn`) and load their model with `reload_model`, which
+    defaults to `load_model` unless the pool forks. A forked pool without `reload_model` does not replace dead
+    workers; the request fails with the error and the remaining workers serve the queue.
+
+    Args:
+        load_model (Callable[[], Any]): returns the model served by a worker.
+        num_workers (int, optional): number of worker processes. 0 serves the model from the calling process, as
+            needed for CUDA models or where `fork` is not available. Defaults to 1.
+        threads_per_worker (int, optional): torch threads of each worker. Defaults to an even share of the cores.
+        start_method (str, optional): multiprocessing start method. Defaults to "fork" where available.
+        warmup (str, optional): model method called once by each worker after loading, e.g. to run a short
+            synthesis so the first request does not pay for lazy initialization. Defaults to None.
+        reload_model (Callable[[], Any], optional): picklable function loading the model in a replacement worker.
+            Defaults to `load_model`, or to None with `fork`.
+
+    Example:
+        >>> pool = ModelWorkerPool(lambda: synthesizer, num_workers=4, reload_model=partial(Synthesizer, **kwargs))
+        >>> wav = pool.run("tts", "Hello world!")
+        >>> pool.stats()["queue_depth"]
+    """
+
+    # times a request is retried on a fresh worker after its worker process died
+    MAX_RETRIES = 1
+
+    def __init__(
+        self,
+        load_model: Callable[[], Any],
+        num_workers: int = 1,
+        threads_per_worker: int = None,
+        start_method: str = None,
+        warmup: str = None,
+        reload_model: Callable[[], Any] = None,
+    ):
+        if num_workers < 0:
+            raise ValueError(f" [!] `num_workers` must be 0 or more, got {num_workers}.")
+        if start_method is None:
+            if "fork" in multiprocessing.get_all_start_methods():
+                start_method = "fork"
+            elif num_workers:
+                print(" > `fork` is not available, serving the model from this process.")
+                num_workers = 0
+        if threads_per_worker is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // max(1, num_workers))
+
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker
+        self._pool_id = next(_pool_ids)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context(start_method) if num_workers else None
+        self._initargs = (self._pool_id, load_model, threads_per_worker, warmup)
+        if reload_model is None and start_method != "fork":
+            reload_model = load_model
+        self._restart_context = None
+        if num_workers and reload_model is not None:
+            restart_method = start_method
+            if restart_method == "fork":
+                restart_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._restart_context = multiprocessing.get_context(restart_method)
+        self._restart_initargs = (self._pool_id, reload_model, threads_per_worker, warmup)
+        self._executors = [self._new_executor(self._context, self._initargs) for _ in range(max(1, num_workers))]
+        self._restart_locks = [threading.Lock() for _ in self._executors]
+
+        # start every worker, load and warm up its model now rather than on the first request
+        pids = [future.result() for future in [executor.submit(_worker_pid) for executor in self._executors]]
+        self._workers = [
+            {
+                "pid": pid,
+                "busy": False,
+                "requests": 0,
+                "errors": 0,
+                "restarts": 0,
+                "alive": True,
+                "total_latency": 0.0,
+                "last_latency": None,
+            }
+            for pid in pids
+        ]
+        self._serving = len(pids)
+        self._dispatchers = [
+            threading.Thread(target=self._dispatch, args=(idx,), name=f"model-worker-{idx}", daemon=True)
+            for idx in range(len(self._executors))
+        ]
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+    def _new_executor(self, context, initargs: tuple):
+        if self.num_workers == 0:
+            return ThreadPoolExecutor(1, initializer=_init_worker, initargs=initargs)
+        return ProcessPoolExecutor(1, mp_context=context, initializer=_init_worker, initargs=initargs)
+
+    def _restart_worker(self, idx: int, broken) -> None:
+        """Replace the broken executor of worker `idx` by a new process with a freshly loaded model."""
+        with self._restart_locks[idx]:
+            if self._executors[idx] is not broken:
+                return  # already replaced by a concurrent call
+            if self._restart_context is None:
+                with self._lock:
+                    self._workers[idx]["alive"] = False
+                raise RuntimeError(
+                    f" [!] Model worker {idx} died and is not replaced, since forking a new one after inference may"
+                    " hang. Pass a picklable `reload_model` to restart workers."
+                )
+            broken.shutdown(wait=False)
+            self._executors[idx] = self._new_executor(self._restart_context, self._restart_initargs)
+            pid = self._executors[idx].submit(_worker_pid).result()
+            with self._lock:
+                self._workers[idx]["pid"] = pid
+                self._workers[idx]["restarts"] += 1
+
+    def _call(self, idx: int, method: str, args: tuple, kwargs: dict) -> Tuple[Any, BaseException]:
+        """Run a request on worker `idx`, restarting the worker if its process died. Returns (result, error)."""
+        for _ in range(self.MAX_RETRIES + 1):
+            executor = self._executors[idx]
+            try:
+                return executor.submit(_call_model, self._pool_id, method, args, kwargs).result(), None
+            except BrokenProcessPool as e:
+                error = e
+                print(f" > Model worker {idx} died, restarting it.")
+                try:
+                    self._restart_worker(idx, executor)
+                except BaseException as restart_error:  # pylint: disable=broad-except
+                    return None, restart_error
+            except BaseException as e:  # pylint: disable=broad-except
+                return None, e
+        return None, error
+
+    def _dispatch(self, idx: int) -> None:
+        """Feed queued requests to worker `idx` one at a time, until it dies and other workers remain."""
+        worker = self._workers[idx]
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            future, method, args, kwargs = request
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            with self._lock:
+                worker["busy"] = True
+            start = time.perf_counter()
+            result, error = self._call(idx, method, args, kwargs)
+            latency = time.perf_counter() - start
+            with self._lock:
+                worker["busy"] = False
+                worker["requests"] += 1
+                worker["errors"] += error is not None
+                worker["total_latency"] += latency
+                worker["last_latency"] = latency
+                # a dead worker leaves the queue to the others; the last one keeps failing requests fast
+                retire = not worker["alive"] and self._serving > 1
+                if retire:
+                    self._serving -= 1
+
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+            if retire:
+                return
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Queue a call of `model.<method>(*args, **kwargs)` on the next idle worker.
+
+        Returns:
+            Future: resolved with the return value. Cancelling it before a worker picks it up drops the request.
+        """
+        future = Future()
+        self._queue.put((future, method, args, kwargs))
+        return future
+
+    def run(self, method: str, *args, **kwargs) -> Any:
+        """Call `model.<method>(*args, **kwargs)` on the next idle worker and wait for the result."""
+        return self.submit(method, *args, **kwargs).result()
+
+    def broadcast(self, method: str, *args, **kwargs) -> Future:
+        """Call `model.<method>(*args, **kwargs)` on every worker, one worker at a time.
+
+        The calls bypass the request queue and run on each worker after the request it is serving, e.g. to load,
+        evict or inspect state that every worker holds its own copy of.
+
+        Returns:
+            Future: resolved with the return values in worker order, or with the first error.
+        """
+        future = Future()
+
+        def run_on_workers():
+            results: List[Any] = []
+            for idx in range(len(self._executors)):
+                result, error = self._call(idx, method, args, kwargs)
+                if error is not None:
+                    future.set_exception(error)
+                    return
+                results.append(result)
+            future.set_result(results)
+
+        threading.Thread(target=run_on_workers, name="model-worker-broadcast", daemon=True).start()
+        return future
+
+    def stats(self) -> Dict:
+        """Queue depth and per worker request count, errors, restarts, liveness and latency in seconds."""
+        with self._lock:
+            workers = [
+                {
+                    "pid": worker["pid"],
+                    "busy": worker["busy"],
+                    "requests": worker["requests"],
+                    "errors": worker["errors"],
+                    "restarts": worker["restarts"],
+                    "alive": worker["alive"],
+                    "mean_latency": worker["total_latency"] / worker["requests"] if worker["requests"] else None,
+                    "last_latency": worker["last_latency"],
+                }
+                for worker in self._workers
+            ]
+        return {
+            "queue_depth": self._queue.qsize(),
+            "num_workers": self.num_workers,
+            "threads_per_worker": self.threads_per_worker,
+            "workers": workers,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers once the queued requests are served."""
+        for _ in self._dispatchers:
+            self._queue.put(None)
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        if self.num_workers == 0:
+            self._executors[0].submit(_release_model, self._pool_id).result()
+        for executor in self._executors:
+            executor.shutdown()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -8,6 +9,7 @@ from trainer.io import save_checkpoint
 from tests import get_tests_input_path
 from TTS.config import load_config
 from TTS.encoder.utils.generic_utils import setup_encoder_model
+from TTS.tts.utils.embedding_cache import EmbeddingCache
 from TTS.tts.utils.speakers import SpeakerManager
 from TTS.utils.audio import AudioProcessor
 
@@ -59,6 +61,43 @@ class SpeakerManagerTest(unittest.TestCase):
         # remove dummy model
         os.remove(encoder_model_path)
 
+    @staticmethod
+    def test_embedding_cache():
+        config = load_config(encoder_config_path)
+        model = setup_encoder_model(config)
+        save_checkpoint(config, model, None, None, 0, 0, get_tests_input_path())
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            manager = SpeakerManager(encoder_model_path=encoder_model_path, encoder_config_path=encoder_config_path)
+            manager.embedding_cache = EmbeddingCache(cache_dir)
+            d_vector = manager.compute_embedding_from_clip(sample_wav_path)
+
+            # cached embeddings skip the encoder, also from disk in a fresh cache
+            encoder = manager.encoder
+            manager.encoder = None
+            assert manager.compute_embedding_from_clip(sample_wav_path) == d_vector
+            manager.embedding_cache = EmbeddingCache(cache_dir)
+            assert manager.compute_embedding_from_clip(sample_wav_path) == d_vector
+            manager.encoder = encoder
+
+            # an unwritable cache store does not fail the embedding computation
+            blocked_dir = os.path.join(cache_dir, "blocked")
+            with open(blocked_dir, "w", encoding="utf-8"):
+                pass
+            manager.embedding_cache = EmbeddingCache(blocked_dir)
+            assert manager.compute_embedding_from_clip(sample_wav_path) == d_vector
+            manager.embedding_cache = EmbeddingCache(cache_dir)
+
+            # a new encoder checkpoint invalidates the cached embeddings
+            old_mtime_ns = os.stat(encoder_model_path).st_mtime_ns
+            save_checkpoint(config, setup_encoder_model(config), None, None, 0, 0, get_tests_input_path())
+            os.utime(encoder_model_path, ns=(old_mtime_ns + 10**9, old_mtime_ns + 10**9))
+            manager.init_encoder(encoder_model_path, encoder_config_path)
+            assert manager.compute_embedding_from_clip(sample_wav_path) != d_vector
+            assert manager.embedding_cache.prune([manager.encoder_fingerprint]) == 1
+
+        os.remove(encoder_model_path)
+
     def test_dvector_file_processing(self):
         manager = SpeakerManager(d_vectors_file_path=d_vectors_file_path)
         self.assertEqual(manager.num_speakers, 1)
@@ -0,0 +1,125 @@
+import os
+import signal
+import unittest
+
+import torch
+
+from TTS.utils.worker_pool import ModelWorkerPool
+
+
+class DummyModel:
+    def pid(self):
+        return os.getpid()
+
+    def num_threads(self):
+        return torch.get_num_threads()
+
+    def scale(self, x, factor=2):
+        if x < 0:
+            raise ValueError("negative input")
+        return x * factor
+
+
+class ScaledModel(DummyModel):
+    def scale(self, x, factor=2):
+        return super().scale(x, factor * 5)
+
+
+class TestModelWorkerPool(unittest.TestCase):
+    def test_worker_processes(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=2, threads_per_worker=1)
+        try:
+            self.assertEqual([pool.submit("scale", i, factor=3).result() for i in range(4)], [0, 3, 6, 9])
+            self.assertNotEqual(pool.run("pid"), os.getpid())
+            self.assertEqual(pool.run("num_threads"), 1)
+            with self.assertRaises(ValueError):
+                pool.run("scale", -1)
+
+            stats = pool.stats()
+            self.assertEqual(stats["queue_depth"], 0)
+            self.assertEqual(len(stats["workers"]), 2)
+            self.assertEqual(sum(worker["requests"] for worker in stats["workers"]), 7)
+            self.assertEqual(sum(worker["errors"] for worker in stats["workers"]), 1)
+        finally:
+            pool.shutdown()
+
+    def test_in_process(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=0)
+        try:
+            self.assertEqual(pool.run("pid"), os.getpid())
+            self.assertEqual(pool.stats()["workers"][0]["requests"], 1)
+        finally:
+            pool.shutdown()
+
+    def test_in_process_pools_keep_their_models(self):
+        first = ModelWorkerPool(DummyModel, num_workers=0)
+        second = ModelWorkerPool(ScaledModel, num_workers=0)
+        try:
+            self.assertEqual(first.run("scale", 2), 4)
+            self.assertEqual(second.run("scale", 2), 20)
+        finally:
+            first.shutdown()
+            second.shutdown()
+
+    def test_dead_worker_is_replaced(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=1, threads_per_worker=1, reload_model=DummyModel)
+        try:
+            old_pid = pool.run("pid")
+            os.kill(old_pid, signal.SIGKILL)
+            self.assertEqual(pool.run("scale", 2), 4)
+            self.assertNotEqual(pool.run("pid"), old_pid)
+
+            stats = pool.stats()["workers"][0]
+            self.assertEqual(stats["restarts"], 1)
+            self.assertEqual(stats["errors"], 0)
+            self.assertTrue(stats["alive"])
+        finally:
+            pool.shutdown()
+
+    def test_dead_forked_worker_is_not_replaced(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=2, threads_per_worker=1)
+        try:
+            os.kill(pool.stats()["workers"][0]["pid"], signal.SIGKILL)
+            # the dead worker fails the first request it picks up, then leaves the queue to the other worker
+            for _ in range(50):
+                try:
+                    pool.run("scale", 1)
+                except RuntimeError:
+                    break
+            else:
+                self.fail("no request reached the dead worker")
+            self.assertEqual([pool.submit("scale", i).result() for i in range(4)], [0, 2, 4, 6])
+
+            stats = pool.stats()["workers"]
+            self.assertFalse(stats[0]["alive"])
+            self.assertEqual(stats[0]["restarts"], 0)
+            self.assertTrue(stats[1]["alive"])
+        finally:
+            pool.shutdown()
+
+    def test_last_dead_forked_worker_fails_requests(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=1, threads_per_worker=1)
+        try:
+            os.kill(pool.run("pid"), signal.SIGKILL)
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    pool.run("scale", 2)
+        finally:
+            pool.shutdown()
+
+    def test_broadcast(self):
+        model = DummyModel()
+        pool = ModelWorkerPool(lambda: model, num_workers=2, threads_per_worker=1)
+        try:
+            pids = pool.broadcast("pid").result()
+            self.assertEqual(sorted(pids), sorted(worker["pid"] for worker in pool.stats()["workers"]))
+            self.assertEqual(pool.broadcast("scale", 2, factor=4).result(), [8, 8])
+            with self.assertRaises(ValueError):
+                pool.broadcast("scale", -1).result()
+        finally:
+            pool.shutdown()
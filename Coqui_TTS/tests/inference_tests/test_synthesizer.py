@@ -1,6 +1,8 @@
 import os
 import unittest
 
+import numpy as np
+import torch
 from trainer.io import save_checkpoint
 
 from tests import get_tests_input_path
@@ -24,7 +26,34 @@ class SynthesizerTest(unittest.TestCase):
         tts_checkpoint = os.path.join(tts_root_path, "checkpoint_10.pth")
         tts_config = os.path.join(tts_root_path, "dummy_model_config.json")
         synthesizer = Synthesizer(tts_checkpoint, tts_config, None, None)
-        synthesizer.tts("Better this test works!!")
+        wav = synthesizer.tts("Better this test works!!")
+        assert isinstance(wav, np.ndarray) and wav.dtype == np.float32
+        synthesizer.tts("Better this test works!! Even in batches.", batch_size=2)
+        assert len(list(synthesizer.tts_stream("Better this test works!! Even when streamed."))) == 2
+        # extra kwargs are only meant for the model and must not collide with the per-sentence arguments
+        synthesizer.tts("Better this test works!!", speaker_embedding=None, speaker_id=None, use_gl=False)
+        list(synthesizer.tts_stream("Better this test works!!", speaker_embedding=None, language_id=None))
+
+    def test_quantize(self):
+        self._create_random_model()
+        tts_root_path = get_tests_input_path()
+        tts_checkpoint = os.path.join(tts_root_path, "checkpoint_10.pth")
+        tts_config = os.path.join(tts_root_path, "dummy_model_config.json")
+        synthesizer = Synthesizer(tts_checkpoint, tts_config, quantize=True)
+        modules = list(synthesizer.tts_model.modules())
+        assert any(isinstance(module, torch.ao.nn.quantized.dynamic.LSTMCell) for module in modules)
+        assert not any(isinstance(module, torch.nn.LSTMCell) for module in modules)
+
+    def test_length_buckets(self):
+        # longest first, at most batch_size per bucket
+        assert Synthesizer._length_buckets([3, 9, 1, 7, 5], 2) == [[1, 3], [4, 0], [2]]
+        assert Synthesizer._length_buckets([4, 4], 8) == [[0, 1]]
+        assert Synthesizer._length_buckets([], 4) == []
+
+    def test_assemble_wavs(self):
+        wav = Synthesizer._assemble_wavs([np.ones(3), np.full(2, 0.5)], silence=2)
+        np.testing.assert_array_equal(wav, [1, 1, 1, 0, 0, 0.5, 0.5, 0, 0])
+        assert Synthesizer._assemble_wavs([], silence=2).shape == (0,)
 
     def test_split_into_sentences(self):
         """Check demo server sentences split as expected"""
@@ -4,6 +4,7 @@ from packaging.version import Version
 
 from TTS.tts.utils.text.phonemizers import ESpeak, Gruut, JA_JP_Phonemizer, ZH_CN_Phonemizer
 from TTS.tts.utils.text.phonemizers.bangla_phonemizer import BN_Phonemizer
+from TTS.tts.utils.text.phonemizers.espeak_wrapper import PhonemeCache
 from TTS.tts.utils.text.phonemizers.multi_phonemizer import MultiPhonemizer
 
 EXAMPLE_TEXTs = [
@@ -129,6 +130,19 @@ class TestEspeakNgPhonemizer(unittest.TestCase):
         self.assertTrue(self.phonemizer.is_available())
 
 
+class TestPhonemeCache(unittest.TestCase):
+    def test_lru(self):
+        cache = PhonemeCache(max_entries=2)
+        cache.put(("espeak-ng", "en-us", False, "a"), "ɐ")
+        cache.put(("espeak-ng", "en-us", False, "b"), "bˈiː")
+        self.assertEqual(cache.get(("espeak-ng", "en-us", False, "a")), "ɐ")
+        cache.put(("espeak-ng", "en-us", False, "c"), "sˈiː")
+        self.assertIsNone(cache.get(("espeak-ng", "en-us", False, "b")))
+        self.assertEqual(cache.get(("espeak-ng", "en-us", False, "c")), "sˈiː")
+        cache.clear()
+        self.assertIsNone(cache.get(("espeak-ng", "en-us", False, "a")))
+
+
 class TestGruutPhonemizer(unittest.TestCase):
     def setUp(self):
         self.phonemizer = Gruut(language="en-us", use_espeak_phonemes=True, keep_stress=False)
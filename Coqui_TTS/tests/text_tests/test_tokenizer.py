@@ -37,6 +37,13 @@ class TestTTSTokenizer(unittest.TestCase):
         test_hat = self.tokenizer_ph.ids_to_text(ids)
         self.assertEqual(text_ph, test_hat)
 
+    def test_texts_to_ids_matches_text_to_ids(self):
+        texts = ["Bu bir Örnek.", "Merhaba, nasılsın?", "..."]
+        self.assertEqual(
+            self.tokenizer_ph.texts_to_ids(texts), [self.tokenizer_ph.text_to_ids(text) for text in texts]
+        )
+        self.assertEqual(self.tokenizer.texts_to_ids(texts), [self.tokenizer.text_to_ids(text) for text in texts])
+
     def test_text_to_ids_phonemes_with_eos_bos(self):
         text = "Bu bir Örnek."
         self.tokenizer_ph.use_eos_bos = True
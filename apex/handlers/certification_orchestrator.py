@@ -9,12 +9,97 @@ import asyncio
 import json
 import hashlib
 import logging
-from typing import Dict, Any, Optional
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
+from apex.validators.provenance_chain import compute_entry_hash
+
 logger = logging.getLogger(__name__)
 
+# 13-layer DAG. Each layer lists the layers whose results it needs;
+# independent layers run concurrently.
+LAYER_GRAPH: Dict[int, Dict[str, Any]] = {
+    1: {"name": "file_integrity", "depends_on": ()},
+    2: {"name": "structural_integrity", "depends_on": (),
+        "analysis": "Bundle structure conforms to GOAT schema", "confidence": 1.0},
+    3: {"name": "temporal_integrity", "depends_on": (),
+        "analysis": "All timestamps consistent and within acceptable ranges", "confidence": 0.95},
+    4: {"name": "content_type_verification", "depends_on": (1,),
+        "analysis": "Content types match declared formats", "confidence": 0.90},
+    5: {"name": "metadata_consistency", "depends_on": (2,),
+        "analysis": "Metadata fields consistent across all files", "confidence": 0.85},
+    6: {"name": "pattern_analysis", "depends_on": (4,),
+        "analysis": "Content patterns consistent with declared purpose", "confidence": 0.75},
+    7: {"name": "cross_reference_validation", "depends_on": (4, 5),
+        "analysis": "Internal references and citations verified", "confidence": 0.80},
+    8: {"name": "authenticity_markers", "depends_on": (1,),
+        "analysis": "Authenticity markers present and valid", "confidence": 0.95},
+    9: {"name": "tamper_detection", "depends_on": (1, 3)},
+    10: {"name": "chain_of_custody", "depends_on": (3, 9),
+         "analysis": "Provenance chain intact and verifiable", "confidence": 0.99},
+    11: {"name": "advanced_forensics", "depends_on": (6, 8, 9),
+         "analysis": "Advanced forensic analysis completed", "confidence": 0.90},
+    12: {"name": "legal_compliance", "depends_on": (5, 6, 7),
+         "analysis": "Content complies with applicable legal standards", "confidence": 0.85},
+    13: {"name": "apex_certification", "depends_on": tuple(range(1, 13)),
+         "analysis": "APEX DOC certification authority validation complete", "confidence": 1.0},
+}
+
+LAYER_WORKERS = int(os.getenv("APEX_LAYER_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all certification requests."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=LAYER_WORKERS)
+    return _process_pool
+
+def _layer_result(layer_id: int, status: str, analysis: str, confidence: float) -> Dict[str, Any]:
+    return {
+        "layer": layer_id,
+        "name": LAYER_GRAPH[layer_id]["name"],
+        "status": status,
+        "analysis": analysis,
+        "confidence": confidence,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+def _analyze_file_integrity(bundle: Dict[str, Any], content: Dict[str, Any],
+                            upstream: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """Layer 1: hash acquired files against the manifest (runs in a worker process)."""
+    expected = {f.get("filename"): f.get("hash_sha3") for f in bundle["content_manifest"].get("files", [])}
+    mismatched = [
+        f.get("filename") for f in content.get("files", [])
+        if f.get("data") is not None and hashlib.sha3_256(f["data"]).hexdigest() != expected.get(f.get("filename"))
+    ]
+
+    if mismatched:
+        return _layer_result(1, "failed", f"Hash mismatch for: {', '.join(map(str, mismatched))}", 0.0)
+    return _layer_result(1, "passed", "All file hashes verified against manifest", 1.0)
+
+def _analyze_tamper_detection(bundle: Dict[str, Any], content: Dict[str, Any],
+                              upstream: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """Layer 9: recompute provenance entry hashes (runs in a worker process)."""
+    tampered = []
+    for index, entry in enumerate(bundle.get("provenance_log", [])):
+        if compute_entry_hash(entry) != entry.get("entry_hash"):
+            tampered.append(index)
+
+    if tampered:
+        return _layer_result(9, "failed", f"Provenance entries altered: {tampered}", 0.0)
+    return _layer_result(9, "passed", "No tampering indicators detected", 0.98)
+
+CPU_BOUND_LAYERS = {
+    1: _analyze_file_integrity,
+    9: _analyze_tamper_detection,
+}
+
 class CertificationStatus(Enum):
     PENDING_VALIDATION = "PENDING_VALIDATION"
     PROCESSING = "PROCESSING"
@@ -56,13 +141,16 @@ class CertificationOrchestrator:
             content = await self._acquire_content(bundle["content_manifest"])
 
             # Run 13-layer analysis
-            layers = await self._analyze_13_layers(bundle, content)
+            analysis_started = time.perf_counter()
+            layers, layer_timings = await self._analyze_13_layers(bundle, content)
+            analysis_ms = round((time.perf_counter() - analysis_started) * 1000, 2)
 
             # Generate certificate
             certificate = await self._generate_certificate(
                 bundle_id=bundle["bundle_id"],
                 layers=layers,
-                apex_request_id=apex_request_id
+                apex_request_id=apex_request_id,
+                metadata={"layer_timings_ms": layer_timings, "analysis_ms": analysis_ms}
             )
 
             # Store and deliver
@@ -94,202 +182,64 @@ class CertificationOrchestrator:
 
         return content
 
-    async def _analyze_13_layers(self, bundle: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _analyze_13_layers(self, bundle: Dict[str, Any],
+                                 content: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
         """
         Run the 13-layer forensic analysis.
         This is the core certification logic.
+
+        Layers run as a DAG: each starts as soon as the layers it depends on
+        have finished, and CPU-bound layers run in the shared process pool.
+        Returns the layers in order plus per-layer wall time in milliseconds.
         """
         logger.info("Running 13-layer analysis...")
 
-        layers = []
-
-        # Layer 1-3: Basic integrity checks
-        layers.extend(await self._analyze_integrity_layers(bundle, content))
-
-        # Layer 4-7: Content analysis
-        layers.extend(await self._analyze_content_layers(bundle, content))
-
-        # Layer 8-11: Advanced forensics
-        layers.extend(await self._analyze_forensic_layers(bundle, content))
+        results: Dict[int, Dict[str, Any]] = {}
+        timings: Dict[str, float] = {}
+        tasks: Dict[int, asyncio.Task] = {}
+
+        async def run_layer(layer_id: int):
+            spec = LAYER_GRAPH[layer_id]
+            await asyncio.gather(*(tasks[dep] for dep in spec["depends_on"]))
+            upstream = {dep: results[dep] for dep in spec["depends_on"]}
+
+            started = time.perf_counter()
+            blocked = [dep for dep, result in upstream.items() if result["status"] != "passed"]
+            if blocked:
+                result = _layer_result(layer_id, "skipped", f"Skipped: depends on unpassed layer(s) {blocked}", 0.0)
+            elif layer_id in CPU_BOUND_LAYERS:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(_get_process_pool(), CPU_BOUND_LAYERS[layer_id],
+                                                    bundle, content, upstream)
+            else:
+                result = await self._run_placeholder_layer(layer_id)
+
+            timings[spec["name"]] = round((time.perf_counter() - started) * 1000, 2)
+            results[layer_id] = result
+
+        # Dependencies always have lower layer numbers, so every task a
+        # layer waits on already exists when it starts
+        for layer_id in sorted(LAYER_GRAPH):
+            tasks[layer_id] = asyncio.ensure_future(run_layer(layer_id))
 
-        # Layer 12-13: Legal/compliance certification
-        layers.extend(await self._analyze_certification_layers(bundle, content))
-
-        return layers
-
-    async def _analyze_integrity_layers(self, bundle: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Layers 1-3: Hash verification, structure validation, timestamp consistency."""
-        layers = []
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
 
-        # Layer 1: File integrity
-        layer_1 = {
-            "layer": 1,
-            "name": "file_integrity",
-            "status": "passed",
-            "analysis": "All file hashes verified against manifest",
-            "confidence": 1.0,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_1)
-
-        # Layer 2: Structural integrity
-        layer_2 = {
-            "layer": 2,
-            "name": "structural_integrity",
-            "status": "passed",
-            "analysis": "Bundle structure conforms to GOAT schema",
-            "confidence": 1.0,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_2)
-
-        # Layer 3: Temporal integrity
-        layer_3 = {
-            "layer": 3,
-            "name": "temporal_integrity",
-            "status": "passed",
-            "analysis": "All timestamps consistent and within acceptable ranges",
-            "confidence": 0.95,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_3)
-
-        await asyncio.sleep(0.1)  # Simulate processing time
-        return layers
-
-    async def _analyze_content_layers(self, bundle: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Layers 4-7: Content type detection, metadata analysis, pattern recognition."""
-        layers = []
-
-        # Layer 4: Content type verification
-        layer_4 = {
-            "layer": 4,
-            "name": "content_type_verification",
-            "status": "passed",
-            "analysis": "Content types match declared formats",
-            "confidence": 0.90,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_4)
-
-        # Layer 5: Metadata consistency
-        layer_5 = {
-            "layer": 5,
-            "name": "metadata_consistency",
-            "status": "passed",
-            "analysis": "Metadata fields consistent across all files",
-            "confidence": 0.85,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_5)
-
-        # Layer 6: Pattern analysis
-        layer_6 = {
-            "layer": 6,
-            "name": "pattern_analysis",
-            "status": "passed",
-            "analysis": "Content patterns consistent with declared purpose",
-            "confidence": 0.75,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_6)
-
-        # Layer 7: Cross-reference validation
-        layer_7 = {
-            "layer": 7,
-            "name": "cross_reference_validation",
-            "status": "passed",
-            "analysis": "Internal references and citations verified",
-            "confidence": 0.80,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_7)
-
-        await asyncio.sleep(0.2)
-        return layers
-
-    async def _analyze_forensic_layers(self, bundle: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Layers 8-11: Advanced forensic analysis."""
-        layers = []
-
-        # Layer 8: Authenticity markers
-        layer_8 = {
-            "layer": 8,
-            "name": "authenticity_markers",
-            "status": "passed",
-            "analysis": "Authenticity markers present and valid",
-            "confidence": 0.95,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_8)
-
-        # Layer 9: Tamper detection
-        layer_9 = {
-            "layer": 9,
-            "name": "tamper_detection",
-            "status": "passed",
-            "analysis": "No tampering indicators detected",
-            "confidence": 0.98,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_9)
-
-        # Layer 10: Chain of custody
-        layer_10 = {
-            "layer": 10,
-            "name": "chain_of_custody",
-            "status": "passed",
-            "analysis": "Provenance chain intact and verifiable",
-            "confidence": 0.99,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_10)
-
-        # Layer 11: Advanced forensics
-        layer_11 = {
-            "layer": 11,
-            "name": "advanced_forensics",
-            "status": "passed",
-            "analysis": "Advanced forensic analysis completed",
-            "confidence": 0.90,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_11)
-
-        await asyncio.sleep(0.3)
-        return layers
-
-    async def _analyze_certification_layers(self, bundle: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Layers 12-13: Legal and compliance certification."""
-        layers = []
-
-        # Layer 12: Legal compliance
-        layer_12 = {
-            "layer": 12,
-            "name": "legal_compliance",
-            "status": "passed",
-            "analysis": "Content complies with applicable legal standards",
-            "confidence": 0.85,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_12)
-
-        # Layer 13: APEX certification
-        layer_13 = {
-            "layer": 13,
-            "name": "apex_certification",
-            "status": "passed",
-            "analysis": "APEX DOC certification authority validation complete",
-            "confidence": 1.0,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        layers.append(layer_13)
+        return [results[layer_id] for layer_id in sorted(results)], timings
 
-        await asyncio.sleep(0.1)
-        return layers
+    async def _run_placeholder_layer(self, layer_id: int) -> Dict[str, Any]:
+        """I/O-bound layers; in production these call out to analysis services."""
+        spec = LAYER_GRAPH[layer_id]
+        await asyncio.sleep(0.05)  # Simulate processing time
+        return _layer_result(layer_id, "passed", spec["analysis"], spec["confidence"])
 
     async def _generate_certificate(self, bundle_id: str, layers: List[Dict[str, Any]],
-                                  apex_request_id: str) -> Dict[str, Any]:
+                                  apex_request_id: str,
+                                  metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate the final APEX certificate.
         """
@@ -304,7 +254,8 @@ class CertificationOrchestrator:
             "signatures": [],  # Would include APEX Ed25519 signatures
             "issued_at": datetime.utcnow().isoformat() + "Z",
             "expires_at": (datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) +
-                          timedelta(days=365)).isoformat() + "Z"
+                          timedelta(days=365)).isoformat() + "Z",
+            "metadata": metadata or {}
         }
 
         return certificate
@@ -360,4 +311,4 @@ class CertificationOrchestrator:
                                 result={"rejection_reasons": rejections})
 
 # Import here to avoid circular imports
-from apex.validators.evidence_bundle import EvidenceBundleValidator
\ No newline at end of file
+from apex.validators.evidence_bundle import EvidenceBundleValidator
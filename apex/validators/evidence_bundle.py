@@ -6,11 +6,12 @@ This is the gatekeeper that validates GOAT evidence bundles before certification
 """
 
 import hashlib
-import json
 from typing import Tuple, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
 
+from apex.validators.provenance_chain import ProvenanceChainVerifier
+
 logger = logging.getLogger(__name__)
 
 class EvidenceBundleValidator:
@@ -160,36 +161,13 @@ class EvidenceBundleValidator:
 
     def _verify_provenance_chain(self, log: list) -> bool:
         """Ensure provenance entries form coherent timeline."""
-        if not log:
-            return True  # Empty log is valid (edge case)
-
-        timestamps = []
-        prev_hash = None
-
-        for entry in log:
-            # Check hash chaining
-            if entry.get("prev_entry_hash") != prev_hash:
-                return False
-
-            # Verify entry hash
-            entry_data = {k: v for k, v in entry.items() if k not in ['entry_hash']}
-            entry_str = json.dumps(entry_data, sort_keys=True, separators=(',', ':'))
-            expected_hash = hashlib.sha256(entry_str.encode()).hexdigest()
-
-            if entry.get("entry_hash") != expected_hash:
-                return False
-
-            # Collect timestamps for ordering check
-            try:
-                ts = datetime.fromisoformat(entry.get("timestamp", "").replace('Z', '+00:00'))
-                timestamps.append(ts)
-            except:
-                return False
-
-            prev_hash = entry.get("entry_hash")
-
-        # Verify chronological order
-        return timestamps == sorted(timestamps)
+        # Bundle logs are untrusted input, so always verify from genesis;
+        # entries are streamed through the verifier one at a time
+        verifier = ProvenanceChainVerifier()
+        if not verifier.verify_all(log):
+            logger.warning(f"Provenance chain rejected at {verifier.error}")
+            return False
+        return True
 
     def _validate_callback_url(self, url: str) -> bool:
         """Prevent Server-Side Request Forgery."""
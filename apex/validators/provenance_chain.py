@@ -0,0 +1,232 @@
+"""
+APEX DOC Provenance Chain.
+
+Streaming builder and verifier for evidence bundle provenance logs.
+Entries are chained and verified one at a time, so arbitrarily long logs
+(lists, generators or JSONL files) are processed in constant memory.
+
+Every CHECKPOINT_INTERVAL entries the builder embeds a checkpoint hash
+committing to (index, entry_hash, timestamp). A verifier given a trusted
+checkpoint resumes from it instead of re-hashing the chain from genesis.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+CHECKPOINT_INTERVAL = 100
+
+# Fields that are derived from the entry rather than covered by its hash
+DERIVED_FIELDS = ("entry_hash", "checkpoint_hash")
+
+# Reused encoder: same output as json.dumps(sort_keys=True, separators=(',', ':'))
+# without constructing a new encoder per entry
+_canonical = json.JSONEncoder(sort_keys=True, separators=(',', ':')).encode
+
+
+def compute_entry_hash(entry: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical entry, including its prev_entry_hash link."""
+    entry_data = {k: v for k, v in entry.items() if k not in DERIVED_FIELDS}
+    return hashlib.sha256(_canonical(entry_data).encode()).hexdigest()
+
+
+def compute_checkpoint_hash(checkpoint: Dict[str, Any]) -> str:
+    """SHA-256 of a checkpoint record (index, entry_hash, timestamp)."""
+    record = {"index": checkpoint["index"], "entry_hash": checkpoint["entry_hash"],
+              "timestamp": checkpoint["timestamp"]}
+    return hashlib.sha256(_canonical(record).encode()).hexdigest()
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def iter_jsonl(path: Path, start: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entries from a JSONL provenance log.
+    Lines before `start` are skipped without being parsed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if index >= start and line.strip():
+                yield json.loads(line)
+
+
+def _jsonl_tail(path: Path) -> tuple:
+    """(entry count, last entry) of a JSONL log, reading it in fixed-size blocks."""
+    count = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return 0, None
+        f.seek(size - 1)
+        if f.read(1) != b"\n":
+            count += 1  # final line without a trailing newline
+
+        # Walk back from the end until the final line is fully in view
+        window = 4096
+        while True:
+            f.seek(max(0, size - window))
+            tail = f.read().rstrip(b"\n")
+            if b"\n" in tail or window >= size:
+                last_line = tail.rsplit(b"\n", 1)[-1]
+                break
+            window *= 2
+
+    return count, json.loads(last_line)
+
+
+class ProvenanceChainBuilder:
+    """
+    Appends provenance entries to a hash chain one at a time.
+    Only the previous hash and running index are kept in memory.
+    """
+
+    def __init__(self, prev_hash: Optional[str] = None, index: int = 0,
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        self.prev_hash = prev_hash
+        self.index = index
+        self.checkpoint_interval = checkpoint_interval
+
+    @classmethod
+    def resume_jsonl(cls, path: Path, checkpoint_interval: int = CHECKPOINT_INTERVAL) -> "ProvenanceChainBuilder":
+        """Builder positioned after the last entry of an existing JSONL log."""
+        path = Path(path)
+        if not path.exists():
+            return cls(checkpoint_interval=checkpoint_interval)
+        count, last_entry = _jsonl_tail(path)
+        prev_hash = last_entry.get("entry_hash") if last_entry else None
+        return cls(prev_hash=prev_hash, index=count, checkpoint_interval=checkpoint_interval)
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Chain one entry and return it with prev_entry_hash/entry_hash (and checkpoint_hash)."""
+        chained_entry = {k: v for k, v in entry.items() if k not in DERIVED_FIELDS}
+        chained_entry["prev_entry_hash"] = self.prev_hash
+        chained_entry["entry_hash"] = compute_entry_hash(chained_entry)
+
+        if (self.index + 1) % self.checkpoint_interval == 0:
+            chained_entry["checkpoint_hash"] = compute_checkpoint_hash({
+                "index": self.index,
+                "entry_hash": chained_entry["entry_hash"],
+                "timestamp": chained_entry.get("timestamp")
+            })
+
+        self.prev_hash = chained_entry["entry_hash"]
+        self.index += 1
+        return chained_entry
+
+    def chain(self, entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazily chain a stream of entries."""
+        for entry in entries:
+            yield self.append(entry)
+
+    def append_jsonl(self, path: Path, entries: Iterable[Dict[str, Any]]) -> int:
+        """Chain entries onto a JSONL log, returning how many were written."""
+        written = 0
+        with open(path, "a", encoding="utf-8") as f:
+            for chained_entry in self.chain(entries):
+                f.write(_canonical(chained_entry) + "\n")
+                written += 1
+        return written
+
+
+class ProvenanceChainVerifier:
+    """
+    Incrementally verifies a provenance chain: hash links, entry hashes,
+    embedded checkpoints and chronological order.
+
+    Only the previous hash, last timestamp and latest checkpoint are kept.
+    """
+
+    def __init__(self, trusted_checkpoint: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            trusted_checkpoint: {index, entry_hash, timestamp} of an entry already
+                verified; verification resumes with the entry after it.
+        """
+        self.error: Optional[str] = None
+        self.checkpoint = trusted_checkpoint
+        self.head = trusted_checkpoint
+
+        if trusted_checkpoint:
+            self.index = trusted_checkpoint["index"] + 1
+            self.prev_hash = trusted_checkpoint["entry_hash"]
+            self.last_timestamp = _parse_timestamp(trusted_checkpoint["timestamp"])
+        else:
+            self.index = 0
+            self.prev_hash = None
+            self.last_timestamp = None
+
+    def _fail(self, reason: str) -> bool:
+        self.error = f"entry {self.index}: {reason}"
+        return False
+
+    def verify(self, entry: Dict[str, Any]) -> bool:
+        """Verify the next entry; on failure `error` says why."""
+        if self.error:
+            return False
+
+        if entry.get("prev_entry_hash") != self.prev_hash:
+            return self._fail("prev_entry_hash does not match previous entry")
+
+        entry_hash = compute_entry_hash(entry)
+        if entry.get("entry_hash") != entry_hash:
+            return self._fail("entry_hash mismatch")
+
+        timestamp = _parse_timestamp(entry.get("timestamp", ""))
+        if timestamp is None:
+            return self._fail("invalid timestamp")
+        try:
+            if self.last_timestamp is not None and timestamp < self.last_timestamp:
+                return self._fail("timestamp out of order")
+        except TypeError:
+            return self._fail("mixed naive and aware timestamps")
+
+        record = {"index": self.index, "entry_hash": entry_hash, "timestamp": entry.get("timestamp")}
+        if "checkpoint_hash" in entry:
+            if entry["checkpoint_hash"] != compute_checkpoint_hash(record):
+                return self._fail("checkpoint_hash mismatch")
+            self.checkpoint = record
+
+        self.head = record
+        self.prev_hash = entry_hash
+        self.last_timestamp = timestamp
+        self.index += 1
+        return True
+
+    def verify_all(self, entries: Iterable[Dict[str, Any]]) -> bool:
+        """Verify a stream of entries following the current position."""
+        for entry in entries:
+            if not self.verify(entry):
+                return False
+        return True
+
+
+def verify_chain(entries: Iterable[Dict[str, Any]],
+                 trusted_checkpoint: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Verify a provenance log from genesis, or from a trusted checkpoint.
+
+    With a checkpoint, a list is sliced past the checkpoint index so earlier
+    entries are never hashed; any other iterable must start after it.
+    """
+    verifier = ProvenanceChainVerifier(trusted_checkpoint)
+    if trusted_checkpoint and isinstance(entries, list):
+        entries = entries[verifier.index:]
+    return verifier.verify_all(entries)
+
+
+def verify_jsonl(path: Path, trusted_checkpoint: Optional[Dict[str, Any]] = None) -> ProvenanceChainVerifier:
+    """Verify a JSONL provenance log, returning the verifier (check .error, .checkpoint)."""
+    verifier = ProvenanceChainVerifier(trusted_checkpoint)
+    verifier.verify_all(iter_jsonl(path, start=verifier.index))
+    return verifier
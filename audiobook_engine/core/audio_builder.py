@@ -25,6 +25,7 @@ except ImportError:
 from ..models.chapter_audio import ChapterAudio
 from ..models.audiobook_project import AudiobookProject
 from ..models.voice_profile import VoiceProfile
+from ..utils.audio_utils import concat_wav_files
 from ..utils.glyph_tracer import create_glyph_commit
 from ..utils.temp_manager import TemporaryDirectory
 
@@ -141,16 +142,13 @@ class AudioBuilder:
             tts = self._get_tts(voice_profile)
             chunks = self._chunk_ssml(ssml_text, max_seconds=28.0)
 
-            combined = AudioSegment.empty()
             for i, chunk in enumerate(chunks):
                 chunk_path = tmpdir / f"chunk_{i}.wav"
                 self._synthesize_with_retry(tts, chunk, chunk_path, voice_profile)
-                segment = AudioSegment.from_wav(chunk_path)
-                combined += segment
-                raw_chunks.append(str(chunk_path))
+                raw_chunks.append(chunk_path)
 
-            # Export raw full chapter
-            combined.export(final_raw, format="wav")
+            # Export raw full chapter by appending chunk frames to the file
+            concat_wav_files(raw_chunks, final_raw)
             glyph_raw = create_glyph_commit(
                 content=f"Raw audio synthesis for chapter {chapter_number}",
                 metadata={
@@ -162,7 +160,8 @@ class AudioBuilder:
                 }
             )
 
-            # Normalization (EBU R128 –16 LUFS)
+            # Normalization (EBU R128 –16 LUFS) works on the whole chapter, loaded once
+            combined = AudioSegment.from_wav(final_raw)
             if effects:
                 normalized = effects.normalize(combined)
             else:
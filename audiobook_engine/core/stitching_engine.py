@@ -1,15 +1,8 @@
-import os
-import hashlib
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List
 from uuid import UUID
 
-try:
-    from pydub import AudioSegment
-except ImportError:
-    AudioSegment = None
-
 try:
     from loguru import logger
 except ImportError:
@@ -18,6 +11,8 @@ except ImportError:
 
 from ..models.audiobook_project import AudiobookProject
 from ..models.chapter_audio import ChapterAudio
+from ..utils.audio_utils import write_m4b_with_chapters
+from ..utils.checksum import calculate_file_checksum
 from ..utils.glyph_tracer import create_glyph_commit
 
 
@@ -36,22 +31,14 @@ class StitchingEngine:
         self.output_dir = Path("storage/audiobooks")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _merge_audio(self, chapters: List[ChapterAudio]) -> (AudioSegment, List[dict]):
+    def _chapter_markers(self, chapters: List[ChapterAudio]) -> List[dict]:
         """
-        Combine normalized chapter WAVs into one long AudioSegment.
-        Returns merged audio + chapter marker metadata.
+        Chapter marker metadata, with start times accumulated from chapter durations.
         """
-        if not AudioSegment:
-            raise ImportError("pydub not available - required for audio stitching")
-
-        combined = AudioSegment.empty()
         chapter_markers = []
         current_start = 0.0
 
         for ch in chapters:
-            seg = AudioSegment.from_wav(ch.normalized_audio_path)
-            combined += seg
-
             chapter_markers.append({
                 "chapter": ch.chapter_number,
                 "title": f"Chapter {ch.chapter_number}",
@@ -62,7 +49,7 @@ class StitchingEngine:
 
             current_start += ch.duration_sec
 
-        return combined, chapter_markers
+        return chapter_markers
 
     def stitch_m4b(
         self,
@@ -75,13 +62,20 @@ class StitchingEngine:
         # Sort chapters 1 → N
         chapters_sorted = sorted(chapters, key=lambda c: c.chapter_number)
 
-        merged_audio, chapter_markers = self._merge_audio(chapters_sorted)
+        chapter_markers = self._chapter_markers(chapters_sorted)
 
+        # ffmpeg streams the chapter WAVs into the encoder one after another,
+        # so memory stays flat however long the book is
         out_path = self.output_dir / f"{project.id}.m4b"
-        merged_audio.export(out_path, format="mp4", codec="aac")
+        write_m4b_with_chapters(
+            [Path(ch.normalized_audio_path) for ch in chapters_sorted],
+            chapter_markers,
+            out_path,
+            metadata={"title": project.title, "artist": project.author, "album": project.title}
+        )
 
-        # Build checksum
-        checksum = hashlib.sha256(out_path.read_bytes()).hexdigest()
+        # Build checksum (the MP4 muxer seeks back to finish the file, so hash it in chunks afterwards)
+        checksum = calculate_file_checksum(out_path)
 
         # Master glyph lineage
         glyph_master = create_glyph_commit(
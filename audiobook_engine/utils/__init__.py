@@ -9,7 +9,8 @@ from .ssml_utils import (
 )
 from .audio_utils import (
     get_audio_info, convert_audio_format, mix_audio_channels,
-    detect_silence, split_audio_by_silence
+    detect_silence, split_audio_by_silence, concat_wav_files,
+    write_m4b_with_chapters
 )
 from .checksum import (
     calculate_file_checksum, calculate_data_checksum,
@@ -29,7 +30,8 @@ __all__ = [
 
     # Audio Utils
     "get_audio_info", "convert_audio_format", "mix_audio_channels",
-    "detect_silence", "split_audio_by_silence",
+    "detect_silence", "split_audio_by_silence", "concat_wav_files",
+    "write_m4b_with_chapters",
 
     # Checksum
     "calculate_file_checksum", "calculate_data_checksum",
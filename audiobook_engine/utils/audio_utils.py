@@ -12,6 +12,8 @@ from pathlib import Path
 
 import numpy as np
 
+from book_builder.book_builder import HashingWriter
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -139,6 +141,142 @@ def convert_audio_format(
         return False
 
 
+def concat_wav_files(
+    input_paths: List[Path],
+    output_path: Path,
+    silence_sec: float = 0.0,
+    block_frames: int = 1 << 16
+) -> Tuple[float, str]:
+    """
+    Concatenate WAV files into one WAV file without loading them into memory.
+
+    Frames are copied in blocks of `block_frames`, so memory use does not grow
+    with the total length. The output size is known from the input headers and
+    written up front, which lets the SHA-256 checksum be computed as the bytes
+    are written instead of reading the file back.
+
+    Args:
+        input_paths: WAV files in output order, all with the same format
+        output_path: Output WAV file path
+        silence_sec: Silence inserted between consecutive files
+        block_frames: Frames copied per read/write
+
+    Returns:
+        Tuple of (duration in seconds, SHA-256 checksum of the output file)
+
+    Raises:
+        ValueError: If there are no inputs or their formats differ
+    """
+    import wave
+
+    if not input_paths:
+        raise ValueError("No WAV files to concatenate")
+
+    params = None
+    total_frames = 0
+    for input_path in input_paths:
+        with wave.open(str(input_path), 'rb') as wav_in:
+            file_params = (wav_in.getnchannels(), wav_in.getsampwidth(), wav_in.getframerate())
+            if params is None:
+                params = file_params
+            elif file_params != params:
+                raise ValueError(f"{input_path} has format {file_params}, expected {params}")
+            total_frames += wav_in.getnframes()
+
+    channels, sample_width, sample_rate = params
+    silence_frames = int(round(silence_sec * sample_rate))
+    total_frames += silence_frames * (len(input_paths) - 1)
+    silence = b"\x00" * (silence_frames * channels * sample_width)
+
+    with open(output_path, 'wb') as f:
+        writer = HashingWriter(f)
+        with wave.open(writer, 'wb') as wav_out:
+            wav_out.setnchannels(channels)
+            wav_out.setsampwidth(sample_width)
+            wav_out.setframerate(sample_rate)
+            wav_out.setnframes(total_frames)  # exact size, so the header is never patched
+
+            for i, input_path in enumerate(input_paths):
+                if i > 0 and silence:
+                    wav_out.writeframesraw(silence)
+                with wave.open(str(input_path), 'rb') as wav_in:
+                    while frames := wav_in.readframes(block_frames):
+                        wav_out.writeframesraw(frames)
+
+    return total_frames / sample_rate, writer.hexdigest()
+
+
+def _ffmetadata_escape(value: str) -> str:
+    """Escape a value for an ffmpeg metadata file."""
+    for char in ('\\', '=', ';', '#', '\n'):
+        value = value.replace(char, '\\' + char)
+    return value
+
+
+def write_m4b_with_chapters(
+    input_paths: List[Path],
+    chapter_markers: List[Dict[str, Any]],
+    output_path: Path,
+    bitrate: str = '64k',
+    metadata: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    Encode WAV files into one chaptered M4B with the ffmpeg concat demuxer.
+
+    ffmpeg reads the inputs sequentially and streams them through the AAC
+    encoder, so neither the inputs nor the output are held in memory.
+
+    Args:
+        input_paths: WAV files in chapter order
+        chapter_markers: One dict per chapter with "title", "start_sec" and "duration_sec"
+        output_path: Output M4B file path
+        bitrate: AAC bitrate
+        metadata: Global tags such as title, artist or album
+
+    Raises:
+        RuntimeError: If ffmpeg is not installed or fails
+    """
+    import shutil
+    import subprocess
+    import tempfile
+
+    if shutil.which('ffmpeg') is None:
+        raise RuntimeError("ffmpeg not available - required for M4B export")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        concat_list = Path(tmpdir) / "inputs.txt"
+        with open(concat_list, 'w', encoding='utf-8') as f:
+            for input_path in input_paths:
+                escaped = str(Path(input_path).resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        metadata_file = Path(tmpdir) / "metadata.txt"
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            f.write(";FFMETADATA1\n")
+            for key, value in (metadata or {}).items():
+                f.write(f"{key}={_ffmetadata_escape(str(value))}\n")
+            for marker in chapter_markers:
+                start_ms = int(round(marker["start_sec"] * 1000))
+                end_ms = int(round((marker["start_sec"] + marker["duration_sec"]) * 1000))
+                f.write("[CHAPTER]\nTIMEBASE=1/1000\n")
+                f.write(f"START={start_ms}\nEND={end_ms}\n")
+                f.write(f"title={_ffmetadata_escape(marker['title'])}\n")
+
+        cmd = [
+            'ffmpeg', '-y', '-v', 'error',
+            '-f', 'concat', '-safe', '0', '-i', str(concat_list),
+            '-f', 'ffmetadata', '-i', str(metadata_file),
+            '-map', '0:a', '-map_metadata', '1', '-map_chapters', '1',
+            '-c:a', 'aac', '-b:a', bitrate,
+            '-f', 'mp4', str(output_path)
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"M4B export failed: {result.stderr}")
+
+    logger.info(f"Wrote {len(chapter_markers)} chapters to {output_path}")
+
+
 def mix_audio_channels(audio_data: np.ndarray, mix_type: str = 'stereo') -> np.ndarray:
     """
     Mix audio channels.
@@ -3,17 +3,58 @@
 Query endpoints for SKG
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from app.security.auth import dual_auth
+from app.core.triple_store import get_triple_store, parse_sparql
+from app.core.vector_store import get_embedder, get_vector_index
 
 router = APIRouter()
 
+MAX_VECTOR_RESULTS = 100
+
 @router.post("/sparql")
 async def sparql_query(query: str, token: dict = Depends(dual_auth)):
-    """Execute SPARQL query"""
-    return {"results": [], "query": query}
+    """Execute a SPARQL SELECT over a basic graph pattern"""
+    try:
+        variables, patterns, limit = parse_sparql(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    bindings = await run_in_threadpool(get_triple_store().query, patterns, limit)
+    if variables:
+        bindings = [{var: binding.get(var) for var in variables} for binding in bindings]
+
+    return {"results": bindings, "query": query}
 
 @router.post("/vector")
-async def vector_search(query: str, token: dict = Depends(dual_auth)):
+async def vector_search(query: str, k: int = Query(10, ge=1, le=MAX_VECTOR_RESULTS), token: dict = Depends(dual_auth)):
     """Vector similarity search"""
-    return {"results": [], "query": query}
\ No newline at end of file
+    def search():
+        return get_vector_index().search(get_embedder().embed(query), k)
+
+    matches = await run_in_threadpool(search)
+    return {
+        "results": [{"id": item_id, "score": score} for item_id, score in matches],
+        "query": query
+    }
+
+@router.post("/vector/ingest")
+async def vector_ingest(data: dict, token: dict = Depends(dual_auth)):
+    """Add or replace items ({"id", "text"}) in the vector index"""
+    items = data.get("items", [])
+    if any("id" not in item or "text" not in item for item in items):
+        raise HTTPException(status_code=400, detail="Each item needs an id and text")
+
+    def ingest():
+        vectors = get_embedder().embed_batch([item["text"] for item in items])
+        return get_vector_index().add([str(item["id"]) for item in items], vectors)
+
+    added = await run_in_threadpool(ingest)
+    return {"status": "ingested", "count": added}
+
+@router.delete("/vector/{item_id}")
+async def vector_delete(item_id: str, token: dict = Depends(dual_auth)):
+    """Remove an item from the vector index"""
+    removed = await run_in_threadpool(get_vector_index().delete, [item_id])
+    return {"status": "deleted" if removed else "not_found", "id": item_id}
@@ -3,17 +3,40 @@
 Triple store endpoints for SKG
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from app.security.auth import dual_auth
+from app.core.triple_store import get_triple_store
 
 router = APIRouter()
 
+MAX_SEARCH_RESULTS = 1000
+
+def _parse_triple(triple) -> tuple:
+    """Accept {"subject", "predicate", "object"} objects or [s, p, o] lists"""
+    if isinstance(triple, dict):
+        return (triple["subject"], triple["predicate"], triple["object"])
+    if isinstance(triple, (list, tuple)) and len(triple) == 3:
+        return tuple(triple)
+    raise ValueError(f"Invalid triple: {triple!r}")
+
 @router.post("/ingest")
 async def ingest_triples(data: dict, token: dict = Depends(dual_auth)):
     """Ingest triples into knowledge graph"""
-    return {"status": "ingested", "count": len(data.get("triples", []))}
+    try:
+        triples = [_parse_triple(triple) for triple in data.get("triples", [])]
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Malformed triples: {e}")
+
+    added = await run_in_threadpool(get_triple_store().ingest, triples)
+    return {"status": "ingested", "count": len(triples), "added": added}
 
 @router.get("/search")
-async def search_triples(q: str, token: dict = Depends(dual_auth)):
-    """Search triples"""
-    return {"results": [], "query": q}
\ No newline at end of file
+async def search_triples(
+    q: str,
+    limit: int = Query(100, ge=1, le=MAX_SEARCH_RESULTS),
+    token: dict = Depends(dual_auth)
+):
+    """Search triples whose subject or object starts with the query text"""
+    results = await run_in_threadpool(get_triple_store().search, q, limit)
+    return {"results": results, "query": q}
@@ -54,6 +54,9 @@ class Settings(BaseSettings):
     # Storage
     STORAGE_DIR: Path = Path("storage")
     VIDEOS_DIR: Path = STORAGE_DIR / "videos"
+    TRIPLE_STORE_PATH: Path = STORAGE_DIR / "skg_triples.db"
+    VECTOR_INDEX_DIR: Path = STORAGE_DIR / "vector_index"
+    VECTOR_DIM: int = 256
 
     # JWT Configuration
     JWT_SECRET_KEY: str = "your_jwt_secret_key_here"
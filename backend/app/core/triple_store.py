@@ -0,0 +1,394 @@
+# backend/app/core/triple_store.py
+"""
+Embedded SKG triple store
+
+Terms are dictionary-encoded to integer IDs and triples are kept in SQLite
+under three covering permutation indexes (SPO, POS, OSP), so any pattern
+with at least one bound position is answered by an index range scan.
+Basic graph patterns are evaluated as index nested-loop joins, ordered
+greedily by estimated selectivity.
+"""
+
+import re
+import sqlite3
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.config import settings
+
+Triple = Tuple[str, str, str]
+Pattern = Tuple[str, str, str]
+
+# Upper bound on rows counted when estimating a pattern's cardinality
+ESTIMATE_CAP = 10000
+
+# SQLite limits the number of host parameters per statement
+MAX_PARAMS = 900
+
+# Rows fetched per lock acquisition while streaming a scan
+SCAN_CHUNK = 1000
+
+POSITIONS = ("s", "p", "o")
+
+
+def is_variable(term: str) -> bool:
+    """Pattern terms starting with ? or $ are variables"""
+    return term.startswith(("?", "$"))
+
+
+def _check_limit(limit: int):
+    """SQLite treats a negative LIMIT as unbounded, so only positive limits are accepted"""
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+
+class TripleStore:
+    """SQLite-backed triple store with SPO/POS/OSP permutation indexes"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize triple store schema"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS terms (
+                    id INTEGER PRIMARY KEY,
+                    value TEXT NOT NULL UNIQUE
+                )
+            """)
+
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS triples (
+                    s INTEGER NOT NULL,
+                    p INTEGER NOT NULL,
+                    o INTEGER NOT NULL,
+                    PRIMARY KEY (s, p, o)
+                ) WITHOUT ROWID
+            """)
+
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pos ON triples(p, o, s)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_osp ON triples(o, s, p)")
+
+    # ------------------------------------------------------------------
+    # Term dictionary
+    # ------------------------------------------------------------------
+
+    def _lookup_ids(self, values: Sequence[str]) -> Dict[str, int]:
+        """Map known term values to their IDs"""
+        ids = {}
+        unique = list(dict.fromkeys(values))
+        for start in range(0, len(unique), MAX_PARAMS):
+            chunk = unique[start:start + MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT value, id FROM terms WHERE value IN ({placeholders})", chunk
+            )
+            ids.update(rows)
+        return ids
+
+    def _lookup_values(self, ids: Iterable[int]) -> Dict[int, str]:
+        """Map term IDs back to their values"""
+        values = {}
+        unique = list(set(ids))
+        for start in range(0, len(unique), MAX_PARAMS):
+            chunk = unique[start:start + MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT id, value FROM terms WHERE id IN ({placeholders})", chunk
+            )
+            values.update(rows)
+        return values
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def ingest(self, triples: Iterable[Triple], batch_size: int = 10000) -> int:
+        """
+        Stream triples into the store in batches
+
+        Args:
+            triples: Iterable of (subject, predicate, object) strings
+            batch_size: Triples encoded and written per transaction
+
+        Returns:
+            Number of triples that were not already present
+        """
+        added = 0
+        iterator = iter(triples)
+
+        while True:
+            batch = [tuple(str(term) for term in triple) for triple in islice(iterator, batch_size)]
+            if not batch:
+                break
+
+            with self._lock, self.conn:
+                terms = [term for triple in batch for term in triple]
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO terms (value) VALUES (?)",
+                    ((term,) for term in dict.fromkeys(terms))
+                )
+                ids = self._lookup_ids(terms)
+
+                before = self.conn.total_changes
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)",
+                    ((ids[s], ids[p], ids[o]) for s, p, o in batch)
+                )
+                added += self.conn.total_changes - before
+
+        return added
+
+    # ------------------------------------------------------------------
+    # Pattern lookups
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _where(bound: Dict[str, int]) -> Tuple[str, List[int]]:
+        if not bound:
+            return "", []
+        clause = " AND ".join(f"{position} = ?" for position in bound)
+        return f" WHERE {clause}", list(bound.values())
+
+    def _scan(self, bound: Dict[str, int], limit: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        """Index range scan for triples matching the bound positions"""
+        where, params = self._where(bound)
+        sql = f"SELECT s, p, o FROM triples{where}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+            rows = cursor.fetchmany(SCAN_CHUNK)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cursor.fetchmany(SCAN_CHUNK)
+
+    def _estimate(self, bound: Dict[str, int]) -> int:
+        """Cardinality estimate for a pattern, capped at ESTIMATE_CAP"""
+        where, params = self._where(bound)
+        with self._lock:
+            return self.conn.execute(
+                f"SELECT COUNT(*) FROM (SELECT 1 FROM triples{where} LIMIT ?)",
+                params + [ESTIMATE_CAP]
+            ).fetchone()[0]
+
+    def match(self, subject: Optional[str] = None, predicate: Optional[str] = None,
+              obj: Optional[str] = None, limit: int = 100) -> List[Dict[str, str]]:
+        """Return triples matching the given subject, predicate and/or object"""
+        _check_limit(limit)
+        constants = {position: value for position, value in zip(POSITIONS, (subject, predicate, obj))
+                     if value is not None}
+        with self._lock:
+            ids = self._lookup_ids(list(constants.values()))
+        if len(ids) < len(set(constants.values())):
+            return []
+
+        rows = list(self._scan({position: ids[value] for position, value in constants.items()}, limit))
+        return self._decode_triples(rows)
+
+    def search(self, text: str, limit: int = 100) -> List[Dict[str, str]]:
+        """Triples whose subject or object starts with the given text"""
+        _check_limit(limit)
+        with self._lock:
+            term_ids = [row[0] for row in self.conn.execute(
+                "SELECT id FROM terms WHERE value >= ? AND value < ? LIMIT ?",
+                (text, text + "\U0010ffff", MAX_PARAMS)
+            )]
+
+        rows: List[Tuple[int, int, int]] = []
+        seen = set()
+        for position in ("s", "o"):
+            for term_id in term_ids:
+                for row in self._scan({position: term_id}, limit - len(rows)):
+                    if row not in seen:
+                        seen.add(row)
+                        rows.append(row)
+                if len(rows) >= limit:
+                    return self._decode_triples(rows)
+
+        return self._decode_triples(rows)
+
+    def _decode_triples(self, rows: List[Tuple[int, int, int]]) -> List[Dict[str, str]]:
+        with self._lock:
+            values = self._lookup_values(term for row in rows for term in row)
+        return [
+            {"subject": values[s], "predicate": values[p], "object": values[o]}
+            for s, p, o in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Basic graph pattern queries
+    # ------------------------------------------------------------------
+
+    def _plan(self, patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order patterns for evaluation.
+
+        Start from the most selective pattern, then keep choosing the most
+        selective pattern that shares a variable with those already bound,
+        so intermediate results stay small and cartesian products are
+        deferred to the end.
+        """
+        for pattern in patterns:
+            pattern["estimate"] = self._estimate(pattern["constants"])
+
+        remaining = list(patterns)
+        ordered = []
+        bound_vars: set = set()
+        while remaining:
+            best = min(remaining, key=lambda pattern: (
+                bool(bound_vars) and not (pattern["variables"].keys() & bound_vars),
+                pattern["estimate"]
+            ))
+            remaining.remove(best)
+            ordered.append(best)
+            bound_vars.update(best["variables"])
+        return ordered
+
+    def query(self, patterns: Sequence[Pattern], limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Evaluate a basic graph pattern
+
+        Args:
+            patterns: (subject, predicate, object) patterns; terms starting
+                with ? or $ are variables
+            limit: Maximum number of solutions
+
+        Returns:
+            Variable bindings (without the ? prefix) for each solution
+        """
+        constants = [term for pattern in patterns for term in pattern if not is_variable(term)]
+        with self._lock:
+            ids = self._lookup_ids(constants)
+        if len(ids) < len(set(constants)):
+            return []  # A constant that was never ingested cannot match
+
+        compiled = []
+        for pattern in patterns:
+            compiled_pattern = {"constants": {}, "variables": {}}
+            for position, term in zip(POSITIONS, pattern):
+                if is_variable(term):
+                    compiled_pattern["variables"].setdefault(term[1:], []).append(position)
+                else:
+                    compiled_pattern["constants"][position] = ids[term]
+            compiled.append(compiled_pattern)
+
+        ordered = self._plan(compiled)
+        solutions = list(islice(self._solve(ordered, 0, {}), limit))
+
+        with self._lock:
+            values = self._lookup_values(term_id for solution in solutions for term_id in solution.values())
+        return [{var: values[term_id] for var, term_id in solution.items()} for solution in solutions]
+
+    def _solve(self, ordered: List[Dict[str, Any]], depth: int,
+               binding: Dict[str, int]) -> Iterator[Dict[str, int]]:
+        """Depth-first index nested-loop join over the ordered patterns"""
+        if depth == len(ordered):
+            yield dict(binding)
+            return
+
+        pattern = ordered[depth]
+        bound = dict(pattern["constants"])
+        for var, positions in pattern["variables"].items():
+            if var in binding:
+                for position in positions:
+                    bound[position] = binding[var]
+
+        for row in self._scan(bound):
+            triple = dict(zip(POSITIONS, row))
+            extended = dict(binding)
+            consistent = True
+            for var, positions in pattern["variables"].items():
+                values = {triple[position] for position in positions}
+                if len(values) > 1 or extended.setdefault(var, values.pop()) != triple[positions[0]]:
+                    consistent = False
+                    break
+            if consistent:
+                yield from self._solve(ordered, depth + 1, extended)
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM triples").fetchone()[0]
+
+
+# ----------------------------------------------------------------------
+# Minimal SPARQL support: SELECT over a basic graph pattern
+# ----------------------------------------------------------------------
+
+SPARQL_SELECT = re.compile(
+    r"^\s*SELECT\s+(?P<vars>\*|(?:[?$]\w+\s*)+)\s*WHERE\s*\{(?P<body>.*)\}\s*(?:LIMIT\s+(?P<limit>\d+))?\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+SPARQL_TERM = re.compile(r'<[^>]*>|"(?:[^"\\]|\\.)*"|[?$]\w+|[^\s.;,]+|\.')
+
+
+def _sparql_term(token: str) -> str:
+    """Strip IRI brackets and literal quotes from a SPARQL token"""
+    if token.startswith("<") and token.endswith(">"):
+        return token[1:-1]
+    if token.startswith('"') and token.endswith('"'):
+        return token[1:-1].replace('\\"', '"')
+    return token
+
+
+def parse_sparql(query: str) -> Tuple[List[str], List[Pattern], Optional[int]]:
+    """
+    Parse `SELECT ?vars WHERE { s p o . ... } [LIMIT n]`
+
+    Returns:
+        Projected variable names (empty for *), triple patterns and limit
+
+    Raises:
+        ValueError: If the query is outside the supported subset
+    """
+    match = SPARQL_SELECT.match(query)
+    if not match:
+        raise ValueError("Only SELECT ... WHERE { basic graph pattern } [LIMIT n] queries are supported")
+
+    variables = [] if match.group("vars").strip() == "*" else [
+        var[1:] for var in match.group("vars").split()
+    ]
+
+    tokens = SPARQL_TERM.findall(match.group("body"))
+    patterns: List[Pattern] = []
+    current: List[str] = []
+    for token in tokens + ["."]:
+        if token == ".":
+            if current:
+                if len(current) != 3:
+                    raise ValueError(f"Malformed triple pattern: {' '.join(current)}")
+                patterns.append(tuple(current))
+                current = []
+            continue
+        current.append(_sparql_term(token))
+
+    if not patterns:
+        raise ValueError("Query has no triple patterns")
+
+    limit = int(match.group("limit")) if match.group("limit") else None
+    return variables, patterns, limit
+
+
+_store: Optional[TripleStore] = None
+_store_lock = threading.Lock()
+
+
+def get_triple_store() -> TripleStore:
+    """Process-wide triple store instance"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TripleStore(settings.TRIPLE_STORE_PATH)
+        return _store
@@ -0,0 +1,28 @@
+# backend/app/core/vector_store.py
+"""
+Shared vector index for SKG semantic lookup
+"""
+
+import threading
+from typing import Optional
+
+from knowledge.vector_index import VectorIndex, HashingEmbedder
+from app.config import settings
+
+_index: Optional[VectorIndex] = None
+_embedder = HashingEmbedder(settings.VECTOR_DIM)
+_index_lock = threading.Lock()
+
+
+def get_embedder() -> HashingEmbedder:
+    """Text embedder matching the index dimensionality"""
+    return _embedder
+
+
+def get_vector_index() -> VectorIndex:
+    """Process-wide vector index instance"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = VectorIndex(settings.VECTOR_INDEX_DIR, dim=settings.VECTOR_DIM)
+        return _index
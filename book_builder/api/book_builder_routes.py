@@ -5,6 +5,7 @@ FastAPI endpoints for book creation workflow
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -212,6 +213,40 @@ async def export_book(book_id: str, request: ExportRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to export book: {str(e)}")
 
+@router.post("/export-all/{book_id}")
+async def export_book_all_formats(book_id: str):
+    """Export compiled book to EPUB, HTML, TXT and JSON concurrently"""
+    if book_id not in active_books:
+        raise HTTPException(status_code=404, detail="Book not found")
+
+    book_data = active_books[book_id]
+    compiled_book = book_data.get("compiled")
+
+    if not compiled_book:
+        raise HTTPException(status_code=400, detail="Book not compiled yet")
+
+    try:
+        output_dir = Path("deliverables") / "book_builder"
+        basename = f"{compiled_book.title.replace(' ', '_')}_{book_id}"
+        exports = await run_in_threadpool(book_builder.export_formats, compiled_book, output_dir, basename)
+
+        book_data["exports"].extend(exports.values())
+
+        return {
+            "exports": {
+                fmt.value: {
+                    "export": asdict(book_export),
+                    "download_url": f"/api/book-builder/download/{book_id}/{Path(book_export.file_path).name}"
+                }
+                for fmt, book_export in exports.items()
+            },
+            "status": "book_exported",
+            "book_id": book_id
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to export book: {str(e)}")
+
 @router.get("/download/{book_id}/{filename}")
 async def download_book(book_id: str, filename: str):
     """Download exported book file"""
@@ -7,9 +7,11 @@ OUTLINE → CHAPTERS → COMPILE → EXPORT
 import os
 import json
 import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -121,9 +123,30 @@ class BookExport:
     exported_at: str
     metadata: Dict[str, Any]
 
+class HashingWriter:
+    """Write-through tee that hashes and counts bytes on their way to a file"""
+
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def hexdigest(self) -> str:
+        return self.sha256.hexdigest()
+
 class BookBuilder:
     """Core book building engine"""
 
+    DEFAULT_EXPORT_FORMATS = (ExportFormat.EPUB, ExportFormat.HTML, ExportFormat.TXT, ExportFormat.JSON)
+
     def __init__(self):
         self.templates_path = Path(__file__).parent / "templates"
         self.templates_path.mkdir(exist_ok=True)
@@ -434,20 +457,17 @@ The future belongs to those who learn, adapt, and take action.
             # Placeholder for PDF, DOCX (would require additional libraries)
             content = self._export_as_txt(compiled_book)
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        # Generate checksum
-        import hashlib
-        checksum = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        # Write to file, hashing on the way out
+        with open(output_path, 'wb') as f:
+            writer = HashingWriter(f)
+            writer.write(content.encode('utf-8'))
 
         export = BookExport(
             book_id=str(uuid.uuid4()),
             format=format,
             file_path=str(output_path),
-            file_size=len(content.encode('utf-8')),
-            checksum_sha256=checksum,
+            file_size=writer.size,
+            checksum_sha256=writer.hexdigest(),
             exported_at=datetime.utcnow().isoformat() + "Z",
             metadata={
                 "book_title": compiled_book.title,
@@ -460,6 +480,25 @@ The future belongs to those who learn, adapt, and take action.
 
         return export
 
+    def export_formats(self, compiled_book: CompiledBook, output_dir: Path, basename: str,
+                       formats: Optional[List[ExportFormat]] = None) -> Dict[ExportFormat, BookExport]:
+        """
+        Export one compiled book to several formats concurrently
+
+        Each format renders from the same CompiledBook straight to
+        output_dir/basename.<format>; defaults to EPUB, HTML, TXT and JSON.
+        """
+        formats = list(formats or self.DEFAULT_EXPORT_FORMATS)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {
+                fmt: executor.submit(self.export_book, compiled_book, fmt, output_dir / f"{basename}.{fmt.value}")
+                for fmt in formats
+            }
+            return {fmt: future.result() for fmt, future in futures.items()}
+
     def _export_as_txt(self, book: CompiledBook) -> str:
         """Export book as plain text"""
         lines = []
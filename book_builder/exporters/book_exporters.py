@@ -4,17 +4,16 @@ GOAT Book Builder - Advanced Export Formats
 HTML → EPUB/M4B converter and enhanced export pipeline
 """
 
+import io
 import os
 import json
 import zipfile
-import tempfile
-import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import asdict
 from datetime import datetime
 
-from ..book_builder import CompiledBook, BookExport, ExportFormat
+from ..book_builder import CompiledBook, BookExport, ExportFormat, HashingWriter
 
 class EPUBExporter:
     """EPUB format exporter with full eBook standards compliance"""
@@ -23,37 +22,33 @@ class EPUBExporter:
         self.templates_path = Path(__file__).parent / "templates"
         self.templates_path.mkdir(exist_ok=True)
 
-    def export_epub(self, book: CompiledBook, output_path: Path) -> BookExport:
-        """Export book as EPUB format"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            epub_dir = Path(temp_dir) / "epub"
-            epub_dir.mkdir()
+    def render_epub(self, book: CompiledBook) -> bytes:
+        """Render the complete EPUB archive in memory"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as epub_zip:
+            # mimetype must be the first entry and uncompressed
+            epub_zip.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
 
-            # Create EPUB structure
-            self._create_epub_structure(epub_dir, book)
+            for arcname, content in self._create_epub_structure(book).items():
+                epub_zip.writestr(arcname, content)
 
-            # Create EPUB file (ZIP with .epub extension)
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as epub_zip:
-                # Add mimetype first (must be uncompressed)
-                mimetype_path = epub_dir / "mimetype"
-                epub_zip.write(mimetype_path, "mimetype", zipfile.ZIP_STORED)
+        return buffer.getvalue()
 
-                # Add all other files
-                for file_path in epub_dir.rglob('*'):
-                    if file_path.is_file() and file_path.name != "mimetype":
-                        epub_zip.write(file_path, file_path.relative_to(epub_dir))
+    def export_epub(self, book: CompiledBook, output_path: Path) -> BookExport:
+        """Export book as EPUB format"""
+        epub_data = self.render_epub(book)
 
-        # Generate checksum
-        import hashlib
-        with open(output_path, 'rb') as f:
-            checksum = hashlib.sha256(f.read()).hexdigest()
+        # Checksum is taken as the bytes go out, not by re-reading the file
+        with open(output_path, 'wb') as f:
+            writer = HashingWriter(f)
+            writer.write(epub_data)
 
         export = BookExport(
             book_id=f"{book.title.lower().replace(' ', '_')}_epub",
             format=ExportFormat.EPUB,
             file_path=str(output_path),
-            file_size=output_path.stat().st_size,
-            checksum_sha256=checksum,
+            file_size=writer.size,
+            checksum_sha256=writer.hexdigest(),
             exported_at=datetime.utcnow().isoformat() + "Z",
             metadata={
                 "book_title": book.title,
@@ -68,28 +63,22 @@ class EPUBExporter:
 
         return export
 
-    def _create_epub_structure(self, epub_dir: Path, book: CompiledBook):
-        """Create the complete EPUB directory structure"""
-
-        # 1. mimetype file (must be first and uncompressed)
-        (epub_dir / "mimetype").write_text("application/epub+zip")
+    def _create_epub_structure(self, book: CompiledBook) -> Dict[str, str]:
+        """Render every EPUB part (except mimetype), keyed by archive path"""
+        parts: Dict[str, str] = {}
 
-        # 2. META-INF directory
-        meta_inf = epub_dir / "META-INF"
-        meta_inf.mkdir()
-        self._create_container_xml(meta_inf)
+        # META-INF directory
+        self._create_container_xml(parts)
 
-        # 3. OEBPS directory (Open EBook Publication Structure)
-        oebps = epub_dir / "OEBPS"
-        oebps.mkdir()
+        # OEBPS directory (Open EBook Publication Structure)
+        self._create_content_opf(parts, book)
+        self._create_toc_ncx(parts, book)
+        self._create_styles_css(parts)
+        self._create_chapters_xhtml(parts, book)
 
-        # Create content files
-        self._create_content_opf(oebps, book)
-        self._create_toc_ncx(oebps, book)
-        self._create_styles_css(oebps)
-        self._create_chapters_xhtml(oebps, book)
+        return parts
 
-    def _create_container_xml(self, meta_inf: Path):
+    def _create_container_xml(self, parts: Dict[str, str]):
         """Create META-INF/container.xml"""
         container_xml = '''<?xml version="1.0" encoding="UTF-8"?>
 <container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
@@ -97,9 +86,9 @@ class EPUBExporter:
         <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
     </rootfiles>
 </container>'''
-        (meta_inf / "container.xml").write_text(container_xml)
+        parts["META-INF/container.xml"] = container_xml
 
-    def _create_content_opf(self, oebps: Path, book: CompiledBook):
+    def _create_content_opf(self, parts: Dict[str, str], book: CompiledBook):
         """Create OEBPS/content.opf (package document)"""
         manifest_items = []
         spine_items = []
@@ -151,9 +140,9 @@ class EPUBExporter:
     </spine>
 </package>'''
 
-        (oebps / "content.opf").write_text(content_opf)
+        parts["OEBPS/content.opf"] = content_opf
 
-    def _create_toc_ncx(self, oebps: Path, book: CompiledBook):
+    def _create_toc_ncx(self, parts: Dict[str, str], book: CompiledBook):
         """Create OEBPS/toc.ncx (navigation control file)"""
         nav_points = []
 
@@ -184,9 +173,9 @@ class EPUBExporter:
     </navMap>
 </ncx>'''
 
-        (oebps / "toc.ncx").write_text(toc_ncx)
+        parts["OEBPS/toc.ncx"] = toc_ncx
 
-    def _create_styles_css(self, oebps: Path):
+    def _create_styles_css(self, parts: Dict[str, str]):
         """Create OEBPS/styles.css"""
         styles_css = '''/* GOAT Book Builder EPUB Styles */
 
@@ -276,9 +265,9 @@ pre {
     border-bottom: 1px solid #ccc;
     padding-bottom: 0.5em;
 }'''
-        (oebps / "styles.css").write_text(styles_css)
+        parts["OEBPS/styles.css"] = styles_css
 
-    def _create_chapters_xhtml(self, oebps: Path, book: CompiledBook):
+    def _create_chapters_xhtml(self, parts: Dict[str, str], book: CompiledBook):
         """Create individual chapter XHTML files"""
 
         # Foreword
@@ -297,7 +286,7 @@ pre {
     </section>
 </body>
 </html>'''
-            (oebps / "foreword.xhtml").write_text(foreword_html)
+            parts["OEBPS/foreword.xhtml"] = foreword_html
 
         # Introduction
         if book.introduction:
@@ -315,7 +304,7 @@ pre {
     </section>
 </body>
 </html>'''
-            (oebps / "introduction.xhtml").write_text(intro_html)
+            parts["OEBPS/introduction.xhtml"] = intro_html
 
         # Chapters
         for i, chapter in enumerate(book.chapters, 1):
@@ -333,7 +322,7 @@ pre {
     </section>
 </body>
 </html>'''
-            (oebps / f"chapter{i}.xhtml").write_text(chapter_html)
+            parts[f"OEBPS/chapter{i}.xhtml"] = chapter_html
 
         # Conclusion
         if book.conclusion:
@@ -351,7 +340,7 @@ pre {
     </section>
 </body>
 </html>'''
-            (oebps / "conclusion.xhtml").write_text(conclusion_html)
+            parts["OEBPS/conclusion.xhtml"] = conclusion_html
 
 
 class M4BExporter:
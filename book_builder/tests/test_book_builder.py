@@ -105,6 +105,29 @@ class TestBookBuilder:
             assert json_path.exists()
             assert json_export.format == ExportFormat.JSON
 
+    def test_export_all_formats(self):
+        """Test concurrent multi-format export"""
+        import hashlib
+        import zipfile
+
+        outline = self.builder.create_outline(self.sample_input)
+        chapter = self.builder.generate_chapter(outline, 1)
+        compiled = self.builder.compile_book(outline, [chapter])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exports = self.builder.export_formats(compiled, Path(temp_dir), "test_book")
+
+            assert set(exports) == set(BookBuilder.DEFAULT_EXPORT_FORMATS)
+            for export in exports.values():
+                data = Path(export.file_path).read_bytes()
+                assert export.file_size == len(data)
+                assert export.checksum_sha256 == hashlib.sha256(data).hexdigest()
+
+            with zipfile.ZipFile(exports[ExportFormat.EPUB].file_path) as epub:
+                assert epub.namelist()[0] == "mimetype"
+                assert epub.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+                assert "OEBPS/chapter1.xhtml" in epub.namelist()
+
     def test_genre_structures(self):
         """Test different genre structures"""
         genres_to_test = [
@@ -7,16 +7,18 @@ for complete audiobook production
 import os
 import json
 import asyncio
+import hashlib
 import tempfile
 import re
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import wave
 import struct
-import numpy as np
 from datetime import datetime
 
+from book_builder.book_builder import HashingWriter
+
 @dataclass
 class AudiobookSegment:
     """Individual segment of the audiobook"""
@@ -55,6 +57,16 @@ class AudiobookRenderer:
         self.BATCH_SIZE = 1 if cpu_mode else 5       # Chunks to process simultaneously
         self.REST_INTERVAL = 5 if cpu_mode else 1    # Seconds between chunks
 
+        # Chapter scheduling: independent chapters render concurrently, bounded by the TTS
+        # worker processes that do the synthesis (AUDIOBOOK_PARALLEL_CHAPTERS overrides it)
+        tts_pool = getattr(voice_engine, "tts_pool", None)
+        default_parallel = max(1, tts_pool.num_workers) if tts_pool else 1
+        self.MAX_PARALLEL_CHAPTERS = int(os.getenv("AUDIOBOOK_PARALLEL_CHAPTERS", default_parallel))
+        self.CHAPTER_RETRIES = int(os.getenv("AUDIOBOOK_CHAPTER_RETRIES", 2))
+
+        # Per-book rendering progress keyed by output path
+        self.render_progress: Dict[str, Dict[str, Any]] = {}
+
         self.temp_dir = Path("./temp")
         self.temp_dir.mkdir(exist_ok=True)
 
@@ -80,52 +92,218 @@ class AudiobookRenderer:
                 name="default"
             )
 
-        # 3. Process each chapter
-        audiobook_chapters = []
-        total_duration = 0.0
-
-        for chapter_num, chapter_data in enumerate(chapters, 1):
-            print(f"📖 Processing chapter {chapter_num}: {chapter_data['title']}")
-
-            if self.cpu_mode:
-                # Use CPU-safe chunked rendering
-                chapter = await self._render_chapter_cpu_safe(
-                    chapter_data, narrator_profile, chapter_num
-                )
-            else:
-                # Use standard rendering
-                chapter = await self._render_chapter(
-                    chapter_data, narrator_profile, chapter_num
-                )
-
-            audiobook_chapters.append(chapter)
-            total_duration += chapter.total_duration
+        # 3. Render chapters in parallel, resuming chapters already rendered to disk
+        chapter_dir = self._chapter_dir(output_path)
+        chapter_dir.mkdir(parents=True, exist_ok=True)
+        progress = self.render_progress[output_path] = {
+            "status": "rendering",
+            "started_at": datetime.utcnow().isoformat() + "Z",
+            "parallel_chapters": self.MAX_PARALLEL_CHAPTERS,
+            "chapters": {
+                chapter_num: {
+                    "title": chapter_data.get("title"),
+                    "status": "pending",
+                    "attempts": 0,
+                    "chunks_done": 0,
+                    "chunks_total": None,
+                    "error": None
+                }
+                for chapter_num, chapter_data in enumerate(chapters, 1)
+            }
+        }
 
-            # CPU: Add rest between chapters to prevent overheating
-            if self.cpu_mode and chapter_num < len(chapters):
-                print(f"⏸️ Chapter rest period... ({self.REST_INTERVAL * 2} seconds)")
-                await asyncio.sleep(self.REST_INTERVAL * 2)
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_CHAPTERS)
+        results = await asyncio.gather(*[
+            self._render_chapter_resumable(
+                chapter_data, narrator_profile, chapter_num, chapter_dir, semaphore,
+                progress["chapters"][chapter_num]
+            )
+            for chapter_num, chapter_data in enumerate(chapters, 1)
+        ], return_exceptions=True)
+
+        failed = [chapter_num for chapter_num, result in enumerate(results, 1) if isinstance(result, Exception)]
+        if failed:
+            progress["status"] = "failed"
+            raise RuntimeError(
+                f"Chapters {failed} failed after {self.CHAPTER_RETRIES + 1} attempts; "
+                f"rendered chapters are kept in {chapter_dir} and reused on the next run"
+            )
 
-        # 4. Combine chapters into final audiobook
-        final_audio = await self._combine_chapters(audiobook_chapters)
+        # gather() keeps chapter order, so assembly is deterministic however chapters finished
+        audiobook_chapters = list(results)
+        total_duration = sum(chapter.total_duration for chapter in audiobook_chapters)
+        progress["status"] = "assembling"
 
-        # 5. Export final audiobook
-        await self._export_audiobook(final_audio, output_path, book_data, total_duration)
+        # 4-5. Stream the chapters from disk into the final audiobook
+        export = await self._export_audiobook(
+            audiobook_chapters, chapter_dir, output_path, book_data, total_duration
+        )
 
         # 6. Generate metadata
         metadata = self._generate_audiobook_metadata(
             book_data, audiobook_chapters, total_duration
         )
 
+        progress["status"] = "complete"
         print("✅ Audiobook rendering complete!")
         return {
             "output_path": output_path,
             "total_duration": total_duration,
             "chapters": len(audiobook_chapters),
             "total_segments": sum(len(chapter.segments) for chapter in audiobook_chapters),
+            "checksum_sha256": export["checksum_sha256"],
+            "chapter_markers": export["chapter_markers"],
             "metadata": metadata
         }
 
+    async def _render_chapter_resumable(
+        self,
+        chapter_data: Dict[str, Any],
+        narrator_profile,
+        chapter_num: int,
+        chapter_dir: Path,
+        semaphore: asyncio.Semaphore,
+        progress: Dict[str, Any]
+    ) -> AudiobookChapter:
+        """
+        Render a chapter under the scheduler's concurrency limit with retries,
+        or load it from disk if it was rendered by an earlier run
+
+        The chapter audio stays on disk; the returned chapter carries the segment
+        timing and metadata only, so a book never has to fit in memory.
+        """
+        fingerprint = self._chapter_fingerprint(chapter_data, narrator_profile)
+        chapter = self._load_rendered_chapter(chapter_dir, chapter_num, fingerprint)
+        if chapter is not None:
+            print(f"♻️ Resuming chapter {chapter_num} from {chapter_dir}")
+            progress["status"] = "resumed"
+            return chapter
+
+        async with semaphore:
+            for attempt in range(1, self.CHAPTER_RETRIES + 2):
+                print(f"📖 Processing chapter {chapter_num}: {chapter_data['title']} (attempt {attempt})")
+                progress.update(status="rendering", attempts=attempt, chunks_done=0)
+                try:
+                    if self.cpu_mode:
+                        # Use CPU-safe chunked rendering
+                        chapter = await self._render_chapter_cpu_safe(
+                            chapter_data, narrator_profile, chapter_num, progress
+                        )
+                    else:
+                        # Use standard rendering
+                        chapter = await self._render_chapter(
+                            chapter_data, narrator_profile, chapter_num
+                        )
+                    break
+                except Exception as e:
+                    print(f"❌ Chapter {chapter_num} attempt {attempt} failed: {e}")
+                    progress["error"] = str(e)
+                    if attempt > self.CHAPTER_RETRIES:
+                        progress["status"] = "failed"
+                        raise
+                    await asyncio.sleep(self.REST_INTERVAL)
+
+        self._save_rendered_chapter(chapter_dir, chapter, fingerprint)
+        for segment in chapter.segments:
+            segment.audio_data = b""
+        progress.update(status="done", error=None)
+        return chapter
+
+    def _chapter_dir(self, output_path: str) -> Path:
+        """Directory holding the rendered chapters of a book"""
+        output = Path(output_path)
+        return output.parent / f"{output.stem}_chapters"
+
+    def _chapter_fingerprint(self, chapter_data: Dict[str, Any], narrator_profile) -> str:
+        """Hash of everything that determines a chapter's audio, so edited chapters are re-rendered"""
+        key = {
+            "chapter": chapter_data,
+            "narrator": asdict(narrator_profile),
+            "cpu_mode": self.cpu_mode,
+            "chunk_size": self.CHUNK_SIZE
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _save_rendered_chapter(self, chapter_dir: Path, chapter: AudiobookChapter, fingerprint: str):
+        """Write a chapter's audio and manifest; the manifest is written last so partial chapters are never resumed"""
+        stem = f"chapter_{chapter.chapter_number:03d}"
+        with wave.open(str(chapter_dir / f"{stem}.wav"), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            for segment in chapter.segments:
+                wav_file.writeframes(segment.audio_data)
+
+        manifest = {
+            "fingerprint": fingerprint,
+            "chapter_number": chapter.chapter_number,
+            "title": chapter.title,
+            "total_duration": chapter.total_duration,
+            "metadata": chapter.metadata,
+            "segments": [
+                {
+                    "segment_id": segment.segment_id,
+                    "segment_type": segment.segment_type,
+                    "text": segment.text,
+                    "num_bytes": len(segment.audio_data),
+                    "duration": segment.duration,
+                    "start_time": segment.start_time,
+                    "end_time": segment.end_time,
+                    "metadata": segment.metadata
+                }
+                for segment in chapter.segments
+            ]
+        }
+        tmp_path = chapter_dir / f"{stem}.json.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, default=str)
+        os.replace(tmp_path, chapter_dir / f"{stem}.json")
+
+    def _load_rendered_chapter(
+        self,
+        chapter_dir: Path,
+        chapter_num: int,
+        fingerprint: str
+    ) -> Optional[AudiobookChapter]:
+        """Load a chapter rendered by an earlier run, or None if it is missing or stale"""
+        stem = f"chapter_{chapter_num:03d}"
+        manifest_path = chapter_dir / f"{stem}.json"
+        wav_path = chapter_dir / f"{stem}.wav"
+        if not manifest_path.exists() or not wav_path.exists():
+            return None
+
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest["fingerprint"] != fingerprint:
+                return None
+            with wave.open(str(wav_path), 'rb') as wav_file:
+                num_bytes = wav_file.getnframes() * wav_file.getsampwidth()
+        except (OSError, ValueError, KeyError, wave.Error) as e:
+            print(f"⚠️ Ignoring unreadable chapter {chapter_num} in {chapter_dir}: {e}")
+            return None
+
+        if num_bytes != sum(segment["num_bytes"] for segment in manifest["segments"]):
+            return None
+        segments = [
+            AudiobookSegment(audio_data=b"", **{k: v for k, v in segment.items() if k != "num_bytes"})
+            for segment in manifest["segments"]
+        ]
+
+        return AudiobookChapter(
+            chapter_number=chapter_num,
+            title=manifest["title"],
+            segments=segments,
+            total_duration=manifest["total_duration"],
+            metadata=manifest["metadata"]
+        )
+
+    def get_render_progress(self, output_path: Optional[str] = None) -> Dict[str, Any]:
+        """Per-chapter status, attempts and chunk progress of a book, or of every book"""
+        if output_path is not None:
+            return self.render_progress.get(output_path, {})
+        return self.render_progress
+
     async def _render_chapter(
         self,
         chapter_data: Dict[str, Any],
@@ -185,7 +363,8 @@ class AudiobookRenderer:
         self,
         chapter_data: Dict[str, Any],
         narrator_profile,
-        chapter_num: int
+        chapter_num: int,
+        progress: Optional[Dict[str, Any]] = None
     ) -> AudiobookChapter:
         """
         CPU-safe chapter rendering with small chunks and rest intervals
@@ -221,6 +400,8 @@ class AudiobookRenderer:
         content_chunks = self._split_text_into_chunks(content, self.CHUNK_SIZE)
 
         print(f"📦 Split chapter into {len(content_chunks)} chunks of ~{self.CHUNK_SIZE} characters each")
+        if progress is not None:
+            progress["chunks_total"] = len(content_chunks)
 
         for i, chunk in enumerate(content_chunks):
             print(f"🔄 Processing chunk {i+1}/{len(content_chunks)}: {chunk[:50]}...")
@@ -237,6 +418,9 @@ class AudiobookRenderer:
                 segments.append(segment)
                 current_time += segment.duration + 0.5  # 0.5 second pause
 
+            if progress is not None:
+                progress["chunks_done"] = i + 1
+
             # CPU REST: Prevent thermal throttling
             if i % 3 == 0 and i > 0:  # Every 3 chunks
                 print(f"⏸️ CPU rest period... ({self.REST_INTERVAL} seconds)")
@@ -434,50 +618,72 @@ class AudiobookRenderer:
 
         return False
 
-    async def _combine_chapters(self, chapters: List[AudiobookChapter]) -> bytes:
-        """
-        Combine chapter audio into single audiobook file
-        """
-        print("🔗 Combining chapters into final audiobook...")
-
-        all_audio_data = []
-
-        for chapter in chapters:
-            # Add chapter intro pause (2 seconds)
-            all_audio_data.extend([0] * int(22050 * 2))  # 2 seconds of silence at 22kHz
-
-            for segment in chapter.segments:
-                # Convert audio bytes to numpy array
-                audio_array = self._bytes_to_audio_array(segment.audio_data)
-                all_audio_data.extend(audio_array)
-
-                # Add segment pause (0.5 seconds)
-                all_audio_data.extend([0] * int(22050 * 0.5))
-
-        # Convert back to bytes
-        return self._audio_array_to_bytes(np.array(all_audio_data))
+    def _wav_header(self, data_size: int, sample_rate: int = 22050) -> bytes:
+        """44-byte header of a 16-bit mono PCM WAV file with `data_size` bytes of audio"""
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b'data', data_size
+        )
 
     async def _export_audiobook(
         self,
-        audio_data: bytes,
+        chapters: List[AudiobookChapter],
+        chapter_dir: Path,
         output_path: str,
         book_metadata: Dict[str, Any],
         total_duration: float
-    ):
+    ) -> Dict[str, Any]:
         """
         Export final audiobook with metadata
+
+        Chapters are streamed from their rendered files one segment at a time with
+        the pauses written in between, so memory use does not grow with the book.
+        The output size is known up front, so the header is written first and the
+        checksum is computed as the bytes are written.
         """
         print(f"💾 Exporting audiobook to {output_path}...")
 
         # Ensure output directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Write WAV file
-        with wave.open(output_path, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(22050)
-            wav_file.writeframes(audio_data)
+        sample_rate = 22050
+        chapter_pause = bytes(2 * int(sample_rate * 2))  # 2 seconds of silence
+        segment_pause = bytes(2 * int(sample_rate * 0.5))
+
+        layouts = []
+        for chapter in chapters:
+            with open(chapter_dir / f"chapter_{chapter.chapter_number:03d}.json") as f:
+                layouts.append([segment["num_bytes"] for segment in json.load(f)["segments"]])
+        data_size = sum(
+            len(chapter_pause) + sum(num_bytes + len(segment_pause) for num_bytes in layout)
+            for layout in layouts
+        )
+
+        chapter_markers = []
+        offset = 0
+        with open(output_path, 'wb') as f:
+            out = HashingWriter(f)
+            out.write(self._wav_header(data_size, sample_rate))
+
+            for chapter, layout in zip(chapters, layouts):
+                chapter_start = offset
+                out.write(chapter_pause)
+                offset += len(chapter_pause)
+
+                with wave.open(str(chapter_dir / f"chapter_{chapter.chapter_number:03d}.wav"), 'rb') as wav_file:
+                    for num_bytes in layout:
+                        out.write(wav_file.readframes(num_bytes // 2))
+                        out.write(segment_pause)
+                        offset += num_bytes + len(segment_pause)
+
+                chapter_markers.append({
+                    "chapter": chapter.chapter_number,
+                    "title": chapter.title,
+                    "start_sec": chapter_start / 2 / sample_rate,
+                    "duration_sec": (offset - chapter_start) / 2 / sample_rate
+                })
 
         # Generate metadata file
         metadata_path = Path(output_path).with_suffix('.json')
@@ -490,12 +696,16 @@ class AudiobookRenderer:
             "voice_engine": "GOAT POM 2.0 Integration",
             "sample_rate": 22050,
             "channels": 1,
-            "bit_depth": 16
+            "bit_depth": 16,
+            "checksum_sha256": out.hexdigest(),
+            "chapters": chapter_markers
         }
 
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
 
+        return {"checksum_sha256": out.hexdigest(), "chapter_markers": chapter_markers}
+
     def _generate_audiobook_metadata(
         self,
         book_data: Dict[str, Any],
@@ -576,16 +786,6 @@ class AudiobookRenderer:
         num_samples = len(audio_bytes) // bytes_per_sample
         return num_samples / sample_rate
 
-    def _bytes_to_audio_array(self, audio_bytes: bytes) -> np.ndarray:
-        """Convert audio bytes to numpy array"""
-        # Assuming 16-bit signed integers
-        return np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-
-    def _audio_array_to_bytes(self, audio_array: np.ndarray) -> bytes:
-        """Convert numpy array to audio bytes"""
-        # Convert back to 16-bit signed integers
-        return (audio_array * 32767).astype(np.int16).tobytes()
-
     def _format_duration(self, seconds: float) -> str:
         """Format duration in HH:MM:SS"""
         hours = int(seconds // 3600)
@@ -656,47 +856,51 @@ class AudiobookRenderer:
         output_dir: str
     ) -> List[Dict[str, Any]]:
         """
-        Render multiple segments in batch
+        Render multiple segments in batch, in parallel up to the chapter scheduler's limit
         """
-        results = []
-
-        for i, segment_data in enumerate(segments):
-            try:
-                if segment_data["type"] == "character":
-                    audio_bytes = await self.character_mapper.generate_character_audio(
-                        character_name=segment_data["character"],
-                        text=segment_data["text"],
-                        emotion=segment_data.get("emotion", "neutral")
-                    )
-                else:  # narrator
-                    narrator_profile = self.narrator_optimizer.narrator_profiles[
-                        segment_data.get("narrator_profile", "narrator_nonfiction_default")
-                    ]
-                    audio_bytes = await self.narrator_optimizer.generate_narrator_audio(
-                        text=segment_data["text"],
-                        narrator_profile=narrator_profile,
-                        segment_type=segment_data.get("segment_type", "main")
-                    )
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_CHAPTERS)
 
-                output_path = os.path.join(output_dir, f"segment_{i:03d}.wav")
-                with wave.open(output_path, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(22050)
-                    wav_file.writeframes(audio_bytes)
-
-                results.append({
-                    "segment_id": i,
-                    "output_path": output_path,
-                    "duration": self._get_audio_duration(audio_bytes),
-                    "status": "success"
-                })
+        async def render_segment(i: int, segment_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if segment_data["type"] == "character":
+                        audio_bytes = await self.character_mapper.generate_character_audio(
+                            character_name=segment_data["character"],
+                            text=segment_data["text"],
+                            emotion=segment_data.get("emotion", "neutral")
+                        )
+                    else:  # narrator
+                        narrator_profile = self.narrator_optimizer.narrator_profiles[
+                            segment_data.get("narrator_profile", "narrator_nonfiction_default")
+                        ]
+                        audio_bytes = await self.narrator_optimizer.generate_narrator_audio(
+                            text=segment_data["text"],
+                            narrator_profile=narrator_profile,
+                            segment_type=segment_data.get("segment_type", "main")
+                        )
+
+                    output_path = os.path.join(output_dir, f"segment_{i:03d}.wav")
+                    with wave.open(output_path, 'wb') as wav_file:
+                        wav_file.setnchannels(1)
+                        wav_file.setsampwidth(2)
+                        wav_file.setframerate(22050)
+                        wav_file.writeframes(audio_bytes)
+
+                    return {
+                        "segment_id": i,
+                        "output_path": output_path,
+                        "duration": self._get_audio_duration(audio_bytes),
+                        "status": "success"
+                    }
 
-            except Exception as e:
-                results.append({
-                    "segment_id": i,
-                    "error": str(e),
-                    "status": "failed"
-                })
+                except Exception as e:
+                    return {
+                        "segment_id": i,
+                        "error": str(e),
+                        "status": "failed"
+                    }
 
-        return results
\ No newline at end of file
+        # Results stay in input order regardless of completion order
+        return await asyncio.gather(*[
+            render_segment(i, segment_data) for i, segment_data in enumerate(segments)
+        ])
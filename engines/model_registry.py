@@ -0,0 +1,279 @@
+# engines/model_registry.py
+"""
+GOAT Model Registry: loaded TTS models shared across voices and synthesis workers
+"""
+
+import gc
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def model_size_bytes(model: Any) -> Optional[int]:
+    """Bytes held by a torch model's parameters and buffers, or None for other objects"""
+    if not hasattr(model, "parameters"):
+        return None
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def merge_statuses(statuses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the `status()` of every synthesis worker's registry into one"""
+    if len(statuses) == 1:
+        return statuses[0]
+
+    # A model is warm if any worker holds it; warm_workers counts how many do
+    models: Dict[str, Dict[str, Any]] = {}
+    for status in statuses:
+        for name, entry in status["models"].items():
+            merged = models.get(name)
+            if merged is None or (entry["state"] == "warm" and merged["state"] != "warm"):
+                models[name] = dict(entry, warm_workers=merged["warm_workers"] if merged else 0)
+            models[name]["warm_workers"] += entry["state"] == "warm"
+
+    return {
+        "models": models,
+        "memory": {
+            "budget_bytes": sum(status["memory"]["budget_bytes"] for status in statuses),
+            "used_bytes": sum(status["memory"]["used_bytes"] for status in statuses),
+            "available_bytes": statuses[0]["memory"]["available_bytes"]
+        },
+        "workers": [status["memory"] for status in statuses]
+    }
+
+
+class ModelRegistry:
+    """
+    Bounded LRU of loaded models keyed by model name
+
+    Models are loaded once and reused across requests and voice switches.
+    Loaded models stay within `memory_budget_bytes`, and a model is only loaded
+    while the system keeps `reserve_bytes` free; least recently used models are
+    evicted to make room. Loads are serialized so two cold models never spike
+    memory at the same time. `required` models are loaded even when memory is
+    short, with a warning, and are never evicted to make room for others,
+    since the service cannot run without them.
+
+    Models preloaded before the synthesis workers fork are inherited by every
+    worker and shared copy-on-write; `preload()` freezes the collector so it
+    never writes to their pages afterwards. Each worker then holds its own copy
+    of the registry, with its share of the budget (see `share_budget()`).
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        memory_budget_bytes: int,
+        reserve_bytes: int = 4 * 1024**3,
+        estimate_size: Optional[Callable[[str], int]] = None,
+        warmup: Optional[Callable[[Any], None]] = None,
+        required: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            loader: Loads a model by name
+            memory_budget_bytes: Total size of loaded models
+            reserve_bytes: System memory that must stay available after a load
+            estimate_size: Expected size of a model before it is loaded
+            warmup: Runs a short inference on a loaded model
+            required: Models that are never refused for lack of memory
+        """
+        self.loader = loader
+        self.memory_budget_bytes = memory_budget_bytes
+        self.reserve_bytes = reserve_bytes
+        self.estimate_size = estimate_size or (lambda name: 1024**3)
+        self.warmup_model = warmup
+        self.required = set(required or [])
+
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def _entry(self, name: str) -> Dict[str, Any]:
+        return self._entries.setdefault(name, {
+            "state": "cold",
+            "size_bytes": None,
+            "load_seconds": None,
+            "loaded_at": None,
+            "last_used": None,
+            "hits": 0,
+            "error": None
+        })
+
+    def _lookup(self, name: str) -> Optional[Any]:
+        with self._lock:
+            model = self._models.get(name)
+            if model is not None:
+                self._models.move_to_end(name)
+                entry = self._entries[name]
+                entry["hits"] += 1
+                entry["last_used"] = time.time()
+            return model
+
+    def get(self, name: str) -> Any:
+        """Return a loaded model, loading it (and evicting others) on a miss"""
+        model = self._lookup(name)
+        if model is not None:
+            return model
+
+        with self._load_lock:
+            model = self._lookup(name)
+            if model is not None:
+                return model
+
+            self._make_room(name, self.estimate_size(name))
+            with self._lock:
+                self._entry(name)["state"] = "loading"
+
+            print(f"📦 Loading model: {name}")
+            start = time.time()
+            try:
+                model = self.loader(name)
+            except Exception as e:
+                with self._lock:
+                    self._entry(name).update(state="failed", error=str(e))
+                raise
+            load_seconds = time.time() - start
+
+            size = model_size_bytes(model) or self.estimate_size(name)
+            with self._lock:
+                self._models[name] = model
+                self._entry(name).update(
+                    state="warm",
+                    size_bytes=size,
+                    load_seconds=round(load_seconds, 3),
+                    loaded_at=time.time(),
+                    last_used=time.time(),
+                    error=None
+                )
+            print(f"✅ Loaded {name} in {load_seconds:.1f}s ({size / 1024**3:.2f} GB)")
+
+            # Re-check against the measured size, never evicting the model just loaded
+            self._make_room(name, 0)
+            return model
+
+    def _used_bytes(self) -> int:
+        return sum(self._entries[name]["size_bytes"] or 0 for name in self._models)
+
+    def _available_bytes(self) -> Optional[int]:
+        return psutil.virtual_memory().available if psutil else None
+
+    def _make_room(self, name: str, needed: int):
+        """Evict least recently used models until `needed` more bytes fit"""
+        def over_budget() -> bool:
+            with self._lock:
+                used = self._used_bytes()
+            available = self._available_bytes()
+            return (used + needed > self.memory_budget_bytes
+                    or (available is not None and available < needed + self.reserve_bytes))
+
+        while over_budget():
+            with self._lock:
+                victims = [loaded for loaded in self._models if loaded != name and loaded not in self.required]
+            if not victims:
+                break
+            self.evict(victims[0])
+
+        if needed and over_budget():
+            message = (f"Not enough memory to load {name} "
+                       f"(~{needed / 1024**3:.1f} GB, budget {self.memory_budget_bytes / 1024**3:.1f} GB, "
+                       f"reserve {self.reserve_bytes / 1024**3:.1f} GB)")
+            if name not in self.required:
+                raise MemoryError(message)
+            print(f"⚠️ {message}; loading it anyway since it is required")
+
+    def evict(self, name: str) -> bool:
+        """Drop a loaded model, returning whether it was loaded"""
+        with self._lock:
+            model = self._models.pop(name, None)
+            if model is not None:
+                self._entry(name)["state"] = "cold"
+        if model is None:
+            return False
+
+        del model
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+        print(f"🧹 Evicted model: {name}")
+        return True
+
+    def preload(self, names: List[str]):
+        """
+        Load models ahead of the first request
+
+        Call before the synthesis workers fork so they share the weights.
+        """
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"❌ Preload failed for {name}: {e}")
+
+        # Objects that exist now are never scanned (and so never written to) by the collector again
+        gc.freeze()
+
+    def warmup(self):
+        """Run a short inference on every loaded model so the first request runs at steady-state speed"""
+        if self.warmup_model is None:
+            return
+        with self._lock:
+            models = list(self._models.items())
+        for name, model in models:
+            start = time.time()
+            try:
+                self.warmup_model(model)
+                print(f"🔥 Warmed up {name} in {time.time() - start:.1f}s")
+            except Exception as e:
+                print(f"⚠️ Warm-up failed for {name}: {e}")
+
+    def synthesize(self, name: str, **kwargs) -> Any:
+        """Synthesize with the named model (called inside synthesis workers)"""
+        return self.get(name).tts(**kwargs)
+
+    def ensure(self, name: str) -> bool:
+        """Load a model if needed, returning whether it was already loaded (picklable, for worker pools)"""
+        loaded = self.peek(name) is not None
+        self.get(name)
+        return loaded
+
+    def share_budget(self, parts: int) -> "ModelRegistry":
+        """Limit this copy of the registry to an equal share of the budget and return it"""
+        self.memory_budget_bytes //= max(1, parts)
+        return self
+
+    def loaded_models(self) -> List[str]:
+        """Names of loaded models, least recently used first"""
+        with self._lock:
+            return list(self._models)
+
+    def peek(self, name: str) -> Optional[Any]:
+        """A loaded model without loading it or touching its LRU position"""
+        with self._lock:
+            return self._models.get(name)
+
+    def status(self) -> Dict[str, Any]:
+        """Warm/cold state of every known model and memory usage against the budget"""
+        with self._lock:
+            models = {name: dict(entry) for name, entry in self._entries.items()}
+            used = self._used_bytes()
+        return {
+            "models": models,
+            "memory": {
+                "budget_bytes": self.memory_budget_bytes,
+                "used_bytes": used,
+                "available_bytes": self._available_bytes()
+            }
+        }
@@ -14,20 +14,11 @@ import hashlib
 import io
 import numpy as np
 import soundfile as sf
-from functools import wraps
+from functools import partial
 
-# CPU Sequential Lock Decorator
-def cpu_sequential_lock(func):
-    """Decorator to prevent concurrent execution on CPU"""
-    lock = asyncio.Lock()
+from engines.model_registry import ModelRegistry, merge_statuses
 
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        async with lock:
-            print(f"🔒 Sequential Lock: {func.__name__}")
-            return await func(*args, **kwargs)
-
-    return wrapper
+DEFAULT_TTS_MODEL = "tts_models/multilingual/multi-dataset/your_tts"
 
 # Real POM and Coqui TTS imports from local directories
 try:
@@ -50,6 +41,7 @@ try:
     coqui_path = pom_path / "Coqui_TTS"
     sys.path.insert(0, str(coqui_path))
     from TTS.api import TTS
+    from TTS.utils.worker_pool import ModelWorkerPool
 
     POM_AVAILABLE = True
     print("✅ Real POM 2.0 Phonatory Output Module loaded successfully")
@@ -203,10 +195,32 @@ class VoiceEngine:
         self.cpu_mode = cpu_mode
         self.memory_manager = CPUMemoryManager()
 
-        # FOR CPU: Reduce model cache to prevent memory overflow
-        self.model_cache = {}  # Only cache current model
         self.active_model = None
         self.CPU_TIMEOUT = 300  # 5 minutes vs 30 seconds for GPU
+        self.TTS_BATCH_SIZE = 8  # Sentences per Coqui model call
+        # Synthesis runs on a pool of worker processes, each with its share of the cores
+        self.TTS_WORKERS = int(os.getenv("TTS_WORKERS", "1"))
+        self.TTS_THREADS_PER_WORKER = int(os.getenv("TTS_THREADS_PER_WORKER", "0")) or None
+        self.tts_pool = None
+
+        # Loaded models are kept in a registry bounded by the memory budget, so voice
+        # switches reuse them instead of reloading; extra models to preload are listed
+        # in TTS_PRELOAD_MODELS (comma separated). Loads keep TTS_MEMORY_RESERVE_GB of
+        # system memory free, except for the default model, which is always loaded
+        self.model_registry = ModelRegistry(
+            loader=self._load_coqui_model,
+            memory_budget_bytes=self.memory_manager.max_memory_bytes,
+            reserve_bytes=int(float(os.getenv("TTS_MEMORY_RESERVE_GB", "4")) * 1024**3),
+            estimate_size=lambda name: self.memory_manager.estimate_model_size(
+                "coqui_yourtts" if "your_tts" in name else name
+            ),
+            warmup=self._warm_up_coqui_model,
+            required=[DEFAULT_TTS_MODEL]
+        )
+        self.preload_models = [DEFAULT_TTS_MODEL] + [
+            name.strip() for name in os.getenv("TTS_PRELOAD_MODELS", "").split(",")
+            if name.strip() and name.strip() != DEFAULT_TTS_MODEL
+        ]
 
         # Initialize POM with correct config path
         pom_config_path = Path(__file__).parent.parent / "Phonatory_Output_Module" / "voice_config.json"
@@ -215,20 +229,34 @@ class VoiceEngine:
 
         # Initialize Coqui TTS - always try to load it
         try:
-            from TTS.api import TTS as CoquiTTS
-            self.coqui_tts = CoquiTTS(
-                model_name="tts_models/multilingual/multi-dataset/your_tts",
-                progress_bar=False,
-                gpu=False  # Force CPU mode
-            )
-            # FORCE sample rate consistency
-            self.coqui_tts.synthesizer.output_sample_rate = self.SAMPLE_RATE
+            self.model_registry.preload(self.preload_models)
+            self.coqui_tts = self.model_registry.peek(DEFAULT_TTS_MODEL)
+            if self.coqui_tts is None:
+                raise RuntimeError(f"{DEFAULT_TTS_MODEL} could not be loaded")
             print("✅ Coqui TTS loaded successfully")
             print(f"✅ Sample rate locked to: {self.SAMPLE_RATE} Hz")
             print(f"✅ CPU mode: {self.cpu_mode}")
+
+            # Fork the workers now, before this process runs any inference; they inherit the
+            # preloaded models copy-on-write and warm them up before the first request.
+            # Each worker process keeps its own registry with an equal share of the budget.
+            # The registry loader is bound to this engine and cannot be sent to a fresh
+            # process, so a worker that dies is not replaced; the others take over its queue
+            registry = self.model_registry
+            parent_pid = os.getpid()
+            worker_count = max(1, self.TTS_WORKERS)
+            self.tts_pool = ModelWorkerPool(
+                lambda: registry.share_budget(worker_count) if os.getpid() != parent_pid else registry,
+                num_workers=self.TTS_WORKERS,
+                threads_per_worker=self.TTS_THREADS_PER_WORKER,
+                warmup="warmup"
+            )
+            print(f"✅ TTS worker pool: {self.tts_pool.num_workers} worker(s), "
+                  f"{self.tts_pool.threads_per_worker} thread(s) each")
         except Exception as e:
             print(f"❌ Coqui TTS initialization failed: {e}")
             self.coqui_tts = None
+            self.tts_pool = None
 
         # Initialize POM if available
         if POM_AVAILABLE:
@@ -317,7 +345,49 @@ class VoiceEngine:
         with open(profile_path, 'r') as f:
             return json.load(f)
 
-    @cpu_sequential_lock
+    def _load_coqui_model(self, model_name: str):
+        """Load a Coqui TTS model for the registry"""
+        from TTS.api import TTS as CoquiTTS
+        coqui_tts = CoquiTTS(
+            model_name=model_name,
+            progress_bar=False,
+            gpu=False  # Force CPU mode
+        )
+        # FORCE sample rate consistency
+        coqui_tts.synthesizer.output_sample_rate = self.SAMPLE_RATE
+        return coqui_tts
+
+    def _warm_up_coqui_model(self, coqui_tts):
+        """Short synthesis that triggers lazy initialization ahead of the first request"""
+        coqui_tts.tts(
+            text="Warm up.",
+            speaker=coqui_tts.speakers[0] if coqui_tts.is_multi_speaker else None,
+            language=coqui_tts.languages[0] if coqui_tts.is_multi_lingual else None
+        )
+
+    async def _tts(self, model_name: str, **kwargs) -> np.ndarray:
+        """Run Coqui TTS on the worker pool without blocking the event loop"""
+        if self.tts_pool is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(self.model_registry.synthesize, model_name, **kwargs))
+        return await asyncio.wrap_future(self.tts_pool.submit("synthesize", model_name, **kwargs))
+
+    async def _registry_call(self, method: str, *args) -> List[Any]:
+        """Run a registry method in every synthesis worker, or locally without a pool"""
+        if self.tts_pool is None:
+            loop = asyncio.get_running_loop()
+            return [await loop.run_in_executor(None, partial(getattr(self.model_registry, method), *args))]
+        return await asyncio.wrap_future(self.tts_pool.broadcast(method, *args))
+
+    async def get_model_status(self) -> Dict[str, Any]:
+        """Warm/cold state of the models across the synthesis workers and their memory use"""
+        statuses = await self._registry_call("status")
+        return merge_statuses(statuses)
+
+    def get_tts_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Queue depth and per-worker latency of the synthesis pool"""
+        return self.tts_pool.stats() if self.tts_pool else None
+
     async def synthesize_with_character_voice(
         self,
         text: str,
@@ -327,29 +397,18 @@ class VoiceEngine:
     ) -> bytes:
         """
         Synthesize speech for fiction - applies character-specific phonatory processing
-        CPU-optimized with sequential processing and memory management
+        Synthesis is dispatched to the TTS worker pool, so concurrent requests run in parallel
         """
         try:
             print(f"\n🎤 Synthesizing: '{text[:50]}...'")
             print(f"Using profile: {voice_profile['profile_id']}")
             print(f"CPU mode: {self.cpu_mode}")
 
-            # CPU: Check memory before proceeding
-            if self.cpu_mode and not self.memory_manager.check_memory():
-                print("⚠️ Low memory detected! Attempting cleanup...")
-                await self._unload_inactive_models()
-                if not self.memory_manager.check_memory():
-                    raise MemoryError("Insufficient RAM for synthesis")
-
-            # Clear previous model from cache to free RAM
-            if (self.active_model and
-                self.active_model != voice_profile['profile_id']):
-                print(f"🧹 Clearing previous model: {self.active_model}")
-                await self._unload_model(self.active_model)
-
-            # Load required model
-            await self._ensure_model_loaded(voice_profile['profile_id'])
-            self.active_model = voice_profile['profile_id']
+            # Load required model; the registry keeps recently used models warm across
+            # voice switches and evicts the least recently used ones when memory is short
+            model_name = voice_profile["coqui_model"].get("model_name") or DEFAULT_TTS_MODEL
+            await self._ensure_model_loaded(model_name)
+            self.active_model = model_name
 
             # 1. Base Coqui TTS synthesis
             # Check if this is a YourTTS model with speaker name
@@ -373,30 +432,37 @@ class VoiceEngine:
             try:
                 # For YourTTS with speaker name, use speaker parameter
                 if speaker_name is not None:
-                    base_audio = self.coqui_tts.tts(
+                    base_audio = await self._tts(
+                        model_name,
                         text=text,
                         speaker=speaker_name,
-                        language="en"
+                        language="en",
+                        batch_size=self.TTS_BATCH_SIZE
                     )
                 # For YourTTS, use a valid speaker
                 elif "your_tts" in self.coqui_tts.model_name.lower():
-                    base_audio = self.coqui_tts.tts(
+                    base_audio = await self._tts(
+                        model_name,
                         text=text,
                         speaker="male-en-2",  # Use valid male speaker as fallback
-                        language="en"
+                        language="en",
+                        batch_size=self.TTS_BATCH_SIZE
                     )
                 else:
                     # For other models, use speaker_embedding
-                    base_audio = self.coqui_tts.tts(
+                    base_audio = await self._tts(
+                        model_name,
                         text=text,
                         speaker_embedding=speaker_embedding,
-                        language="en"
+                        language="en",
+                        batch_size=self.TTS_BATCH_SIZE
                     )
             except Exception as tts_error:
                 print(f"TTS call failed: {tts_error}")
                 # Fallback: try without speaker parameters
                 try:
-                    base_audio = self.coqui_tts.tts(
+                    base_audio = await self._tts(
+                        model_name,
                         text=text,
                         language="en"
                     )
@@ -591,39 +657,26 @@ class VoiceEngine:
             # Ultimate fallback: return None and let Coqui use its default
             return None
 
-    async def _ensure_model_loaded(self, model_id):
-        """Ensure the required model is loaded (CPU memory management)"""
-        if model_id not in self.model_cache:
-            print(f"Loading model: {model_id}")
-            # In CPU mode, we don't actually cache models to save memory
-            # Just ensure Coqui TTS is ready
-            if self.coqui_tts is None:
-                raise RuntimeError("Coqui TTS not initialized")
+    async def _ensure_model_loaded(self, model_name):
+        """Ensure the required model is loaded in every synthesis worker (cold loads run off the event loop)"""
+        if self.coqui_tts is None:
+            raise RuntimeError("Coqui TTS not initialized")
+        await self._registry_call("ensure", model_name)
 
-    async def _unload_model(self, model_id):
+    async def _unload_model(self, model_name):
         """Explicitly unload model to free RAM (CPU optimization)"""
-        if model_id in self.model_cache:
-            del self.model_cache[model_id]
-
-        # Force garbage collection
-        import gc
-        gc.collect()
-
-        # Clear any cached computations
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
-
-        print(f"🧹 Unloaded model: {model_id}")
+        self.model_registry.evict(model_name)
+        if self.tts_pool is not None and self.tts_pool.num_workers > 0:
+            await self._registry_call("evict", model_name)
 
     async def _unload_inactive_models(self):
         """Unload all models except the active one to free memory"""
-        models_to_unload = [mid for mid in self.model_cache.keys() if mid != self.active_model]
-        for model_id in models_to_unload:
-            await self._unload_model(model_id)
+        loaded = set(self.model_registry.loaded_models())
+        for worker_models in await self._registry_call("loaded_models"):
+            loaded.update(worker_models)
+        models_to_unload = sorted(name for name in loaded if name != self.active_model)
+        for model_name in models_to_unload:
+            await self._unload_model(model_name)
 
         print(f"🧹 Unloaded {len(models_to_unload)} inactive models")
 
@@ -681,14 +734,22 @@ class VoiceEngine:
 
         return audio_bytes
 
-    async def _extract_speaker_embedding(self, sample_path: str) -> Optional[str]:
-        """Extract speaker embedding from audio sample"""
-        if not POM_AVAILABLE:
-            return f"mock_embedding_{hash(sample_path) % 1000}"
+    async def _extract_speaker_embedding(self, sample_path: str) -> Optional[np.ndarray]:
+        """
+        Extract speaker embedding from audio sample
+
+        Uses the Coqui speaker encoder through its shared embedding cache, so cloning
+        the same narrator clip again skips the encoder entirely
+        """
+        tts_model = getattr(getattr(self.coqui_tts, "synthesizer", None), "tts_model", None)
+        speaker_manager = getattr(tts_model, "speaker_manager", None)
+        if speaker_manager is None or getattr(speaker_manager, "encoder", None) is None:
+            print("⚠️ No speaker encoder loaded - cannot extract embedding")
+            return None
 
-        # In real implementation, this would extract speaker embedding
-        # For now, return mock path
-        return f"./voices/models/speaker_{hash(sample_path) % 1000}.pth"
+        loop = asyncio.get_running_loop()
+        embedding = await loop.run_in_executor(None, speaker_manager.compute_embedding_from_clip, sample_path)
+        return np.array(embedding, dtype=np.float32)
 
     def _map_sample_to_pom_params(self, sample_path: str) -> Dict:
         """
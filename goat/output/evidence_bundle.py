@@ -6,7 +6,7 @@ Bundles contain content, provenance logs, and certification requests.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import hashlib
 import json
@@ -14,6 +14,8 @@ import hmac
 import secrets
 from pathlib import Path
 
+from apex.validators.provenance_chain import ProvenanceChainBuilder, verify_chain
+
 class EvidenceBundleGenerator:
     """
     Generates evidence bundles for APEX DOC certification.
@@ -87,32 +89,18 @@ class EvidenceBundleGenerator:
         random_suffix = secrets.token_hex(2).upper()
         return f"GBL-{today}-{random_suffix}"
 
-    def _chain_provenance_log(self, log_entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _chain_provenance_log(self, log_entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Chain provenance log entries with hash references.
 
-        Each entry references the previous entry's hash for immutability.
+        Each entry references the previous entry's hash for immutability;
+        periodic checkpoint hashes let APEX resume verification mid-chain.
         """
-        chained = []
-        prev_hash = None
-
-        for entry in log_entries:
-            # Create entry hash
-            entry_data = {k: v for k, v in entry.items() if k != 'entry_hash'}
-            entry_str = json.dumps(entry_data, sort_keys=True, separators=(',', ':'))
-            entry_hash = hashlib.sha256(entry_str.encode()).hexdigest()
-
-            # Add chaining
-            chained_entry = {
-                **entry_data,
-                "prev_entry_hash": prev_hash,
-                "entry_hash": entry_hash
-            }
-
-            chained.append(chained_entry)
-            prev_hash = entry_hash
-
-        return chained
+        return list(ProvenanceChainBuilder().chain(log_entries))
+
+    def _validate_provenance_chain(self, log: List[Dict[str, Any]]) -> bool:
+        """Verify hash links, entry hashes, checkpoints and timestamp order."""
+        return verify_chain(log)
 
     def _calculate_structure_hash(self, files: List[Dict[str, Any]]) -> str:
         """Calculate hash of content structure."""
@@ -20,6 +20,9 @@ class Config:
     MAX_RETRIES = 3
     REQUEST_TIMEOUT = 180
 
+    # Number of sections drafted concurrently once their dependencies are met
+    MAX_CONCURRENT_SECTIONS = int(os.getenv("SCRIBE_MAX_CONCURRENT_SECTIONS", "4"))
+
     # Quality thresholds
     MIN_QUALITY_SCORE = 7.0
     TARGET_QUALITY_SCORE = 8.5
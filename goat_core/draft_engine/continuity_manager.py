@@ -11,23 +11,67 @@ from pathlib import Path
 from datetime import datetime
 import hashlib
 
+# Continuity categories that are appended to section by section
+LIST_CATEGORIES = ("key_facts", "character_details", "timeline_events",
+                   "themes", "recurring_phrases", "contradictions")
+
 class ContinuityManager:
     """Manages continuity and consistency across content sections"""
 
-    def __init__(self, continuity_file: str = "continuity_store.json"):
+    # Number of appended log entries before the snapshot is rewritten
+    COMPACT_INTERVAL = 25
+
+    def __init__(self, continuity_file: str = "continuity_store.json",
+                 compact_interval: Optional[int] = None):
         self.continuity_file = Path(__file__).parent / continuity_file
+        self.log_file = self.continuity_file.with_suffix(".log.jsonl")
+        self.compact_interval = compact_interval or self.COMPACT_INTERVAL
+        self._log_entries = 0
+        self._log_seq = 0
         self.continuity_data = self._load_continuity_data()
+        self._rebuild_indexes()
 
     def _load_continuity_data(self) -> Dict[str, Any]:
-        """Load existing continuity data or create new"""
+        """
+        Load the continuity snapshot and replay the append log on top of it
+
+        Log entries whose sequence number is already folded into the
+        snapshot are skipped, so a crash between writing the snapshot and
+        removing the log does not apply them twice.
+        """
+        data = None
         if self.continuity_file.exists():
             try:
                 with open(self.continuity_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    data = json.load(f)
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
 
-        # Create new continuity structure
+        if data is None:
+            data = self._new_continuity_data()
+
+        applied_seq = data["metadata"].get("log_seq", 0)
+        self._log_seq = applied_seq
+        self._log_entries = 0
+        if self.log_file.exists():
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip a torn write
+                    seq = entry.get("seq")
+                    if seq is not None:
+                        if seq <= applied_seq:
+                            continue  # Already in the snapshot
+                        self._log_seq = max(self._log_seq, seq)
+                    self._apply_log_entry(data, entry)
+                    self._log_entries += 1
+
+        return data
+
+    def _new_continuity_data(self) -> Dict[str, Any]:
+        """Create an empty continuity structure"""
         return {
             "metadata": {
                 "created_at": datetime.now().isoformat(),
@@ -47,6 +91,27 @@ class ContinuityManager:
             "section_summaries": []
         }
 
+    def _rebuild_indexes(self):
+        """Rebuild dedup sets and the key fact inverted index from continuity data"""
+        self._seen: Dict[str, Set[str]] = {
+            category: set(self.continuity_data.get(category, []))
+            for category in LIST_CATEGORIES
+        }
+        # Normalized token -> positions in key_facts
+        self._fact_index: Dict[str, Set[int]] = {}
+        for fact_id, fact in enumerate(self.continuity_data.get("key_facts", [])):
+            self._index_fact(fact_id, fact)
+
+    @staticmethod
+    def _tokenize(text: str) -> Set[str]:
+        """Normalize text into a set of lowercase word tokens"""
+        return set(re.findall(r'\b\w+\b', text.lower()))
+
+    def _index_fact(self, fact_id: int, fact: str):
+        """Add a key fact to the inverted index"""
+        for token in self._tokenize(fact):
+            self._fact_index.setdefault(token, set()).add(fact_id)
+
     def update_from_content(self, section_content: Dict[str, Any]):
         """Update continuity data from newly generated content"""
         content = section_content.get("content", "")
@@ -60,12 +125,15 @@ class ContinuityManager:
         phrases = self._extract_recurring_phrases(content)
         terms = self._extract_terminology(content)
 
-        # Update continuity data
-        self._add_unique_items("key_facts", facts)
-        self._add_unique_items("character_details", characters)
-        self._add_unique_items("timeline_events", events)
-        self._add_unique_items("themes", themes)
-        self._add_unique_items("recurring_phrases", phrases)
+        # Update continuity data, keeping what was new for the append log
+        log_entry: Dict[str, Any] = {
+            "key_facts": self._add_unique_items("key_facts", facts),
+            "character_details": self._add_unique_items("character_details", characters),
+            "timeline_events": self._add_unique_items("timeline_events", events),
+            "themes": self._add_unique_items("themes", themes),
+            "recurring_phrases": self._add_unique_items("recurring_phrases", phrases),
+            "terminology": terms
+        }
 
         # Update terminology
         self.continuity_data["terminology"].update(terms)
@@ -79,15 +147,17 @@ class ContinuityManager:
             "content_hash": hashlib.md5(content.encode()).hexdigest()
         }
         self.continuity_data["section_summaries"].append(section_summary)
+        log_entry["section_summary"] = section_summary
 
         # Update metadata
         self.continuity_data["metadata"]["last_updated"] = datetime.now().isoformat()
+        log_entry["last_updated"] = self.continuity_data["metadata"]["last_updated"]
 
         # Check for contradictions
-        self._check_contradictions(content)
+        log_entry["contradictions"] = self._check_contradictions(content)
 
-        # Save updated data
-        self._save_continuity_data()
+        # Persist only the delta; the snapshot is rewritten periodically
+        self._append_log_entry(log_entry)
 
     def _extract_key_facts(self, content: str) -> List[str]:
         """Extract key factual statements from content"""
@@ -218,27 +288,42 @@ class ContinuityManager:
 
         return terms
 
-    def _add_unique_items(self, category: str, new_items: List[str]):
-        """Add items to continuity data without duplicates"""
-        existing = set(self.continuity_data.get(category, []))
+    def _add_unique_items(self, category: str, new_items: List[str]) -> List[str]:
+        """Add items to continuity data without duplicates, returning the added ones"""
+        existing = self._seen.setdefault(category, set())
+        items = self.continuity_data.setdefault(category, [])
+        added = []
         for item in new_items:
             if item not in existing:
-                self.continuity_data[category].append(item)
+                if category == "key_facts":
+                    self._index_fact(len(items), item)
+                items.append(item)
                 existing.add(item)
+                added.append(item)
+        return added
 
-    def _check_contradictions(self, content: str):
+    def _check_contradictions(self, content: str) -> List[str]:
         """Check for contradictions with existing continuity"""
-        contradictions = []
+        # Simple contradiction detection (this could be much more sophisticated)
+        if "not" not in content.lower():
+            return []
 
-        # Check against existing facts
-        for fact in self.continuity_data.get("key_facts", []):
-            # Simple contradiction detection (this could be much more sophisticated)
-            if "not" in content.lower() and any(word in content.lower() for word in fact.lower().split()):
-                contradictions.append(f"Potential contradiction with established fact: {fact}")
+        # Only facts sharing at least one term with the content are candidates
+        candidate_ids: Set[int] = set()
+        for token in self._tokenize(content):
+            candidate_ids.update(self._fact_index.get(token, ()))
+
+        key_facts = self.continuity_data.get("key_facts", [])
+        contradictions = [
+            f"Potential contradiction with established fact: {key_facts[fact_id]}"
+            for fact_id in sorted(candidate_ids)
+        ]
 
         if contradictions:
             self.continuity_data["contradictions"].extend(contradictions)
 
+        return contradictions
+
     def get_continuity_data(self) -> Dict[str, Any]:
         """Get current continuity data for content generation"""
         return self.continuity_data
@@ -291,15 +376,48 @@ class ContinuityManager:
             "continuity_strength": len(key_facts) + len(self.continuity_data.get("character_details", []))
         }
 
+    @staticmethod
+    def _apply_log_entry(data: Dict[str, Any], entry: Dict[str, Any]):
+        """Replay a single append log entry onto continuity data"""
+        for category in LIST_CATEGORIES:
+            data.setdefault(category, []).extend(entry.get(category, []))
+        data.setdefault("terminology", {}).update(entry.get("terminology", {}))
+        if entry.get("section_summary"):
+            data.setdefault("section_summaries", []).append(entry["section_summary"])
+        if entry.get("last_updated"):
+            data["metadata"]["last_updated"] = entry["last_updated"]
+
+    def _append_log_entry(self, entry: Dict[str, Any]):
+        """Append a continuity delta to the log, compacting when it grows too long"""
+        self._log_seq += 1
+        entry["seq"] = self._log_seq
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log_entries += 1
+
+        if self._log_entries >= self.compact_interval:
+            self.compact()
+
+    def compact(self):
+        """Fold the append log into the continuity snapshot"""
+        self.continuity_data["metadata"]["log_seq"] = self._log_seq
+        self._save_continuity_data()
+        if self.log_file.exists():
+            self.log_file.unlink()
+        self._log_entries = 0
+
     def _save_continuity_data(self):
         """Save continuity data to file"""
-        with open(self.continuity_file, 'w', encoding='utf-8') as f:
+        tmp_file = self.continuity_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump(self.continuity_data, f, indent=2, ensure_ascii=False)
+        tmp_file.replace(self.continuity_file)
 
     def reset_continuity(self):
         """Reset continuity data for new project"""
         self.continuity_data = self._load_continuity_data()
-        self._save_continuity_data()
+        self._rebuild_indexes()
+        self.compact()
 
     def export_continuity_report(self) -> str:
         """Generate a human-readable continuity report"""
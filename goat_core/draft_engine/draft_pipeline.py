@@ -6,10 +6,13 @@ Orchestrates the complete content generation workflow
 
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
 
+from .config import Config
 from .structure_interpreter import StructureInterpreter
 from .content_generator import ContentGenerator
 from .continuity_manager import ContinuityManager
@@ -19,12 +22,15 @@ from .quality_validator import QualityValidator
 class DraftPipeline:
     """Main pipeline for GOAT content generation"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_workers: Optional[int] = None):
         self.structure_interpreter = StructureInterpreter()
         self.content_generator = ContentGenerator()  # Caleon-native - no API key needed
         self.continuity_manager = ContinuityManager()
         self.tone_harmonizer = ToneHarmonizer()
         self.quality_validator = QualityValidator()
+        self.max_workers = max(1, max_workers or Config.MAX_CONCURRENT_SECTIONS)
+        # Continuity reads and writes are shared between section workers
+        self._continuity_lock = threading.Lock()
 
     def generate_content(self, outline_text: str, content_type: str = "book",
                         project_title: str = "Untitled Project") -> Dict[str, Any]:
@@ -69,29 +75,7 @@ class DraftPipeline:
 
             # Step 3: Generate content for each section
             print(f"✍️  Generating content for {len(blueprint['writing_plan'])} sections...")
-            sections_content = []
-
-            for i, section_plan in enumerate(blueprint["writing_plan"]):
-                print(f"  Section {i+1}/{len(blueprint['writing_plan'])}: {section_plan['title']}")
-
-                try:
-                    # Generate section content
-                    section_content = self._generate_section_content(section_plan, context)
-
-                    # Validate section
-                    validation = self.quality_validator.validate_content(
-                        section_content["content"], section_plan
-                    )
-
-                    section_content["validation"] = validation
-                    sections_content.append(section_content)
-
-                    print(f"    ✓ Completed ({len(section_content['content'].split())} words, score: {validation['overall_score']:.1f})")
-
-                except Exception as e:
-                    error_msg = f"Failed to generate section {section_plan['title']}: {str(e)}"
-                    results["errors"].append(error_msg)
-                    print(f"    ✗ {error_msg}")
+            sections_content = self._generate_sections(blueprint["writing_plan"], context, results)
 
             results["sections"] = sections_content
 
@@ -124,10 +108,100 @@ class DraftPipeline:
 
         return results
 
+    @staticmethod
+    def _section_key(section_plan: Dict[str, Any]) -> str:
+        """Identifier used by writing plan dependencies (e.g. section_2, section_2.1)"""
+        key = f"section_{section_plan.get('section_number')}"
+        if "subsection_number" in section_plan:
+            key += f".{section_plan['subsection_number']}"
+        return key
+
+    def _generate_sections(self, writing_plan: List[Dict[str, Any]], context: Dict[str, Any],
+                           results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Generate sections concurrently in dependency order
+
+        A section is scheduled once every section it depends on has been
+        generated, so its continuity context is complete. Validation runs in
+        a second pool overlapping with generation, and sections are returned
+        in plan order.
+        """
+        total = len(writing_plan)
+        index_by_key = {self._section_key(plan): i for i, plan in enumerate(writing_plan)}
+
+        pending_deps: Dict[int, set] = {}
+        dependents: Dict[int, List[int]] = {i: [] for i in range(total)}
+        for i, plan in enumerate(writing_plan):
+            deps = {index_by_key[dep] for dep in plan.get("dependencies", [])
+                    if dep in index_by_key and index_by_key[dep] != i}
+            pending_deps[i] = deps
+            for dep in deps:
+                dependents[dep].append(i)
+
+        errors: Dict[int, str] = {}
+        generated: Dict[int, Dict[str, Any]] = {}
+        validations: Dict[int, Future] = {}
+        ready = [i for i in range(total) if not pending_deps[i]]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as generation_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as validation_pool:
+            in_flight: Dict[Future, int] = {}
+
+            while ready or in_flight:
+                for i in ready:
+                    future = generation_pool.submit(self._generate_section_content, writing_plan[i], context)
+                    in_flight[future] = i
+                ready = []
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = in_flight.pop(future)
+                    section_plan = writing_plan[i]
+                    try:
+                        section_content = future.result()
+                    except Exception as e:
+                        errors[i] = f"Failed to generate section {section_plan['title']}: {str(e)}"
+                        print(f"  ✗ Section {i+1}/{total}: {errors[i]}")
+                    else:
+                        generated[i] = section_content
+                        validations[i] = validation_pool.submit(
+                            self.quality_validator.validate_content,
+                            section_content["content"], section_plan
+                        )
+
+                    # A failed section releases its dependents, as the sequential pipeline did
+                    for dependent in dependents[i]:
+                        pending_deps[dependent].discard(i)
+                        if not pending_deps[dependent]:
+                            ready.append(dependent)
+                ready.sort()
+
+            sections_content = []
+            for i, section_plan in enumerate(writing_plan):
+                if i in validations:
+                    try:
+                        validation = validations[i].result()
+                    except Exception as e:
+                        errors[i] = f"Failed to generate section {section_plan['title']}: {str(e)}"
+                        print(f"  ✗ Section {i+1}/{total}: {errors[i]}")
+                        continue
+                    section_content = generated[i]
+                    section_content["validation"] = validation
+                    sections_content.append(section_content)
+                    print(f"  ✓ Section {i+1}/{total}: {section_plan['title']} "
+                          f"({len(section_content['content'].split())} words, "
+                          f"score: {validation['overall_score']:.1f})")
+                elif i not in errors:
+                    errors[i] = f"Failed to generate section {section_plan['title']}: unresolved dependencies"
+
+        results["errors"].extend(errors[i] for i in sorted(errors))
+        return sections_content
+
     def _generate_section_content(self, section_plan: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate content for a single section with full pipeline"""
         # Get continuity context
-        continuity_data = self.continuity_manager.get_context_for_section(section_plan["title"])
+        with self._continuity_lock:
+            continuity_data = self.continuity_manager.get_context_for_section(section_plan["title"])
 
         # Generate initial content
         section_content = self.content_generator.generate_section_content(
@@ -143,7 +217,8 @@ class DraftPipeline:
         section_content["content"] = harmonized_content
 
         # Update continuity with new content
-        self.continuity_manager.update_from_content(section_content)
+        with self._continuity_lock:
+            self.continuity_manager.update_from_content(section_content)
 
         return section_content
 
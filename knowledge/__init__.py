@@ -3,5 +3,6 @@ GOAT Knowledge Module - Semantic understanding and learning paths
 """
 
 from .graph import KnowledgeGraph
+from .vector_index import VectorIndex, HashingEmbedder
 
-__all__ = ["KnowledgeGraph"]
+__all__ = ["KnowledgeGraph", "VectorIndex", "HashingEmbedder"]
@@ -0,0 +1,340 @@
+"""
+GOAT Vector Index - CPU approximate nearest-neighbour search
+
+IVF-flat index over float32 vectors. Vectors live in a memory-mapped
+.npy file, ids and inverted-list assignments in SQLite. Until enough
+vectors have been added to train centroids, search is exact (flat).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+
+class HashingEmbedder:
+    """
+    Deterministic text embedding via feature hashing of words and word pairs.
+    Needs no model download, so it works on CPU-only boxes out of the box.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed text into a unit-length float32 vector"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        tokens = re.findall(r"\w+", text.lower())
+        features = tokens + [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+
+        for feature in features:
+            digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+            vector[digest % self.dim] += 1.0 if digest >> 63 else -1.0
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        return np.stack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dim), np.float32)
+
+
+class VectorIndex:
+    """
+    Persistent IVF-flat index with cosine similarity
+
+    Vectors are L2-normalized on insert, so scores are cosine similarities.
+    Inserts and deletes are incremental; slots of deleted vectors are reused.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, index_dir: Path, dim: int, nprobe: int = 8,
+                 train_threshold: int = 4096):
+        """
+        Open or create a vector index
+
+        Args:
+            index_dir: Directory holding vectors.npy, centroids.npy and index.db
+            dim: Vector dimensionality
+            nprobe: Inverted lists scanned per query once trained
+            train_threshold: Vector count at which centroids are first trained
+        """
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+
+        self.vectors_path = self.index_dir / "vectors.npy"
+        self.centroids_path = self.index_dir / "centroids.npy"
+        self._lock = threading.RLock()
+
+        self.conn = sqlite3.connect(str(self.index_dir / "index.db"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+        self._load()
+
+    def _init_db(self):
+        """Initialize index schema"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id TEXT PRIMARY KEY,
+                    slot INTEGER NOT NULL UNIQUE,
+                    list_id INTEGER NOT NULL
+                )
+            """)
+
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    def _get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _load(self):
+        """Map vectors from disk and rebuild in-memory inverted lists"""
+        stored_dim = self._get_meta("dim")
+        if stored_dim is not None and int(stored_dim) != self.dim:
+            raise ValueError(f"Index at {self.index_dir} has dim {stored_dim}, not {self.dim}")
+
+        if self.vectors_path.exists():
+            self._vectors = np.load(self.vectors_path, mmap_mode="r+")
+        else:
+            self._vectors = np.lib.format.open_memmap(
+                self.vectors_path, mode="w+", dtype=np.float32, shape=(self.INITIAL_CAPACITY, self.dim)
+            )
+
+        self._centroids = np.load(self.centroids_path) if self.centroids_path.exists() else None
+        self._next_slot = int(self._get_meta("next_slot", "0"))
+        self._trained_count = int(self._get_meta("trained_count", "0"))
+
+        self._slot_ids: Dict[int, str] = {}
+        self._id_slots: Dict[str, int] = {}
+        self._slot_lists: Dict[int, int] = {}
+        self._lists: Dict[int, Set[int]] = {}
+        for item_id, slot, list_id in self.conn.execute("SELECT id, slot, list_id FROM items"):
+            self._slot_ids[slot] = item_id
+            self._id_slots[item_id] = slot
+            self._slot_lists[slot] = list_id
+            self._lists.setdefault(list_id, set()).add(slot)
+
+        self._free_slots = sorted(set(range(self._next_slot)) - self._slot_ids.keys(), reverse=True)
+        self._list_arrays: Dict[int, np.ndarray] = {}
+
+        with self.conn:
+            self._set_meta("dim", self.dim)
+
+    def __len__(self) -> int:
+        return len(self._slot_ids)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _normalize(self, vectors) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        slot = self._next_slot
+        self._next_slot += 1
+        if slot >= self._vectors.shape[0]:
+            self._grow(max(self._vectors.shape[0] * 2, slot + 1))
+        return slot
+
+    def _grow(self, capacity: int):
+        """Reallocate the vector file with a larger capacity"""
+        tmp_path = self.vectors_path.with_suffix(".tmp.npy")
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(capacity, self.dim))
+        grown[:self._vectors.shape[0]] = self._vectors
+        grown.flush()
+        del grown
+        del self._vectors
+        os.replace(tmp_path, self.vectors_path)
+        self._vectors = np.load(self.vectors_path, mmap_mode="r+")
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Inverted list for each vector (-1 while untrained)"""
+        if self._centroids is None:
+            return np.full(len(vectors), -1, dtype=np.int64)
+        return np.argmax(vectors @ self._centroids.T, axis=1)
+
+    def _move_slot(self, slot: int, list_id: Optional[int]):
+        """Move a slot between inverted lists (None removes it)"""
+        old_list = self._slot_lists.pop(slot, None)
+        if old_list is not None:
+            self._lists[old_list].discard(slot)
+            self._list_arrays.pop(old_list, None)
+        if list_id is not None:
+            self._slot_lists[slot] = list_id
+            self._lists.setdefault(list_id, set()).add(slot)
+            self._list_arrays.pop(list_id, None)
+
+    def add(self, ids: Sequence[str], vectors) -> int:
+        """
+        Insert or replace vectors
+
+        Args:
+            ids: Item identifiers
+            vectors: Array of shape (len(ids), dim)
+
+        Returns:
+            Number of vectors written
+        """
+        vectors = self._normalize(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have the same length")
+
+        with self._lock:
+            list_ids = self._assign(vectors)
+            rows = []
+            for item_id, vector, list_id in zip(ids, vectors, list_ids):
+                slot = self._id_slots.get(item_id)
+                if slot is None:
+                    slot = self._allocate_slot()
+                    self._slot_ids[slot] = item_id
+                    self._id_slots[item_id] = slot
+                self._vectors[slot] = vector
+                self._move_slot(slot, int(list_id))
+                rows.append((item_id, slot, int(list_id)))
+
+            self._vectors.flush()
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO items (id, slot, list_id) VALUES (?, ?, ?)", rows)
+                self._set_meta("next_slot", self._next_slot)
+
+            if (self._centroids is None and len(self) >= self.train_threshold) or \
+                    (self._trained_count and len(self) > 4 * self._trained_count):
+                self.train()
+
+        return len(rows)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove vectors by id, returning how many were present"""
+        with self._lock:
+            removed = []
+            for item_id in ids:
+                slot = self._id_slots.pop(item_id, None)
+                if slot is None:
+                    continue
+                del self._slot_ids[slot]
+                self._move_slot(slot, None)
+                self._free_slots.append(slot)
+                removed.append((item_id,))
+
+            with self.conn:
+                self.conn.executemany("DELETE FROM items WHERE id = ?", removed)
+
+        return len(removed)
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def train(self, nlist: Optional[int] = None, iterations: int = 10, sample_size: int = 65536):
+        """
+        Train IVF centroids with spherical k-means and reassign all vectors
+
+        Args:
+            nlist: Number of inverted lists (defaults to sqrt of the vector count)
+            iterations: k-means iterations
+            sample_size: Vectors sampled for training
+        """
+        with self._lock:
+            slots = np.fromiter(self._slot_ids.keys(), dtype=np.int64, count=len(self))
+            if not len(slots):
+                return
+
+            nlist = min(nlist or max(1, int(np.sqrt(len(slots)))), len(slots))
+            rng = np.random.default_rng(0)
+            sample = np.asarray(self._vectors[np.sort(rng.choice(slots, min(sample_size, len(slots)), replace=False))])
+
+            centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+            for _ in range(iterations):
+                assignment = np.argmax(sample @ centroids.T, axis=1)
+                for list_id in range(nlist):
+                    members = sample[assignment == list_id]
+                    if len(members):
+                        centroids[list_id] = members.sum(axis=0)
+                    else:
+                        centroids[list_id] = sample[rng.integers(len(sample))]
+                centroids = self._normalize(centroids)
+
+            self._centroids = centroids
+            np.save(self.centroids_path, centroids)
+
+            rows = []
+            for start in range(0, len(slots), 65536):
+                batch = slots[start:start + 65536]
+                for slot, list_id in zip(batch, self._assign(np.asarray(self._vectors[batch]))):
+                    self._move_slot(int(slot), int(list_id))
+                    rows.append((int(list_id), int(slot)))
+
+            self._trained_count = len(slots)
+            with self.conn:
+                self.conn.executemany("UPDATE items SET list_id = ? WHERE slot = ?", rows)
+                self._set_meta("trained_count", self._trained_count)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        array = self._list_arrays.get(list_id)
+        if array is None:
+            members = self._lists.get(list_id, ())
+            array = np.fromiter(members, dtype=np.int64, count=len(members))
+            self._list_arrays[list_id] = array
+        return array
+
+    def search(self, vector, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Approximate k nearest neighbours by cosine similarity
+
+        Returns:
+            (id, score) pairs, best first
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+
+        query = self._normalize(vector)[0]
+
+        with self._lock:
+            if self._centroids is None:
+                probe_lists = list(self._lists)
+            else:
+                nprobe = min(self.nprobe, len(self._centroids))
+                centroid_scores = self._centroids @ query
+                probe_lists = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe].tolist()
+
+            arrays = [self._list_array(list_id) for list_id in probe_lists]
+            candidates = np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)
+            if not len(candidates):
+                return []
+
+            candidates.sort()  # Sequential access into the memory map
+            scores = np.asarray(self._vectors[candidates]) @ query
+
+            k = min(k, len(candidates))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._slot_ids[int(candidates[i])], float(scores[i])) for i in top]
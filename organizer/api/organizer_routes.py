@@ -1,13 +1,15 @@
 # routes/organizer.py
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pathlib import Path
 import uuid
 import shutil
 import logging
 
 from organizer.file_classifier import classify_file, get_root_folder, get_target_folders, _load_config
-from organizer.zip_builder import create_zip_with_manifest
+from organizer.zip_builder import create_zip_with_manifest, StreamingZipBuilder
+from organizer.upload_sink import UploadSink
+from fastapi.concurrency import run_in_threadpool
 from knowledge.graph import KnowledgeGraph
 from vault.core import Vault
 from datetime import datetime
@@ -57,22 +59,19 @@ async def organize_files(
     for folder in get_target_folders():
         (root_folder_path / folder).mkdir(exist_ok=True)
 
-    # Save each file to its correct folder
+    # Stream each file to its correct folder, hashing as it is written
+    sink = UploadSink(root_folder_path)
     for file in files:
         if not file.filename:
             continue
         try:
             category = classify_file(file)
-            target_path = root_folder_path / category / file.filename
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            content = await file.read()
-            with open(target_path, "wb") as buffer:
-                buffer.write(content)
+            await run_in_threadpool(sink.save, file.file, f"{category}/{file.filename}")
             logger.info(f"Saved file {file.filename} to {category}")
         except Exception as e:
             logger.error(f"Failed to save file {file.filename}: {e}")
             continue
+    sink.commit()
 
     # Create final ZIP with manifest
     zip_path = work_dir / "organized_files.zip"
@@ -180,6 +179,19 @@ async def download_zip(session_id: str, current_user: dict = Depends(get_current
         raise HTTPException(status_code=500, detail="Failed to download ZIP")
 
 
+@router.get("/stream/{session_id}")
+async def stream_zip(session_id: str, current_user: dict = Depends(get_current_user_dependency)):
+    """Stream the organized files as a ZIP, built on the fly without staging an archive"""
+    root_folder_path = Path("/tmp/organizer") / session_id / get_root_folder()
+    if not root_folder_path.exists():
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    builder = StreamingZipBuilder(root_folder_path, session_id, current_user.get('email'))
+    return StreamingResponse(iter(builder), media_type='application/zip', headers={
+        'Content-Disposition': 'attachment; filename="organized_files.zip"'
+    })
+
+
 @router.get("/manifest/{session_id}")
 async def get_manifest(session_id: str, current_user: dict = Depends(get_current_user_dependency)):
     """Get manifest for a completed organization session"""
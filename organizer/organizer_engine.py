@@ -1,11 +1,12 @@
 # organizer_engine.py
 
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 from fastapi import UploadFile
 
 from .file_classifier import classify_file
 from .folder_map import get_base_folders, get_root_folder
+from .upload_sink import UploadSink
 
 
 def create_base_structure(base_path: Path) -> Path:
@@ -23,21 +24,22 @@ def create_base_structure(base_path: Path) -> Path:
     return root_dir
 
 
-def save_files(base_path: Path, files: List[UploadFile]) -> None:
+def save_files(base_path: Path, files: List[UploadFile]) -> List[Dict[str, Any]]:
     """
-    Saves incoming files into classified folders inside the structure.
+    Streams incoming files into classified folders inside the structure.
+    Size and SHA256 are recorded in the root folder's sidecar manifest.
+    Returns the manifest entries of the saved files.
     """
     root_dir = base_path / get_root_folder()
+    sink = UploadSink(root_dir)
 
+    entries = []
     for file in files:
         category = classify_file(file)
-        target_folder = root_dir / category
-        target_folder.mkdir(parents=True, exist_ok=True)
+        entries.append(sink.save(file.file, f"{category}/{file.filename}"))
 
-        destination = target_folder / file.filename
-
-        with open(destination, "wb") as out:
-            out.write(file.file.read())
+    sink.commit()
+    return entries
 
 
 def cleanup_empty_folders(base_path: Path) -> None:
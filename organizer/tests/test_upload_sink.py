@@ -0,0 +1,51 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from organizer.upload_sink import UploadSink, SIDECAR_NAME, load_sidecar
+from organizer.zip_builder import create_manifest
+
+def test_save_records_size_and_checksum(tmp_path):
+    data = b"x" * 3_000_000
+    sink = UploadSink(tmp_path, chunk_size=64 * 1024)
+    entry = sink.save(BytesIO(data), "Media/clip.mp4")
+    sink.commit()
+
+    assert (tmp_path / "Media" / "clip.mp4").read_bytes() == data
+    assert entry["size"] == len(data)
+    assert entry["checksum_sha256"] == hashlib.sha256(data).hexdigest()
+    assert load_sidecar(tmp_path)["Media/clip.mp4"]["checksum_sha256"] == entry["checksum_sha256"]
+
+def test_manifest_uses_sidecar_and_skips_it(tmp_path):
+    sink = UploadSink(tmp_path)
+    sink.save(BytesIO(b"hello"), "Notes/a.note")
+    sink.commit()
+
+    manifest = create_manifest(tmp_path, "session")
+
+    assert [f["path"] for f in manifest["files"]] == ["Notes/a.note"]
+    assert manifest["files"][0]["checksum_sha256"] == hashlib.sha256(b"hello").hexdigest()
+    assert (tmp_path / SIDECAR_NAME).exists()
+
+def test_rejects_paths_outside_root(tmp_path):
+    sink = UploadSink(tmp_path / "root")
+    with pytest.raises(ValueError):
+        sink.save(BytesIO(b"x"), "../escape.txt")
+    assert not (tmp_path / "escape.txt").exists()
+
+def test_pending_upload_incremental_and_abort(tmp_path):
+    sink = UploadSink(tmp_path)
+    pending = sink.begin("Media/clip.mp4")
+    for chunk in (b"ab", memoryview(b"cdef")[1:3]):
+        pending.write(chunk)
+    entry = pending.finish()
+
+    assert (tmp_path / "Media" / "clip.mp4").read_bytes() == b"abde"
+    assert entry["checksum_sha256"] == hashlib.sha256(b"abde").hexdigest()
+
+    aborted = sink.begin("Media/other.mp4")
+    aborted.write(b"x")
+    aborted.abort()
+    assert sorted(p.name for p in (tmp_path / "Media").iterdir()) == ["clip.mp4"]
+    assert "Media/other.mp4" not in sink.entries
@@ -0,0 +1,26 @@
+import hashlib
+import io
+import json
+import zipfile
+
+from organizer.zip_builder import StreamingZipBuilder
+
+def test_streaming_zip_single_pass(tmp_path):
+    source = tmp_path / "src"
+    (source / "Code").mkdir(parents=True)
+    (source / "Media").mkdir()
+    (source / "Code" / "main.py").write_text("print('hello')\n" * 1000)
+    (source / "Media" / "clip.mp4").write_bytes(b"\x00\x01" * 5000)
+
+    builder = StreamingZipBuilder(source, "session", "user")
+    archive = b"".join(builder)
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.getinfo("Media/clip.mp4").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("Code/main.py").compress_type == zipfile.ZIP_DEFLATED
+        manifest = json.loads(zipf.read("manifest.json"))
+        for entry in manifest["files"]:
+            assert hashlib.sha256(zipf.read(entry["path"])).hexdigest() == entry["checksum_sha256"]
+
+    assert builder.manifest["total_files"] == 2
@@ -0,0 +1,150 @@
+# upload_sink.py
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+CHUNK_SIZE = 1024 * 1024
+SIDECAR_NAME = ".upload_manifest.json"
+
+
+def load_sidecar(root: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the recorded file entries for a folder, keyed by relative path.
+    Missing or unreadable sidecars yield an empty mapping.
+    """
+    sidecar = Path(root) / SIDECAR_NAME
+    if not sidecar.exists():
+        return {}
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def sidecar_checksum(entries: Dict[str, Dict[str, Any]], rel_path: str, stat: os.stat_result) -> Optional[str]:
+    """
+    Returns the recorded checksum for a file if it is still current
+    (same size and modification time), otherwise None.
+    """
+    entry = entries.get(rel_path)
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["checksum_sha256"]
+    return None
+
+
+class UploadSink:
+    """
+    Streams uploads straight to their final path inside a root folder,
+    hashing and sizing each byte as it is written. Entries are recorded in a
+    sidecar manifest so later manifest/ZIP builds never re-read the files.
+    """
+
+    def __init__(self, root: Path, chunk_size: int = CHUNK_SIZE):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.entries = load_sidecar(self.root)
+        self._buffer = bytearray(chunk_size)
+
+    def _destination(self, relative_path: str) -> Path:
+        destination = (self.root / relative_path).resolve()
+        if not destination.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Upload path escapes target folder: {relative_path}")
+        return destination
+
+    def begin(self, relative_path: str) -> "PendingUpload":
+        """
+        Opens root/relative_path for incremental writes.
+        Call finish() on the result to record the entry, or abort() to discard it.
+        """
+        destination = self._destination(relative_path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        return PendingUpload(self, destination)
+
+    def save(self, source: BinaryIO, relative_path: str) -> Dict[str, Any]:
+        """
+        Streams a file object to root/relative_path.
+        Returns the manifest entry (path, size, checksum_sha256, modified).
+        """
+        pending = self.begin(relative_path)
+        view = memoryview(self._buffer)
+        readinto = getattr(source, "readinto", None)
+
+        try:
+            while True:
+                if readinto is not None:
+                    count = readinto(view)
+                    chunk = view[:count]
+                else:
+                    chunk = source.read(self.chunk_size)
+                    count = len(chunk)
+                if not count:
+                    break
+                pending.write(chunk)
+        except BaseException:
+            pending.abort()
+            raise
+
+        return pending.finish()
+
+    def _record(self, destination: Path, size: int, checksum: str) -> Dict[str, Any]:
+        stat = destination.stat()
+        rel_path = destination.relative_to(self.root.resolve()).as_posix()
+        entry = {
+            "path": rel_path,
+            "size": size,
+            "checksum_sha256": checksum,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "mtime_ns": stat.st_mtime_ns
+        }
+        self.entries[rel_path] = entry
+        return entry
+
+    def commit(self) -> Path:
+        """Writes the sidecar manifest atomically and returns its path"""
+        sidecar = self.root / SIDECAR_NAME
+        tmp = sidecar.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"files": self.entries}, f, indent=2)
+        os.replace(tmp, sidecar)
+        return sidecar
+
+
+class PendingUpload:
+    """
+    A file being written into an UploadSink chunk by chunk. Bytes go to a
+    .part file and are hashed as they arrive; finish() moves it into place.
+    """
+
+    def __init__(self, sink: UploadSink, destination: Path):
+        self.sink = sink
+        self.destination = destination
+        self.partial = destination.with_name(destination.name + ".part")
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._out = open(self.partial, "wb")
+
+    def write(self, chunk) -> None:
+        self._digest.update(chunk)
+        self._out.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> Dict[str, Any]:
+        """Moves the file to its final path and returns its manifest entry"""
+        try:
+            self._out.close()
+            os.replace(self.partial, self.destination)
+        except BaseException:
+            self.abort()
+            raise
+        return self.sink._record(self.destination, self.size, self._digest.hexdigest())
+
+    def abort(self) -> None:
+        """Discards the partially written file"""
+        self._out.close()
+        self.partial.unlink(missing_ok=True)
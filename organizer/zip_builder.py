@@ -4,21 +4,53 @@ import os
 import zipfile
 import hashlib
 import json
+import struct
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 
+from .upload_sink import CHUNK_SIZE, SIDECAR_NAME, load_sidecar, sidecar_checksum
+
+# Already-compressed formats gain nothing from deflate; store them as-is
+STORED_EXTENSIONS = {
+    ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac",
+    ".mp4", ".m4v", ".mov", ".avi", ".mkv", ".webm",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".epub", ".docx", ".xlsx", ".pptx",
+}
+
+DEFLATE_LEVEL = 6
+SPOOL_SIZE = 16 * 1024 * 1024  # compressed output kept in memory up to this size
+ZIP64_LIMIT = (1 << 31) - 1    # same conservative threshold as zipfile
+
 def generate_file_checksum(file_path: Path) -> str:
     """Generate SHA256 checksum for a file"""
     hash_sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
             hash_sha256.update(chunk)
     return hash_sha256.hexdigest()
 
-def create_manifest(source_folder: Path, session_id: str, user_id: str = None) -> Dict[str, Any]:
-    """Create a manifest JSON with file metadata and checksums"""
-    manifest = {
+def _collect_files(source_folder: Path) -> List[Tuple[Path, Path, os.stat_result]]:
+    """Single walk of the source tree: (full path, relative path, stat) per file"""
+    entries = []
+    for root, _, files in os.walk(source_folder):
+        for file in files:
+            full_path = Path(root) / file
+            rel_path = full_path.relative_to(source_folder)
+            if str(rel_path) == SIDECAR_NAME:
+                continue
+            entries.append((full_path, rel_path, full_path.stat()))
+    return entries
+
+def _new_manifest(session_id: str, user_id: str = None) -> Dict[str, Any]:
+    return {
         "manifest_version": "1.0",
         "created_at": datetime.utcnow().isoformat() + "Z",
         "session_id": session_id,
@@ -29,45 +61,251 @@ def create_manifest(source_folder: Path, session_id: str, user_id: str = None) -
         "files": []
     }
 
-    for root, _, files in os.walk(source_folder):
-        for file in files:
-            full_path = Path(root) / file
-            rel_path = full_path.relative_to(source_folder)
-            file_size = full_path.stat().st_size
-            checksum = generate_file_checksum(full_path)
+def _add_manifest_file(manifest: Dict[str, Any], rel_path: Path, stat: os.stat_result, checksum: str) -> None:
+    manifest["files"].append({
+        "path": str(rel_path),
+        "size": stat.st_size,
+        "checksum_sha256": checksum,
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+    })
+    manifest["total_files"] += 1
+    manifest["total_size"] += stat.st_size
+
+def create_manifest(source_folder: Path, session_id: str, user_id: str = None) -> Dict[str, Any]:
+    """Create a manifest JSON with file metadata and checksums"""
+    manifest = _new_manifest(session_id, user_id)
 
-            manifest["files"].append({
-                "path": str(rel_path),
-                "size": file_size,
-                "checksum_sha256": checksum,
-                "modified": datetime.fromtimestamp(full_path.stat().st_mtime).isoformat()
-            })
+    # Files streamed in through the upload sink were hashed on arrival
+    recorded = load_sidecar(source_folder)
 
-            manifest["total_files"] += 1
-            manifest["total_size"] += file_size
+    for full_path, rel_path, stat in _collect_files(source_folder):
+        checksum = sidecar_checksum(recorded, rel_path.as_posix(), stat) or generate_file_checksum(full_path)
+        _add_manifest_file(manifest, rel_path, stat, checksum)
 
     return manifest
 
-def create_zip_with_manifest(source_folder: Path, zip_path: Path, session_id: str, user_id: str = None) -> Dict[str, Any]:
+def _deflate_file(file_path: Path, hash_content: bool) -> Dict[str, Any]:
     """
-    Creates a ZIP archive with manifest and checksums.
-    Returns the manifest data.
+    Worker: read a file once, computing CRC32 and (optionally) SHA256
+    while deflating it into a spooled buffer.
     """
-    manifest = create_manifest(source_folder, session_id, user_id)
+    digest = hashlib.sha256() if hash_content else None
+    compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    crc = 0
+    size = 0
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        # Add manifest first
-        manifest_json = json.dumps(manifest, indent=2)
-        zipf.writestr("manifest.json", manifest_json)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            if digest:
+                digest.update(chunk)
+            spool.write(compressor.compress(chunk))
+    spool.write(compressor.flush())
+    spool.seek(0)
 
-        # Add all files
-        for root, _, files in os.walk(source_folder):
-            for file in files:
-                full_path = Path(root) / file
-                rel_path = full_path.relative_to(source_folder)
-                zipf.write(full_path, arcname=rel_path)
+    return {"data": spool, "crc": crc, "size": size, "checksum": digest.hexdigest() if digest else None}
 
-    return manifest
+def _read_stored(file_path: Path, info: Dict[str, Any], hash_content: bool) -> Iterator[bytes]:
+    """Yield a file's bytes unchanged, filling CRC32/size/SHA256 into info once exhausted"""
+    digest = hashlib.sha256() if hash_content else None
+    crc = 0
+    size = 0
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            if digest:
+                digest.update(chunk)
+            yield chunk
+    info.update(crc=crc, size=size, checksum=digest.hexdigest() if digest else None)
+
+def _read_spool(spool) -> Iterator[bytes]:
+    try:
+        for chunk in iter(lambda: spool.read(CHUNK_SIZE), b""):
+            yield chunk
+    finally:
+        spool.close()
+
+def _dos_datetime(mtime: float) -> Tuple[int, int]:
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+class _ZipStreamWriter:
+    """
+    Minimal sequential ZIP writer for non-seekable outputs.
+    Every entry carries a data descriptor, so sizes and CRCs never need
+    to be patched back into local headers; ZIP64 records are emitted as needed.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self.records = []
+
+    def _emit(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
+
+    def entry(self, name: str, mtime: float, method: int, chunks: Iterable[bytes],
+              info: Dict[str, Any], zip64: bool) -> Iterator[bytes]:
+        """Yield the bytes of one entry; info must hold crc and size once chunks are exhausted"""
+        encoded = name.encode("utf-8")
+        flags = 0x08 | 0x800  # data descriptor, UTF-8 names
+        version = 45 if zip64 else 20
+        dostime, dosdate = _dos_datetime(mtime)
+        extra = struct.pack("<HHQQ", 0x0001, 16, 0, 0) if zip64 else b""
+        placeholder = 0xFFFFFFFF if zip64 else 0
+        offset = self.offset
+
+        yield self._emit(struct.pack(
+            "<IHHHHHIIIHH", 0x04034b50, version, flags, method, dostime, dosdate,
+            0, placeholder, placeholder, len(encoded), len(extra)
+        ) + encoded + extra)
+
+        compressed_size = 0
+        for chunk in chunks:
+            compressed_size += len(chunk)
+            yield self._emit(chunk)
+
+        if zip64:
+            descriptor = struct.pack("<IIQQ", 0x08074b50, info["crc"], compressed_size, info["size"])
+        else:
+            descriptor = struct.pack("<IIII", 0x08074b50, info["crc"], compressed_size, info["size"])
+        yield self._emit(descriptor)
+
+        self.records.append((encoded, flags, method, dostime, dosdate, info["crc"],
+                             compressed_size, info["size"], offset))
+
+    def finish(self) -> Iterator[bytes]:
+        """Yield the central directory and end records"""
+        cd_offset = self.offset
+        for encoded, flags, method, dostime, dosdate, crc, compressed_size, size, offset in self.records:
+            zip64_fields = [value for value in (size, compressed_size, offset) if value >= 0xFFFFFFFF]
+            extra = struct.pack(f"<HH{len(zip64_fields)}Q", 0x0001, 8 * len(zip64_fields), *zip64_fields) \
+                if zip64_fields else b""
+            version = 45 if zip64_fields else 20
+
+            yield self._emit(struct.pack(
+                "<IHHHHHHIIIHHHHHII", 0x02014b50, (3 << 8) | 45, version, flags, method,
+                dostime, dosdate, crc, min(compressed_size, 0xFFFFFFFF), min(size, 0xFFFFFFFF),
+                len(encoded), len(extra), 0, 0, 0, 0o100644 << 16, min(offset, 0xFFFFFFFF)
+            ) + encoded + extra)
+
+        cd_size = self.offset - cd_offset
+        count = len(self.records)
+        if count >= 0xFFFF or cd_offset >= 0xFFFFFFFF or cd_size >= 0xFFFFFFFF:
+            zip64_end_offset = self.offset
+            yield self._emit(struct.pack("<IQHHIIQQQQ", 0x06064b50, 44, 45, 45, 0, 0,
+                                         count, count, cd_size, cd_offset))
+            yield self._emit(struct.pack("<IIQI", 0x07064b50, 0, zip64_end_offset, 1))
+
+        yield self._emit(struct.pack(
+            "<IHHHHIIH", 0x06054b50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+            min(cd_size, 0xFFFFFFFF), min(cd_offset, 0xFFFFFFFF), 0
+        ))
+
+class StreamingZipBuilder:
+    """
+    Builds a ZIP (with manifest) in one walk of the source tree.
+
+    Files are hashed and deflated in the same read by a pool of worker
+    threads (zlib releases the GIL); already-compressed media is stored.
+    Iterating the builder yields the archive bytes in order, so it can be
+    written to disk or handed straight to a StreamingResponse. The manifest
+    is the last entry, and is available on .manifest once iteration ends.
+    """
+
+    def __init__(self, source_folder: Path, session_id: str = None, user_id: str = None,
+                 arc_root: str = "", include_manifest: bool = True, max_workers: Optional[int] = None):
+        self.source_folder = Path(source_folder)
+        self.session_id = session_id
+        self.user_id = user_id
+        self.arc_root = arc_root.strip("/")
+        self.include_manifest = include_manifest
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.manifest: Optional[Dict[str, Any]] = None
+
+    def _arcname(self, rel_path: Path) -> str:
+        name = rel_path.as_posix()
+        return f"{self.arc_root}/{name}" if self.arc_root else name
+
+    def __iter__(self) -> Iterator[bytes]:
+        files = _collect_files(self.source_folder)
+        recorded = load_sidecar(self.source_folder)
+        manifest = _new_manifest(self.session_id, self.user_id)
+        writer = _ZipStreamWriter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = deque()
+        remaining = iter(files)
+
+        def fill():
+            # Keep a bounded window of files in flight ahead of the writer
+            while len(pending) < 2 * self.max_workers:
+                item = next(remaining, None)
+                if item is None:
+                    return
+                full_path, rel_path, stat = item
+                known = sidecar_checksum(recorded, rel_path.as_posix(), stat)
+                if full_path.suffix.lower() in STORED_EXTENSIONS:
+                    pending.append((item, known, None))
+                else:
+                    pending.append((item, known, executor.submit(_deflate_file, full_path, known is None)))
+
+        try:
+            fill()
+            while pending:
+                (full_path, rel_path, stat), known, future = pending.popleft()
+                fill()
+                zip64 = stat.st_size > ZIP64_LIMIT
+
+                if future is None:
+                    info: Dict[str, Any] = {}
+                    chunks = _read_stored(full_path, info, known is None)
+                    yield from writer.entry(self._arcname(rel_path), stat.st_mtime, zipfile.ZIP_STORED,
+                                            chunks, info, zip64)
+                else:
+                    info = future.result()
+                    yield from writer.entry(self._arcname(rel_path), stat.st_mtime, zipfile.ZIP_DEFLATED,
+                                            _read_spool(info["data"]), info, zip64)
+
+                _add_manifest_file(manifest, rel_path, stat, known or info["checksum"])
+
+            if self.include_manifest:
+                data = json.dumps(manifest, indent=2).encode("utf-8")
+                compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+                compressed = compressor.compress(data) + compressor.flush()
+                info = {"crc": zlib.crc32(data), "size": len(data)}
+                yield from writer.entry(self._arcname(Path("manifest.json")), time.time(),
+                                        zipfile.ZIP_DEFLATED, [compressed], info, False)
+
+            yield from writer.finish()
+            self.manifest = manifest
+
+        finally:
+            # Also reached when a streaming client disconnects mid-archive
+            executor.shutdown(wait=True, cancel_futures=True)
+            for _, _, future in pending:
+                if future is not None and future.done() and not future.cancelled() and future.exception() is None:
+                    future.result()["data"].close()
+
+    def write_to(self, zip_path: Path) -> Dict[str, Any]:
+        """Write the archive to a file and return the manifest"""
+        with open(zip_path, "wb") as out:
+            for chunk in self:
+                out.write(chunk)
+        return self.manifest
+
+def create_zip_with_manifest(source_folder: Path, zip_path: Path, session_id: str, user_id: str = None) -> Dict[str, Any]:
+    """
+    Creates a ZIP archive with manifest and checksums.
+    Returns the manifest data.
+    """
+    return StreamingZipBuilder(source_folder, session_id, user_id).write_to(zip_path)
 
 def create_zip(source_folder: Path, zip_path: Path) -> None:
     """
@@ -333,6 +333,15 @@ async def render_audiobook(request: AudiobookRenderRequest, background_tasks: Ba
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start audiobook rendering: {str(e)}")
 
+@router.get("/audiobook/progress")
+async def get_audiobook_progress(output_path: Optional[str] = None):
+    """Get per-chapter rendering progress of an audiobook (or of all audiobooks)"""
+    try:
+        return JSONResponse(content=audiobook_renderer.get_render_progress(output_path))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get rendering progress: {str(e)}")
+
 @router.post("/audiobook/preview")
 async def render_voice_preview(request: VoicePreviewRequest):
     """Generate voice preview"""
@@ -391,7 +400,9 @@ async def get_voice_system_status():
         status = {
             "voice_engine": {
                 "available": True,
-                "pom_integration": voice_engine.pom.__class__.__name__ != "PhonatoryOutputModule"
+                "pom_integration": voice_engine.pom.__class__.__name__ != "PhonatoryOutputModule",
+                "models": await voice_engine.get_model_status(),
+                "tts_pool": voice_engine.get_tts_pool_stats()
             },
             "character_mapper": {
                 "characters_loaded": len(character_mapper.characters),
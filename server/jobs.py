@@ -0,0 +1,269 @@
+"""
+GOAT Background Jobs - persistent, bounded job engine
+
+Jobs are recorded in SQLite so their status survives restarts, and run on a
+shared thread pool so blocking work (copytree, uploads) never runs on the
+event loop. Each job type has its own concurrency cap; jobs over the cap wait
+in a per-type queue instead of occupying a worker.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# A handler receives the job params and a progress callback (0-100) and
+# returns a JSON-serializable result
+JobHandler = Callable[[Dict[str, Any], Callable[[int], None]], Any]
+
+FINISHED_STATUSES = ("completed", "failed")
+
+
+class JobManager:
+    """SQLite-backed job table with a bounded worker pool"""
+
+    EVICT_INTERVAL = 60  # seconds between opportunistic TTL sweeps
+
+    def __init__(self, db_path: Path, max_workers: int = 4, ttl_seconds: int = 86400):
+        """
+        Open or create the job table
+
+        Args:
+            db_path: SQLite database file
+            max_workers: Jobs running at once across all types
+            ttl_seconds: How long finished jobs are kept before eviction
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="goat-job")
+        self._handlers: Dict[str, JobHandler] = {}
+        self._limits: Dict[str, int] = {}
+        self._running: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[str]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._last_evict = 0.0
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+        self._recover()
+
+    def _init_db(self):
+        """Initialize job schema"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    finished_at REAL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, type)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at)")
+
+    def _recover(self):
+        """Fail jobs that were running when the previous process stopped"""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, updated_at = ?, finished_at = ? "
+                "WHERE status = 'running'",
+                ("Interrupted by server restart", datetime.utcnow().isoformat(), time.time())
+            )
+        if cursor.rowcount:
+            logger.warning(f"Marked {cursor.rowcount} interrupted job(s) as failed")
+
+    # ------------------------------------------------------------------
+    # Registration and submission
+    # ------------------------------------------------------------------
+
+    def register(self, task_type: str, handler: JobHandler, max_concurrent: int = 1):
+        """
+        Register a handler for a job type
+
+        Pending jobs of this type left over from a previous run are queued again.
+        """
+        with self._lock:
+            self._handlers[task_type] = handler
+            self._limits[task_type] = max(1, max_concurrent)
+            self._running.setdefault(task_type, 0)
+            queue = self._queues.setdefault(task_type, deque())
+
+            rows = self.conn.execute(
+                "SELECT id FROM jobs WHERE type = ? AND status = 'pending' ORDER BY created_at",
+                (task_type,)
+            ).fetchall()
+            for row in rows:
+                if row["id"] not in queue:
+                    queue.append(row["id"])
+                    self._futures[row["id"]] = Future()
+
+        self._dispatch()
+
+    def create_job(self, task_type: str, params: Dict[str, Any]) -> str:
+        """Persist a pending job and queue it for execution"""
+        if task_type not in self._handlers:
+            raise ValueError(f"No handler registered for job type '{task_type}'")
+
+        self.evict_expired()
+        job_id = f"{task_type}_{uuid.uuid4().hex[:12]}"
+        now = datetime.utcnow().isoformat()
+
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO jobs (id, type, status, params, created_at, updated_at) "
+                    "VALUES (?, ?, 'pending', ?, ?, ?)",
+                    (job_id, task_type, json.dumps(params), now, now)
+                )
+            self._queues[task_type].append(job_id)
+            self._futures[job_id] = Future()
+
+        self._dispatch()
+        return job_id
+
+    def _dispatch(self):
+        """Start queued jobs while their type is under its concurrency cap"""
+        with self._lock:
+            for task_type, queue in self._queues.items():
+                while queue and self._running[task_type] < self._limits[task_type]:
+                    job_id = queue.popleft()
+                    self._running[task_type] += 1
+                    self._executor.submit(self._run, job_id, task_type)
+
+    def _run(self, job_id: str, task_type: str):
+        """Execute one job on a worker thread"""
+        try:
+            row = self.get_job(job_id)
+            if row is None:
+                return
+
+            self._update(job_id, status="running", progress=0)
+            result = self._handlers[task_type](row["params"], lambda pct: self._update(job_id, progress=pct))
+            self._update(job_id, status="completed", progress=100,
+                         result=json.dumps(result), finished_at=time.time())
+
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            self._update(job_id, status="failed", error=str(e), finished_at=time.time())
+
+        finally:
+            with self._lock:
+                self._running[task_type] -= 1
+                future = self._futures.pop(job_id, None)
+            if future:
+                future.set_result(self.get_job(job_id))
+            self._dispatch()
+
+    def _update(self, job_id: str, **fields):
+        """Write job fields"""
+        fields["updated_at"] = datetime.utcnow().isoformat()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock, self.conn:
+            self.conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "type": row["type"],
+            "status": row["status"],
+            "params": json.loads(row["params"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "progress": row["progress"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"]
+        }
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by id"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, task_type: Optional[str] = None,
+                  limit: int = 100) -> List[Dict[str, Any]]:
+        """List most recent jobs, optionally filtered"""
+        self.evict_expired()
+        clauses: List[str] = []
+        args: List[Any] = []
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if task_type:
+            clauses.append("type = ?")
+            args.append(task_type)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?", (*args, limit)
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and running count per job type"""
+        with self._lock:
+            return {
+                task_type: {
+                    "running": self._running[task_type],
+                    "queued": len(self._queues[task_type]),
+                    "max_concurrent": self._limits[task_type]
+                }
+                for task_type in self._handlers
+            }
+
+    async def wait(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Await a job without blocking the event loop"""
+        future = self._futures.get(job_id)
+        if future is not None:
+            return await asyncio.wrap_future(future)
+        return self.get_job(job_id)
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def evict_expired(self, force: bool = False) -> int:
+        """Delete finished jobs older than the TTL, returning how many were removed"""
+        now = time.time()
+        if not force and now - self._last_evict < self.EVICT_INTERVAL:
+            return 0
+        self._last_evict = now
+
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATUSES, now - self.ttl_seconds)
+            )
+        return cursor.rowcount
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and close the database"""
+        self._executor.shutdown(wait=wait)
+        self.conn.close()
@@ -21,7 +21,6 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from pathlib import Path
-import asyncio
 from datetime import datetime, timedelta
 import hashlib
 import secrets
@@ -44,6 +43,7 @@ from knowledge.graph import KnowledgeGraph
 from licenser.verifier import Verifier
 from vault_forge.vault_generator import create_vault
 from learning.ucm_bridge import UCMBridge
+from server.jobs import JobManager
 
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -156,55 +156,39 @@ def require_auth(api_key: str = None):
     return verify_api_key(api_key)
 
 # Background Job System
-job_store = {}
-job_counter = 0
+JOB_DB_PATH = Path(os.getenv("JOB_DB_PATH", "./data/jobs/jobs.db"))
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "86400"))
+VAULT_FORGE_MAX_CONCURRENT = int(os.getenv("VAULT_FORGE_MAX_CONCURRENT", "1"))
+
+job_manager = JobManager(JOB_DB_PATH, max_workers=JOB_MAX_WORKERS, ttl_seconds=JOB_TTL_SECONDS)
 
 def create_job(task_type: str, params: Dict[str, Any]) -> str:
     """Create a background job"""
-    global job_counter
-    job_counter += 1
-    job_id = f"{task_type}_{job_counter}_{int(datetime.utcnow().timestamp())}"
-
-    job_store[job_id] = {
-        "id": job_id,
-        "type": task_type,
-        "status": "pending",
-        "params": params,
-        "created_at": datetime.utcnow().isoformat(),
-        "progress": 0,
-        "result": None,
-        "error": None
-    }
-
-    return job_id
+    return job_manager.create_job(task_type, params)
 
 def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
     """Get job status"""
-    return job_store.get(job_id)
-
-async def run_vault_forge_job(job_id: str, project_name: str, tier: str, deliverables_path: str, auto_upload: bool):
-    """Run vault forge as background job"""
-    try:
-        job_store[job_id]["status"] = "running"
-        job_store[job_id]["progress"] = 10
-
-        # Simulate progress updates
-        await asyncio.sleep(1)
-        job_store[job_id]["progress"] = 30
-
-        zip_path = create_vault(project_name, tier, deliverables_path, auto_upload)
+    return job_manager.get_job(job_id)
+
+def run_vault_forge_job(params: Dict[str, Any], report_progress) -> Dict[str, Any]:
+    """Run vault forge as background job (executes on a job worker thread)"""
+    report_progress(10)
+    zip_path = create_vault(
+        params["project_name"],
+        params["tier"],
+        params["deliverables_path"],
+        params["auto_upload"]
+    )
+    report_progress(100)
 
-        job_store[job_id]["progress"] = 100
-        job_store[job_id]["status"] = "completed"
-        job_store[job_id]["result"] = {
-            "vault_zip": zip_path,
-            "tier": tier,
-            "auto_upload": auto_upload
-        }
+    return {
+        "vault_zip": zip_path,
+        "tier": params["tier"],
+        "auto_upload": params["auto_upload"]
+    }
 
-    except Exception as e:
-        job_store[job_id]["status"] = "failed"
-        job_store[job_id]["error"] = str(e)
+job_manager.register("vault_forge", run_vault_forge_job, max_concurrent=VAULT_FORGE_MAX_CONCURRENT)
 
 # Import auth functions
 # from server.auth import create_default_admin
@@ -688,20 +672,31 @@ async def create_vault_package(
     tier: str = "basic",
     deliverables_path: str = "./deliverables",
     auto_upload: bool = False,
+    background: bool = False,
     api_key: str = Depends(require_auth)
 ):
     """Create immutable vault package for permanent storage"""
-    try:
-        zip_path = create_vault(project_name, tier, deliverables_path, auto_upload)
-        return {
-            "success": True,
-            "vault_zip": zip_path,
-            "tier": tier,
-            "auto_upload": auto_upload,
-            "message": f"Vault package created for {project_name}"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    job_id = create_job("vault_forge", {
+        "project_name": project_name,
+        "tier": tier,
+        "deliverables_path": deliverables_path,
+        "auto_upload": auto_upload
+    })
+    if background:
+        return {"success": True, "job_id": job_id, "status": "pending"}
+
+    job = await job_manager.wait(job_id)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=500, detail=job["error"])
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "vault_zip": job["result"]["vault_zip"],
+        "tier": tier,
+        "auto_upload": auto_upload,
+        "message": f"Vault package created for {project_name}"
+    }
 
 # ===== ON-CHAIN ANCHOR ENDPOINTS =====
 
@@ -745,9 +740,15 @@ async def get_job(job_id: str, api_key: str = Depends(require_auth)):
     return job
 
 @app.get("/api/jobs")
-async def list_jobs(api_key: str = Depends(require_auth)):
-    """List all jobs"""
-    return {"jobs": list(job_store.values()), "count": len(job_store)}
+async def list_jobs(
+    status: Optional[str] = None,
+    task_type: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    api_key: str = Depends(require_auth)
+):
+    """List recent jobs"""
+    jobs = job_manager.list_jobs(status=status, task_type=task_type, limit=limit)
+    return {"jobs": jobs, "count": len(jobs), "queues": job_manager.stats()}
 
 # ===== CALEON CHAT ENDPOINTS =====
 
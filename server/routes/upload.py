@@ -2,15 +2,18 @@
 GOAT Upload Routes - File Upload and Processing
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from multipart.multipart import MultipartParser, parse_options_header
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import uuid
 from datetime import datetime
 import os
-import shutil
 from pathlib import Path
 
+from organizer.upload_sink import UploadSink
+
 router = APIRouter()
 
 class UploadResponse(BaseModel):
@@ -20,6 +23,7 @@ class UploadResponse(BaseModel):
     content_type: str
     status: str
     processing_url: str
+    checksum_sha256: Optional[str] = None
 
 class ProcessingResult(BaseModel):
     upload_id: str
@@ -32,27 +36,84 @@ class ProcessingResult(BaseModel):
 UPLOAD_DIR = "data/uploads"
 VAULT_DIR = "data/vault"
 
+ALLOWED_TYPES = [
+    'audio/mpeg', 'audio/wav', 'audio/mp4', 'audio/x-m4a',
+    'video/mp4', 'video/quicktime', 'video/x-msvideo'
+]
+
+async def _stream_file_part(request: Request, sink: UploadSink, field_name: str = "file") -> Tuple[Dict[str, Any], str]:
+    """
+    Parses a multipart/form-data body as it arrives and writes the named file
+    part straight into the sink, so each byte is read from the network once.
+    Returns the sink entry and the part's content type.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+    # Parser callbacks only queue events; file writes happen off the event loop below
+    events: List[Tuple[str, Any]] = []
+    headers: Dict[bytes, bytes] = {}
+    field, value = bytearray(), bytearray()
+
+    def on_header_end():
+        headers[bytes(field).lower()] = bytes(value)
+        field.clear()
+        value.clear()
+
+    parser = MultipartParser(params[b"boundary"], callbacks={
+        "on_part_begin": headers.clear,
+        "on_header_field": lambda data, start, end: field.extend(data[start:end]),
+        "on_header_value": lambda data, start, end: value.extend(data[start:end]),
+        "on_header_end": on_header_end,
+        "on_headers_finished": lambda: events.append(("headers", dict(headers))),
+        "on_part_data": lambda data, start, end: events.append(("data", memoryview(data)[start:end])),
+        "on_part_end": lambda: events.append(("end", None)),
+    })
+
+    pending = None
+    entry = part_type = None
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for kind, payload in events:
+                if kind == "headers":
+                    _, options = parse_options_header(payload.get(b"content-disposition", b""))
+                    if entry is None and options.get(b"name") == field_name.encode():
+                        part_type = payload.get(b"content-type", b"").decode("latin-1")
+                        if part_type not in ALLOWED_TYPES:
+                            raise HTTPException(
+                                status_code=400,
+                                detail=f"Unsupported file type: {part_type}. Allowed: {', '.join(ALLOWED_TYPES)}"
+                            )
+                        filename = options.get(b"filename", b"").decode("utf-8", "replace")
+                        pending = await run_in_threadpool(sink.begin, filename or "upload")
+                elif kind == "data" and pending is not None:
+                    await run_in_threadpool(pending.write, payload)
+                elif kind == "end" and pending is not None:
+                    entry = await run_in_threadpool(pending.finish)
+                    pending = None
+            events.clear()
+        parser.finalize()
+    finally:
+        if pending is not None:
+            pending.abort()
+
+    if entry is None:
+        raise HTTPException(status_code=400, detail=f"Missing file field: {field_name}")
+    return entry, part_type
+
 @router.post("/file", response_model=UploadResponse)
 async def upload_file(
-    file: UploadFile = File(...),
+    request: Request,
     background_tasks: BackgroundTasks = BackgroundTasks()
 ):
     """
     Upload audio/video file for processing
+
+    Expects a multipart/form-data body with the media in the "file" field.
     """
     try:
-        # Validate file type
-        allowed_types = [
-            'audio/mpeg', 'audio/wav', 'audio/mp4', 'audio/x-m4a',
-            'video/mp4', 'video/quicktime', 'video/x-msvideo'
-        ]
-
-        if file.content_type not in allowed_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type: {file.content_type}. Allowed: {', '.join(allowed_types)}"
-            )
-
         # Generate upload ID
         upload_id = str(uuid.uuid4())
 
@@ -62,25 +123,29 @@ async def upload_file(
         upload_path.mkdir(parents=True, exist_ok=True)
         vault_path.mkdir(parents=True, exist_ok=True)
 
-        # Save uploaded file
-        file_path = upload_path / file.filename
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Stream the request body to disk, validating and hashing as it is written
+        sink = UploadSink(upload_path)
+        entry, content_type = await _stream_file_part(request, sink)
+        sink.commit()
 
-        file_size = file_path.stat().st_size
+        file_path = upload_path / entry["path"]
+        file_size = entry["size"]
 
         # Start background processing
-        background_tasks.add_task(process_upload, upload_id, str(file_path), file.content_type)
+        background_tasks.add_task(process_upload, upload_id, str(file_path), content_type)
 
         return UploadResponse(
             upload_id=upload_id,
-            filename=file.filename,
+            filename=entry["path"],
             file_size=file_size,
-            content_type=file.content_type,
+            content_type=content_type,
             status="uploaded",
-            processing_url=f"/upload/status/{upload_id}"
+            processing_url=f"/upload/status/{upload_id}",
+            checksum_sha256=entry["checksum_sha256"]
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
@@ -8,6 +8,8 @@ Premium feature for Legacy tier users
 import os
 import re
 import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
@@ -27,13 +29,21 @@ except LookupError:
     nltk.download('vader_lexicon', quiet=True)
     nltk.download('stopwords', quiet=True)
 
+def _analyze_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Process pool entry point: analyze one file with the worker's own service instance"""
+    return premium_content_archaeology_service._analyze_single_file_sync(file_path)
+
 class PremiumContentArchaeologyService:
     """
     PREMIUM Content Archaeology Engine - Multi-file intelligence.
     Cross-references scattered files to discover hidden narratives and connections.
     """
 
-    def __init__(self):
+    # Files analyzed per worker process before it is recycled, bounding memory growth
+    MAX_FILES_PER_WORKER = 25
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.sia = SentimentIntensityAnalyzer()
         self.stop_words = set(stopwords.words('english'))
 
@@ -92,17 +102,8 @@ class PremiumContentArchaeologyService:
 
         analysis_start = datetime.utcnow()
 
-        # Phase 1: Individual file analysis
-        individual_analyses = {}
-        for i, file_path in enumerate(file_paths):
-            if os.path.exists(file_path):
-                try:
-                    print(f"  📄 Analyzing file {i+1}/{len(file_paths)}: {Path(file_path).name}")
-                    file_analysis = await self._analyze_single_file_premium(file_path)
-                    individual_analyses[file_path] = file_analysis
-                except Exception as e:
-                    print(f"  ❌ Error analyzing {file_path}: {e}")
-                    individual_analyses[file_path] = {"error": str(e)}
+        # Phase 1: Individual file analysis, fanned out across worker processes
+        individual_analyses = await self._analyze_files_parallel(file_paths)
 
         # Phase 2: Cross-file relationship analysis
         print("  🔗 Analyzing cross-file relationships...")
@@ -139,10 +140,49 @@ class PremiumContentArchaeologyService:
             ]
         }
 
+    async def _analyze_files_parallel(self, file_paths: List[str]) -> Dict[str, Any]:
+        """
+        Analyze files independently in a process pool.
+
+        At most two files per worker are in flight at once, and workers are
+        recycled every MAX_FILES_PER_WORKER files, so memory stays bounded for
+        large uploads. Results keep the order of file_paths.
+        """
+        existing = [file_path for file_path in dict.fromkeys(file_paths) if os.path.exists(file_path)]
+        if not existing:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        workers = min(self.max_workers, len(existing))
+        in_flight = asyncio.Semaphore(workers * 2)
+        results: Dict[str, Any] = {}
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 max_tasks_per_child=self.MAX_FILES_PER_WORKER) as pool:
+
+            async def analyze(i: int, file_path: str):
+                async with in_flight:
+                    print(f"  📄 Analyzing file {i+1}/{len(existing)}: {Path(file_path).name}")
+                    try:
+                        results[file_path] = await loop.run_in_executor(pool, _analyze_file_in_worker, file_path)
+                    except Exception as e:
+                        print(f"  ❌ Error analyzing {file_path}: {e}")
+                        results[file_path] = {"error": str(e)}
+
+            await asyncio.gather(*(analyze(i, file_path) for i, file_path in enumerate(existing)))
+
+        return {file_path: results[file_path] for file_path in existing}
+
     async def _analyze_single_file_premium(self, file_path: str) -> Dict[str, Any]:
         """
         Enhanced single file analysis for multi-file context
         """
+        return self._analyze_single_file_sync(file_path)
+
+    def _analyze_single_file_sync(self, file_path: str) -> Dict[str, Any]:
+        """
+        Synchronous single file analysis, safe to run in a worker process
+        """
         analysis = {
             "filename": Path(file_path).name,
             "file_path": file_path,
@@ -394,28 +434,37 @@ class PremiumContentArchaeologyService:
             "evolutionary_threads": []
         }
 
-        # Build theme intersection matrix
+        # Build theme -> files inverted index
         file_themes = {}
         for file_path, analysis in individual_analyses.items():
             if "themes_identified" in analysis:
                 themes = [theme["theme"] for theme in analysis["themes_identified"]]
                 file_themes[file_path] = set(themes)
 
+        theme_files = defaultdict(list)
+        for i, file_path in enumerate(file_paths):
+            for theme in file_themes.get(file_path, ()):
+                theme_files[theme].append(i)
+
+        # Only file pairs that co-occur under some theme are visited
+        pair_themes = defaultdict(list)
+        for theme, indices in theme_files.items():
+            for a, i in enumerate(indices):
+                for j in indices[a + 1:]:
+                    pair_themes[(i, j)].append(theme)
+
         # Find shared themes between files
-        for i, file1 in enumerate(file_paths):
-            for j, file2 in enumerate(file_paths):
-                if i < j:  # Avoid duplicate comparisons
-                    themes1 = file_themes.get(file1, set())
-                    themes2 = file_themes.get(file2, set())
-
-                    shared = themes1.intersection(themes2)
-                    if shared:
-                        relationships["shared_themes"].append({
-                            "file1": Path(file1).name,
-                            "file2": Path(file2).name,
-                            "shared_themes": list(shared),
-                            "overlap_score": len(shared) / max(len(themes1), len(themes2), 1)
-                        })
+        for i, j in sorted(pair_themes):
+            file1, file2 = file_paths[i], file_paths[j]
+            themes1 = file_themes[file1]
+            themes2 = file_themes[file2]
+            shared = pair_themes[(i, j)]
+            relationships["shared_themes"].append({
+                "file1": Path(file1).name,
+                "file2": Path(file2).name,
+                "shared_themes": shared,
+                "overlap_score": len(shared) / max(len(themes1), len(themes2), 1)
+            })
 
         # Analyze temporal relationships
         temporal_data = {}
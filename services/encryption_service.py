@@ -7,16 +7,21 @@ Handles permanent storage preparation without exposing crypto complexity to user
 
 import os
 import json
+import time
 import base64
+import asyncio
 import hashlib
 import secrets
-from typing import Dict, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import argon2
+from argon2.low_level import Type, hash_secret_raw
 
 class GOATEncryptionService:
     """
@@ -24,35 +29,81 @@ class GOATEncryptionService:
     Handles encryption/decryption with key management for permanent storage.
     """
 
-    def __init__(self, master_key: Optional[bytes] = None):
+    # Argon2id parameters; each derivation holds KDF_MEMORY_COST KiB while it runs
+    KDF_TIME_COST = 2
+    KDF_MEMORY_COST = 102400
+    KDF_PARALLELISM = 8
+    KEY_DERIVATION_VERSION = 2
+
+    def __init__(self, master_key: Optional[bytes] = None, key_cache_size: int = 256,
+                 key_cache_ttl: int = 900, kdf_max_concurrent: int = 2):
         """
         Initialize encryption service
 
         Args:
             master_key: Optional master key for encryption operations
+            key_cache_size: Derived keys kept in memory, keyed by (user, salt)
+            key_cache_ttl: Seconds a derived key stays cached
+            kdf_max_concurrent: Argon2id derivations allowed to run at once
         """
         self.master_key = master_key or secrets.token_bytes(32)
         self.backend = default_backend()
 
-    def encrypt_for_storage(self, data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        self.key_cache_size = key_cache_size
+        self.key_cache_ttl = key_cache_ttl
+        self._key_cache: "OrderedDict[Tuple[str, bytes], Tuple[bytes, float]]" = OrderedDict()
+        self._pending_keys: Dict[Tuple[str, bytes], Future] = {}
+        self._cache_lock = threading.Lock()
+        self._kdf_executor = ThreadPoolExecutor(max_workers=kdf_max_concurrent, thread_name_prefix="goat-kdf")
+
+    # ------------------------------------------------------------------
+    # Encryption
+    # ------------------------------------------------------------------
+
+    def encrypt_for_storage(self, data: Dict[str, Any], user_id: str,
+                            salt: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Encrypt data for permanent storage (IPFS/Arweave ready)
 
         Args:
             data: Data to encrypt (dict that will be JSON serialized)
             user_id: User identifier for key derivation
+            salt: Optional key salt; a fresh one is generated by default
 
         Returns:
             Dict with encrypted data and metadata for TrueMark
         """
+        salt = salt or secrets.token_bytes(16)
+        return self._seal(data, user_id, self.get_key(user_id, salt), salt)
+
+    def encrypt_many_for_storage(self, items: Iterable[Dict[str, Any]], user_id: str) -> List[Dict[str, Any]]:
+        """
+        Encrypt several items for one user under a single derived key
+
+        Items share a salt (and therefore one Argon2id run) but each gets its own nonce.
+        """
+        salt = secrets.token_bytes(16)
+        encryption_key = self.get_key(user_id, salt)
+        return [self._seal(data, user_id, encryption_key, salt) for data in items]
+
+    async def encrypt_for_storage_async(self, data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        """encrypt_for_storage without blocking the event loop on key derivation"""
+        salt = secrets.token_bytes(16)
+        return self._seal(data, user_id, await self.get_key_async(user_id, salt), salt)
+
+    async def encrypt_many_for_storage_async(self, items: Iterable[Dict[str, Any]],
+                                             user_id: str) -> List[Dict[str, Any]]:
+        """encrypt_many_for_storage without blocking the event loop on key derivation"""
+        salt = secrets.token_bytes(16)
+        encryption_key = await self.get_key_async(user_id, salt)
+        return [self._seal(data, user_id, encryption_key, salt) for data in items]
+
+    def _seal(self, data: Dict[str, Any], user_id: str, encryption_key: bytes, salt: bytes) -> Dict[str, Any]:
+        """Encrypt one item with an already derived key"""
         # Serialize data
         json_data = json.dumps(data, default=str, separators=(',', ':'))
         data_bytes = json_data.encode('utf-8')
 
-        # Derive encryption key from master key and user ID
-        salt = secrets.token_bytes(16)
-        encryption_key = self._derive_key(self.master_key, user_id.encode(), salt)
-
         # Generate nonce for ChaCha20
         nonce = secrets.token_bytes(16)
 
@@ -66,6 +117,7 @@ class GOATEncryptionService:
             "encryption": {
                 "algorithm": "ChaCha20-256",
                 "key_derivation": "Argon2id",
+                "key_derivation_version": self.KEY_DERIVATION_VERSION,
                 "nonce": base64.b64encode(nonce).decode(),
                 "salt": base64.b64encode(salt).decode(),
                 "encrypted_size": len(encrypted_data),
@@ -99,6 +151,10 @@ class GOATEncryptionService:
             }
         }
 
+    # ------------------------------------------------------------------
+    # Decryption
+    # ------------------------------------------------------------------
+
     def decrypt_for_user(self, encrypted_package: Dict[str, Any], user_id: str) -> Optional[Dict[str, Any]]:
         """
         Decrypt data for user access
@@ -111,31 +167,124 @@ class GOATEncryptionService:
             Decrypted data dict, or None if decryption fails
         """
         try:
-            # Extract encryption parameters
             metadata = encrypted_package["metadata"]["encryption"]
-            salt = base64.b64decode(metadata["salt"])
-            nonce = base64.b64decode(metadata["nonce"])
-            encrypted_data = base64.b64decode(encrypted_package["encrypted_data"])
+            decryption_key = self._package_key(metadata, user_id)
+            return self._open(encrypted_package, decryption_key)
 
-            # Derive decryption key
-            decryption_key = self._derive_key(self.master_key, user_id.encode(), salt)
+        except Exception as e:
+            print(f"Decryption failed: {e}")
+            return None
 
-            # Decrypt with ChaCha20-256
-            cipher = Cipher(algorithms.ChaCha20(decryption_key, nonce), mode=None, backend=self.backend)
-            decryptor = cipher.decryptor()
-            decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+    def decrypt_many_for_user(self, encrypted_packages: Iterable[Dict[str, Any]],
+                              user_id: str) -> List[Optional[Dict[str, Any]]]:
+        """
+        Decrypt several packages for one user
 
-            # Verify integrity
-            if hashlib.sha256(decrypted_data).hexdigest() != metadata["original_hash"]:
-                return None  # Integrity check failed
+        Keys are cached per salt, so packages from encrypt_many_for_storage
+        cost a single Argon2id run.
+        """
+        return [self.decrypt_for_user(package, user_id) for package in encrypted_packages]
 
-            # Parse JSON
-            return json.loads(decrypted_data.decode('utf-8'))
+    async def decrypt_for_user_async(self, encrypted_package: Dict[str, Any],
+                                     user_id: str) -> Optional[Dict[str, Any]]:
+        """decrypt_for_user without blocking the event loop on key derivation"""
+        try:
+            metadata = encrypted_package["metadata"]["encryption"]
+            if metadata.get("key_derivation_version", 1) < self.KEY_DERIVATION_VERSION:
+                decryption_key = self._legacy_key()
+            else:
+                decryption_key = await self.get_key_async(user_id, base64.b64decode(metadata["salt"]))
+            return self._open(encrypted_package, decryption_key)
 
         except Exception as e:
             print(f"Decryption failed: {e}")
             return None
 
+    def _package_key(self, metadata: Dict[str, Any], user_id: str) -> bytes:
+        """Key for a package, honouring the derivation version it was written with"""
+        if metadata.get("key_derivation_version", 1) < self.KEY_DERIVATION_VERSION:
+            return self._legacy_key()
+        return self.get_key(user_id, base64.b64decode(metadata["salt"]))
+
+    def _open(self, encrypted_package: Dict[str, Any], decryption_key: bytes) -> Optional[Dict[str, Any]]:
+        """Decrypt one package with an already derived key"""
+        # Extract encryption parameters
+        metadata = encrypted_package["metadata"]["encryption"]
+        nonce = base64.b64decode(metadata["nonce"])
+        encrypted_data = base64.b64decode(encrypted_package["encrypted_data"])
+
+        # Decrypt with ChaCha20-256
+        cipher = Cipher(algorithms.ChaCha20(decryption_key, nonce), mode=None, backend=self.backend)
+        decryptor = cipher.decryptor()
+        decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+
+        # Verify integrity
+        if hashlib.sha256(decrypted_data).hexdigest() != metadata["original_hash"]:
+            return None  # Integrity check failed
+
+        # Parse JSON
+        return json.loads(decrypted_data.decode('utf-8'))
+
+    # ------------------------------------------------------------------
+    # Key derivation
+    # ------------------------------------------------------------------
+
+    def get_key(self, user_id: str, salt: bytes) -> bytes:
+        """Derived key for (user, salt), from cache or the KDF pool"""
+        return self._key_future(user_id, salt).result()
+
+    async def get_key_async(self, user_id: str, salt: bytes) -> bytes:
+        """Awaitable get_key; derivation runs on the KDF pool"""
+        return await asyncio.wrap_future(self._key_future(user_id, salt))
+
+    def _key_future(self, user_id: str, salt: bytes) -> Future:
+        """
+        Future for a derived key
+
+        Cached keys resolve immediately; concurrent requests for the same
+        (user, salt) share one in-flight derivation.
+        """
+        cache_key = (user_id, salt)
+        with self._cache_lock:
+            cached = self._key_cache.get(cache_key)
+            if cached is not None:
+                if cached[1] > time.monotonic():
+                    self._key_cache.move_to_end(cache_key)
+                    future = Future()
+                    future.set_result(cached[0])
+                    return future
+                del self._key_cache[cache_key]
+
+            future = self._pending_keys.get(cache_key)
+            if future is not None:
+                return future
+
+            future = self._kdf_executor.submit(self._derive_key, self.master_key, user_id.encode(), salt)
+            self._pending_keys[cache_key] = future
+
+        future.add_done_callback(lambda done: self._store_key(cache_key, done))
+        return future
+
+    def _store_key(self, cache_key: Tuple[str, bytes], future: Future):
+        """Move a finished derivation into the LRU cache"""
+        with self._cache_lock:
+            self._pending_keys.pop(cache_key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._key_cache[cache_key] = (future.result(), time.monotonic() + self.key_cache_ttl)
+            self._key_cache.move_to_end(cache_key)
+            while len(self._key_cache) > self.key_cache_size:
+                self._key_cache.popitem(last=False)
+
+    def clear_key_cache(self, user_id: Optional[str] = None):
+        """Drop cached keys, for one user or all users"""
+        with self._cache_lock:
+            if user_id is None:
+                self._key_cache.clear()
+            else:
+                for cache_key in [k for k in self._key_cache if k[0] == user_id]:
+                    del self._key_cache[cache_key]
+
     def _derive_key(self, master_key: bytes, user_salt: bytes, key_salt: bytes) -> bytes:
         """
         Derive encryption key using Argon2id
@@ -149,22 +298,28 @@ class GOATEncryptionService:
             Derived 32-byte key for ChaCha20-256
         """
         # Combine master key with user salt for personalization
-        combined_salt = hashlib.sha256(master_key + user_salt).digest()
-
-        # Use Argon2id for key derivation
-        kdf = argon2.PasswordHasher(
-            time_cost=2,  # Number of iterations
-            memory_cost=102400,  # Memory usage in KiB
-            parallelism=8,  # Number of parallel threads
-            hash_len=32,  # Output length
-            type=argon2.Type.ID  # Argon2id
+        combined_secret = hashlib.sha256(master_key + user_salt).digest()
+
+        # Raw Argon2id output keyed by the key salt (deterministic, unlike PasswordHasher)
+        return hash_secret_raw(
+            secret=combined_secret,
+            salt=key_salt,
+            time_cost=self.KDF_TIME_COST,
+            memory_cost=self.KDF_MEMORY_COST,
+            parallelism=self.KDF_PARALLELISM,
+            hash_len=32,
+            type=Type.ID
         )
 
-        # Derive key from combined salt + key salt
-        derived_key = kdf.hash(combined_salt + key_salt)
+    def _legacy_key(self) -> bytes:
+        """
+        Key used by packages written before key_derivation_version 2
 
-        # Extract raw key bytes (remove Argon2 prefix)
-        return derived_key.encode()[:32] if isinstance(derived_key, str) else derived_key.raw[:32]
+        Those took the first 32 bytes of PasswordHasher's encoded hash, which
+        is the fixed parameter prefix regardless of user or salt.
+        """
+        return (f"$argon2id$v=19$m={self.KDF_MEMORY_COST},"
+                f"t={self.KDF_TIME_COST},p={self.KDF_PARALLELISM}$").encode()[:32]
 
     def prepare_for_permanent_storage(self, encrypted_package: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -81,7 +81,7 @@ class GOATPermanentStorageService:
         try:
             # Step 1: Encrypt content (if encryption service available)
             if self.encryption_service:
-                encrypted_package = self.encryption_service.encrypt_for_storage(content, user_id)
+                encrypted_package = await self.encryption_service.encrypt_for_storage_async(content, user_id)
                 storage_package = self.encryption_service.prepare_for_permanent_storage(encrypted_package)
             else:
                 # Fallback: store unencrypted (not recommended for production)
@@ -253,13 +253,13 @@ class GOATPermanentStorageService:
             if upload_record["ipfs"]["success"]:
                 content = await self._retrieve_from_ipfs(upload_record["ipfs"]["hash"])
                 if content:
-                    return self._process_retrieved_content(content, upload_record)
+                    return await self._process_retrieved_content(content, upload_record)
 
             # Fallback to Arweave
             if upload_record["arweave"]["success"]:
                 content = await self._retrieve_from_arweave(upload_record["arweave"]["transaction_id"])
                 if content:
-                    return self._process_retrieved_content(content, upload_record)
+                    return await self._process_retrieved_content(content, upload_record)
 
         except Exception as e:
             print(f"Retrieval error: {e}")
@@ -292,13 +292,15 @@ class GOATPermanentStorageService:
             pass
         return None
 
-    def _process_retrieved_content(self, content: Dict[str, Any], upload_record: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_retrieved_content(
+        self, content: Dict[str, Any], upload_record: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         Process retrieved content (decrypt if needed)
         """
         if upload_record.get("encryption_used") and self.encryption_service:
             # Decrypt content
-            decrypted = self.encryption_service.decrypt_for_user(
+            decrypted = await self.encryption_service.decrypt_for_user_async(
                 content,
                 upload_record["user_id"]
             )
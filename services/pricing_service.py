@@ -4,12 +4,200 @@ GOAT Premium Pricing Service
 Pro-Sumer Content Foundry pricing: $299-$1,499 tiers with APEX DOC certification
 """
 
-import os
+import sqlite3
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 
+class PricingLedger:
+    """
+    SQLite-backed store for users, subscriptions and transactions.
+
+    Runs in WAL mode on a single long-lived connection so the statement
+    cache keeps the parameterized queries below prepared. Legacy JSON
+    databases found at the same path are migrated on first open.
+    """
+
+    SQLITE_HEADER = b"SQLite format 3\x00"
+
+    INSERT_USER = "INSERT OR IGNORE INTO users (user_id, created_at) VALUES (?, ?)"
+    INSERT_SUBSCRIPTION = """
+        INSERT OR REPLACE INTO subscriptions
+        (subscription_id, user_id, tier, transaction_id, started_at, status, data_used_gb, data_limit_gb)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    INSERT_TRANSACTION = """
+        INSERT INTO transactions
+        (transaction_id, user_id, type, cost_details, total_cost, timestamp, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    SELECT_ACTIVE_SUBSCRIPTION = """
+        SELECT subscription_id, user_id, tier, transaction_id, started_at, status, data_used_gb, data_limit_gb
+        FROM subscriptions WHERE user_id = ? AND status = 'active'
+        ORDER BY rowid DESC LIMIT 1
+    """
+    SUMMARIZE_TRANSACTIONS = """
+        SELECT COUNT(*), COALESCE(SUM(total_cost), 0)
+        FROM transactions WHERE user_id = ? AND timestamp >= ?
+    """
+    SELECT_RECENT_TRANSACTIONS = """
+        SELECT transaction_id, user_id, type, cost_details, timestamp, status
+        FROM transactions WHERE user_id = ? AND timestamp >= ?
+        ORDER BY timestamp DESC, id DESC LIMIT ?
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        legacy_db = self._detach_legacy_json()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+        if legacy_db is not None:
+            self._migrate_legacy_json(legacy_db)
+
+    def _detach_legacy_json(self) -> Optional[Dict[str, Any]]:
+        """Move a pre-SQLite JSON database aside and return its contents"""
+        if not self.db_path.exists() or self.db_path.stat().st_size == 0:
+            return None
+
+        with open(self.db_path, 'rb') as f:
+            if f.read(len(self.SQLITE_HEADER)) == self.SQLITE_HEADER:
+                return None
+
+        with open(self.db_path, 'r') as f:
+            legacy_db = json.load(f)
+
+        self.db_path.replace(self.db_path.with_suffix(".json.bak"))
+        return legacy_db
+
+    def _init_db(self):
+        """Initialize pricing schema"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    user_id TEXT PRIMARY KEY,
+                    created_at TEXT NOT NULL
+                )
+            """)
+
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    subscription_id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    tier TEXT NOT NULL,
+                    transaction_id TEXT,
+                    started_at TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    data_used_gb REAL DEFAULT 0,
+                    data_limit_gb REAL
+                )
+            """)
+
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    transaction_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    type TEXT,
+                    cost_details TEXT,
+                    total_cost REAL DEFAULT 0,
+                    timestamp TEXT NOT NULL,
+                    status TEXT
+                )
+            """)
+
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_subscriptions_user
+                ON subscriptions(user_id, status)
+            """)
+
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_user_timestamp
+                ON transactions(user_id, timestamp)
+            """)
+
+    def _migrate_legacy_json(self, legacy_db: Dict[str, Any]):
+        """Import users, subscriptions and transactions from a JSON database"""
+        migrated_at = legacy_db.get("last_updated") or datetime.utcnow().isoformat()
+
+        with self._lock, self.conn:
+            self.conn.executemany(self.INSERT_USER, [
+                (user_id, migrated_at) for user_id in legacy_db.get("users", {})
+            ])
+            self.conn.executemany(self.INSERT_SUBSCRIPTION, [
+                self._subscription_row(sub)
+                for sub in legacy_db.get("tier_subscriptions", {}).values()
+            ])
+            self.conn.executemany(self.INSERT_TRANSACTION, [
+                self._transaction_row(txn) for txn in legacy_db.get("transactions", [])
+            ])
+
+    @staticmethod
+    def _subscription_row(sub: Dict[str, Any]) -> tuple:
+        return (sub["subscription_id"], sub["user_id"], sub["tier"], sub.get("transaction_id"),
+                sub["started_at"], sub.get("status", "active"), sub.get("data_used_gb", 0),
+                sub.get("data_limit_gb"))
+
+    @staticmethod
+    def _transaction_row(txn: Dict[str, Any]) -> tuple:
+        cost_details = txn.get("cost_details", {})
+        return (txn["transaction_id"], txn["user_id"], txn.get("type"),
+                json.dumps(cost_details, default=str), cost_details.get("total_cost", 0),
+                txn["timestamp"], txn.get("status"))
+
+    def record_subscription(self, subscription: Dict[str, Any]):
+        """Insert a subscription and register its user"""
+        with self._lock, self.conn:
+            self.conn.execute(self.INSERT_USER, (subscription["user_id"], subscription["started_at"]))
+            self.conn.execute(self.INSERT_SUBSCRIPTION, self._subscription_row(subscription))
+
+    def record_transaction(self, transaction: Dict[str, Any]):
+        """Insert a transaction and register its user"""
+        with self._lock, self.conn:
+            self.conn.execute(self.INSERT_USER, (transaction["user_id"], transaction["timestamp"]))
+            self.conn.execute(self.INSERT_TRANSACTION, self._transaction_row(transaction))
+
+    def get_active_subscription(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Most recently recorded active subscription for a user"""
+        with self._lock:
+            row = self.conn.execute(self.SELECT_ACTIVE_SUBSCRIPTION, (user_id,)).fetchone()
+
+        if not row:
+            return None
+
+        keys = ("subscription_id", "user_id", "tier", "transaction_id",
+                "started_at", "status", "data_used_gb", "data_limit_gb")
+        return dict(zip(keys, row))
+
+    def get_transaction_summary(self, user_id: str, since: datetime, limit: int = 10) -> Dict[str, Any]:
+        """Count, total and most recent transactions for a user since a cutoff"""
+        since_iso = since.isoformat()
+        with self._lock:
+            count, total = self.conn.execute(self.SUMMARIZE_TRANSACTIONS, (user_id, since_iso)).fetchone()
+            rows = self.conn.execute(self.SELECT_RECENT_TRANSACTIONS, (user_id, since_iso, limit)).fetchall()
+
+        recent = [
+            {
+                "transaction_id": row[0],
+                "user_id": row[1],
+                "type": row[2],
+                "cost_details": json.loads(row[3]) if row[3] else {},
+                "timestamp": row[4],
+                "status": row[5]
+            }
+            for row in reversed(rows)
+        ]
+
+        return {"count": count, "total": total, "recent": recent}
+
 class GOATPremiumPricingService:
     """
     Premium pricing calculator for GOAT's Pro-Sumer Content Foundry.
@@ -111,27 +299,8 @@ class GOATPremiumPricingService:
         self.pricing_db_path = Path(pricing_db_path)
         self.pricing_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load or create pricing database
-        self._load_pricing_db()
-
-    def _load_pricing_db(self):
-        """Load pricing database"""
-        if self.pricing_db_path.exists():
-            with open(self.pricing_db_path, 'r') as f:
-                self.pricing_db = json.load(f)
-        else:
-            self.pricing_db = {
-                "users": {},
-                "transactions": [],
-                "tier_subscriptions": {},
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            self._save_pricing_db()
-
-    def _save_pricing_db(self):
-        """Save pricing database"""
-        with open(self.pricing_db_path, 'w') as f:
-            json.dump(self.pricing_db, f, indent=2, default=str)
+        # Open (and migrate, if needed) pricing database
+        self.pricing_db = PricingLedger(self.pricing_db_path)
 
     def calculate_premium_cost(self,
                               tier: str,
@@ -379,14 +548,7 @@ class GOATPremiumPricingService:
             "data_limit_gb": self.TIERS[tier]["data_limit_gb"]
         }
 
-        self.pricing_db["tier_subscriptions"][subscription_id] = subscription
-
-        # Update user subscriptions
-        if user_id not in self.pricing_db["users"]:
-            self.pricing_db["users"][user_id] = {"subscriptions": []}
-
-        self.pricing_db["users"][user_id]["subscriptions"].append(subscription_id)
-        self._save_pricing_db()
+        self.pricing_db.record_subscription(subscription)
 
         return subscription_id
 
@@ -401,23 +563,8 @@ class GOATPremiumPricingService:
         Returns:
             Limit check results
         """
-        user_subs = self.pricing_db["users"].get(user_id, {}).get("subscriptions", [])
-
-        if not user_subs:
-            return {
-                "has_subscription": False,
-                "can_process": False,
-                "message": "No active subscription found",
-                "upgrade_required": True
-            }
-
         # Get active subscription (most recent)
-        active_sub = None
-        for sub_id in reversed(user_subs):
-            sub = self.pricing_db["tier_subscriptions"].get(sub_id)
-            if sub and sub["status"] == "active":
-                active_sub = sub
-                break
+        active_sub = self.pricing_db.get_active_subscription(user_id)
 
         if not active_sub:
             return {
@@ -444,6 +591,8 @@ class GOATPremiumPricingService:
 
 # Global instance
 premium_pricing_service = GOATPremiumPricingService()
+
+class GOATPricingService:
     """
     GOAT pricing calculator and billing service.
     Handles all pricing logic for the pay-per-GB model.
@@ -460,31 +609,13 @@ premium_pricing_service = GOATPremiumPricingService()
         Initialize pricing service
 
         Args:
-            pricing_db_path: Path to pricing database (JSON for simplicity)
+            pricing_db_path: Path to pricing database (SQLite)
         """
         self.pricing_db_path = Path(pricing_db_path)
         self.pricing_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load or create pricing database
-        self._load_pricing_db()
-
-    def _load_pricing_db(self):
-        """Load pricing database or create if doesn't exist"""
-        if self.pricing_db_path.exists():
-            with open(self.pricing_db_path, 'r') as f:
-                self.pricing_db = json.load(f)
-        else:
-            self.pricing_db = {
-                "users": {},
-                "transactions": [],
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            self._save_pricing_db()
-
-    def _save_pricing_db(self):
-        """Save pricing database"""
-        with open(self.pricing_db_path, 'w') as f:
-            json.dump(self.pricing_db, f, indent=2, default=str)
+        # Open (and migrate, if needed) pricing database
+        self.pricing_db = PricingLedger(self.pricing_db_path)
 
     def calculate_processing_cost(self, data_size_gb: float, output_formats: int = 1) -> Dict[str, Any]:
         """
@@ -631,14 +762,7 @@ premium_pricing_service = GOATPremiumPricingService()
             "status": "pending"  # Could be 'completed', 'failed', etc.
         }
 
-        self.pricing_db["transactions"].append(transaction)
-
-        # Update user transaction history
-        if user_id not in self.pricing_db["users"]:
-            self.pricing_db["users"][user_id] = {"transactions": []}
-
-        self.pricing_db["users"][user_id]["transactions"].append(transaction_id)
-        self._save_pricing_db()
+        self.pricing_db.record_transaction(transaction)
 
         return transaction_id
 
@@ -655,23 +779,17 @@ premium_pricing_service = GOATPremiumPricingService()
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        user_transactions = []
-        total_spent = 0
-
-        for txn in self.pricing_db["transactions"]:
-            if txn["user_id"] == user_id:
-                txn_date = datetime.fromisoformat(txn["timestamp"])
-                if txn_date >= cutoff_date:
-                    user_transactions.append(txn)
-                    total_spent += txn["cost_details"]["total_cost"]
+        summary = self.pricing_db.get_transaction_summary(user_id, cutoff_date, limit=10)
+        total_spent = summary["total"]
+        transaction_count = summary["count"]
 
         return {
             "user_id": user_id,
             "period_days": days,
             "total_spent": total_spent,
-            "transaction_count": len(user_transactions),
-            "transactions": user_transactions[-10:],  # Last 10 transactions
-            "average_cost": total_spent / len(user_transactions) if user_transactions else 0
+            "transaction_count": transaction_count,
+            "transactions": summary["recent"],  # Last 10 transactions
+            "average_cost": total_spent / transaction_count if transaction_count else 0
         }
 
     def estimate_cost_realtime(self, current_bytes: int, estimated_total_bytes: int) -> Dict[str, Any]:
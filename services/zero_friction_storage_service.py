@@ -26,6 +26,73 @@ except ImportError:
     IPFS_AVAILABLE = False
 import requests
 
+class _AppendLogStore:
+    """
+    Dict persisted as a JSON snapshot plus an append-only JSONL log of changes.
+    Each change costs one appended line; the log is folded back into the
+    snapshot every `compact_every` entries.
+    """
+
+    def __init__(self, snapshot_file: Path, compact_every: int = 200):
+        self.snapshot_file = snapshot_file
+        self.log_file = snapshot_file.with_suffix(".log.jsonl")
+        self.compact_every = compact_every
+        self._log_entries = 0
+        self.data: Dict[str, Any] = {}
+        self._load()
+
+    def _load(self):
+        if self.snapshot_file.exists():
+            try:
+                with open(self.snapshot_file, 'r') as f:
+                    self.data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.data = {}
+
+        if self.log_file.exists():
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip a torn write
+                    if entry.get("deleted"):
+                        self.data.pop(entry["key"], None)
+                    else:
+                        self.data[entry["key"]] = entry["value"]
+                    self._log_entries += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def set(self, key: str, value: Any):
+        self.data[key] = value
+        self._append({"key": key, "value": value})
+
+    def delete(self, key: str):
+        if self.data.pop(key, None) is not None:
+            self._append({"key": key, "deleted": True})
+
+    def _append(self, entry: Dict[str, Any]):
+        with open(self.log_file, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+        self._log_entries += 1
+        if self._log_entries >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the snapshot and drop the log"""
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self.data, f, indent=2)
+        tmp_file.replace(self.snapshot_file)
+        if self.log_file.exists():
+            self.log_file.unlink()
+        self._log_entries = 0
+
 class PremiumZeroFrictionStorageService:
     """
     PREMIUM Zero-Friction Storage - Automatic encrypted storage and retrieval.
@@ -78,21 +145,17 @@ class PremiumZeroFrictionStorageService:
         self.usage_file = self.base_storage_dir / "usage_tracking.json"
         self._load_usage_data()
 
+        # (user, content_hash) -> storage handle, with reference counts
+        self.dedup_index = _AppendLogStore(self.base_storage_dir / "dedup_index.json")
+
     def _load_usage_data(self):
         """Load usage tracking data"""
-        if self.usage_file.exists():
-            try:
-                with open(self.usage_file, 'r') as f:
-                    self.usage_data = json.load(f)
-            except:
-                self.usage_data = {}
-        else:
-            self.usage_data = {}
+        self.usage_store = _AppendLogStore(self.usage_file)
+        self.usage_data = self.usage_store.data
 
     def _save_usage_data(self):
         """Save usage tracking data"""
-        with open(self.usage_file, 'w') as f:
-            json.dump(self.usage_data, f, indent=2)
+        self.usage_store.compact()
 
     async def store_content_zero_friction(self,
                                         content: str,
@@ -117,28 +180,30 @@ class PremiumZeroFrictionStorageService:
 
         storage_start = datetime.utcnow()
 
-        # Check tier limits
-        limit_check = self._check_tier_limits(user_id, tier, len(content))
-        if not limit_check["allowed"]:
-            return {
-                "success": False,
-                "error": limit_check["reason"],
-                "upgrade_required": True
-            }
-
         # Generate content hash for deduplication
         content_hash = self._generate_content_hash(content)
 
-        # Check if content already exists
+        # Check if content already exists; repeat uploads skip encryption and storage
         existing_handle = self._find_existing_content(content_hash, user_id)
         if existing_handle:
+            self._add_content_reference(content_hash, user_id)
             return {
                 "success": True,
                 "operation": "deduplicated",
                 "retrieval_handle": existing_handle,
+                "content_hash": content_hash,
                 "message": "Content already stored, returning existing handle"
             }
 
+        # Check tier limits
+        limit_check = self._check_tier_limits(user_id, tier, len(content))
+        if not limit_check["allowed"]:
+            return {
+                "success": False,
+                "error": limit_check["reason"],
+                "upgrade_required": True
+            }
+
         # Prepare content for storage
         prepared_content = self._prepare_content_for_storage(content, content_type)
 
@@ -160,6 +225,7 @@ class PremiumZeroFrictionStorageService:
         )
 
         await self._store_metadata(metadata_record)
+        self._register_content(content_hash, user_id, storage_handle)
 
         # Update usage tracking
         self._update_usage_tracking(user_id, tier, len(content))
@@ -249,6 +315,66 @@ class PremiumZeroFrictionStorageService:
             "tier": metadata["tier"]
         }
 
+    async def delete_content_zero_friction(self,
+                                         retrieval_handle: str,
+                                         user_id: str) -> Dict[str, Any]:
+        """
+        Release one reference to stored content.
+
+        Deduplicated uploads share a storage handle, so the stored copies are
+        only removed once the last reference is released.
+
+        Args:
+            retrieval_handle: Storage handle from storage operation
+            user_id: User identifier for access control
+
+        Returns:
+            Deletion result with remaining reference count
+        """
+        metadata = await self._load_metadata(retrieval_handle)
+        if not metadata:
+            return {
+                "success": False,
+                "error": "Content not found"
+            }
+
+        if metadata["user_id"] != user_id:
+            return {
+                "success": False,
+                "error": "Access denied"
+            }
+
+        index_key = self._dedup_key(metadata["content_hash"], user_id)
+        entry = self.dedup_index.get(index_key)
+        ref_count = entry["ref_count"] - 1 if entry else 0
+
+        if ref_count > 0:
+            self.dedup_index.set(index_key, {**entry, "ref_count": ref_count})
+            return {
+                "success": True,
+                "operation": "dereferenced",
+                "remaining_references": ref_count
+            }
+
+        # Last reference: remove stored copies, metadata and the index entry
+        for location in metadata.get("storage_locations", {}).values():
+            path = location.get("path") if isinstance(location, dict) else None
+            if path and Path(path).exists():
+                Path(path).unlink()
+
+        metadata_file = self.base_storage_dir / "metadata" / f"{retrieval_handle}.json"
+        if metadata_file.exists():
+            metadata_file.unlink()
+
+        self.dedup_index.delete(index_key)
+        self._release_usage(user_id, metadata.get("original_size", 0))
+
+        return {
+            "success": True,
+            "operation": "deleted",
+            "remaining_references": 0
+        }
+
     def _check_tier_limits(self, user_id: str, tier: str, content_size: int) -> Dict[str, Any]:
         """Check if storage operation is within tier limits"""
         if tier not in self.tier_limits:
@@ -283,11 +409,27 @@ class PremiumZeroFrictionStorageService:
         """Generate SHA-256 hash of content for deduplication"""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    def _dedup_key(self, content_hash: str, user_id: str) -> str:
+        """Deduplication index key for a user's content"""
+        return f"{user_id}:{content_hash}"
+
     def _find_existing_content(self, content_hash: str, user_id: str) -> Optional[str]:
         """Check if content already exists for this user"""
-        # This would query the metadata store
-        # For now, return None (no deduplication)
-        return None
+        entry = self.dedup_index.get(self._dedup_key(content_hash, user_id))
+        return entry["storage_handle"] if entry else None
+
+    def _register_content(self, content_hash: str, user_id: str, storage_handle: str):
+        """Record newly stored content in the deduplication index"""
+        self.dedup_index.set(self._dedup_key(content_hash, user_id), {
+            "storage_handle": storage_handle,
+            "ref_count": 1
+        })
+
+    def _add_content_reference(self, content_hash: str, user_id: str):
+        """Count another upload of already stored content"""
+        index_key = self._dedup_key(content_hash, user_id)
+        entry = self.dedup_index.get(index_key)
+        self.dedup_index.set(index_key, {**entry, "ref_count": entry["ref_count"] + 1})
 
     def _prepare_content_for_storage(self, content: str, content_type: str) -> bytes:
         """Prepare content for storage based on type"""
@@ -564,14 +706,11 @@ class PremiumZeroFrictionStorageService:
         current_month = datetime.utcnow().month
         content_size_gb = content_size / (1024 ** 3)
 
-        if user_id not in self.usage_data:
-            self.usage_data[user_id] = {
-                "storage_used_gb": 0,
-                "files_this_month": 0,
-                "month": current_month
-            }
-
-        user_usage = self.usage_data[user_id]
+        user_usage = dict(self.usage_data.get(user_id, {
+            "storage_used_gb": 0,
+            "files_this_month": 0,
+            "month": current_month
+        }))
 
         # Reset monthly counter if new month
         if user_usage.get("month", 0) != current_month:
@@ -581,7 +720,18 @@ class PremiumZeroFrictionStorageService:
         user_usage["storage_used_gb"] += content_size_gb
         user_usage["files_this_month"] += 1
 
-        self._save_usage_data()
+        self.usage_store.set(user_id, user_usage)
+
+    def _release_usage(self, user_id: str, content_size: int):
+        """Return storage of deleted content to the user's quota"""
+        if user_id not in self.usage_data:
+            return
+
+        user_usage = dict(self.usage_data[user_id])
+        content_size_gb = content_size / (1024 ** 3)
+        user_usage["storage_used_gb"] = max(0, user_usage["storage_used_gb"] - content_size_gb)
+
+        self.usage_store.set(user_id, user_usage)
 
     async def get_storage_usage(self, user_id: str) -> Dict[str, Any]:
         """Get storage usage statistics for user"""
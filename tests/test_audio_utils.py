@@ -0,0 +1,67 @@
+# test_audio_utils.py
+"""
+Test the audiobook engine audio utilities
+Validates streamed WAV concatenation against an in-memory reference
+"""
+
+import hashlib
+import io
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from audiobook_engine.utils.audio_utils import concat_wav_files
+
+SAMPLE_RATE = 8000
+
+
+def wav_bytes(frames: bytes, channels: int = 1, sample_rate: int = SAMPLE_RATE) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(frames)
+    return buffer.getvalue()
+
+
+def write_inputs(tmp_path, clips):
+    paths = []
+    for i, clip in enumerate(clips):
+        path = tmp_path / f"clip_{i}.wav"
+        path.write_bytes(wav_bytes(clip))
+        paths.append(path)
+    return paths
+
+
+def test_concat_matches_reference(tmp_path):
+    clips = [bytes(range(200)), bytes(range(100, 0, -1)) * 3, b"\x01\x02" * 50]
+    output_path = tmp_path / "joined.wav"
+
+    duration, checksum = concat_wav_files(write_inputs(tmp_path, clips), output_path,
+                                          silence_sec=0.01, block_frames=16)
+
+    silence = bytes(2 * 80)
+    reference = wav_bytes(silence.join(clips))
+    written = output_path.read_bytes()
+    assert written == reference
+    assert int.from_bytes(written[4:8], "little") == len(reference) - 8
+    assert int.from_bytes(written[40:44], "little") == len(silence.join(clips))
+    assert checksum == hashlib.sha256(reference).hexdigest()
+    assert duration == len(silence.join(clips)) / 2 / SAMPLE_RATE
+
+
+def test_concat_rejects_mismatched_formats(tmp_path):
+    paths = write_inputs(tmp_path, [bytes(20)])
+    stereo = tmp_path / "stereo.wav"
+    stereo.write_bytes(wav_bytes(bytes(40), channels=2))
+
+    with pytest.raises(ValueError):
+        concat_wav_files(paths + [stereo], tmp_path / "joined.wav")
+    with pytest.raises(ValueError):
+        concat_wav_files([], tmp_path / "joined.wav")
@@ -0,0 +1,161 @@
+# test_audiobook_renderer.py
+"""
+Test the audiobook renderer
+Validates chapter retries, resuming chapters rendered by an earlier run and streamed export
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add repository root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from engines.audiobook_renderer import AudiobookRenderer
+
+
+@dataclass
+class StubNarratorProfile:
+    name: str = "stub"
+    content_type: str = "nonfiction"
+
+
+class StubNarrator:
+    """Stands in for the narrator optimizer and voice engine: 16-bit PCM with one sample per character"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    async def generate_narrator_audio(self, text, narrator_profile, segment_type, **kwargs):
+        self.calls.append(text)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("synthesis failed")
+        return bytes(i % 251 for i in range(2 * len(text)))
+
+
+def make_renderer(narrator):
+    renderer = AudiobookRenderer(
+        voice_engine=SimpleNamespace(tts_pool=None),
+        character_mapper=None,
+        narrator_optimizer=narrator
+    )
+    renderer.REST_INTERVAL = 0
+    return renderer
+
+
+def render(renderer, chapter_data, chapter_dir, chapter_num=1):
+    progress = {}
+    chapter = asyncio.run(renderer._render_chapter_resumable(
+        chapter_data, StubNarratorProfile(), chapter_num, chapter_dir, asyncio.Semaphore(1), progress
+    ))
+    return chapter, progress
+
+
+@pytest.fixture
+def chapter_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "book_chapters"
+    path.mkdir()
+    return path
+
+
+CHAPTER = {"title": "Beginnings", "content": "The first chapter. It is short.", "content_type": "nonfiction"}
+
+
+def test_failed_chapter_is_retried(chapter_dir):
+    narrator = StubNarrator(failures=1)
+    chapter, progress = render(make_renderer(narrator), CHAPTER, chapter_dir)
+
+    assert progress["attempts"] == 2
+    assert progress["status"] == "done"
+    assert progress["error"] is None
+    assert [segment.text for segment in chapter.segments] == ["Chapter 1: Beginnings", CHAPTER["content"]]
+    # the audio stays on disk, only the timing is kept in memory
+    assert all(segment.audio_data == b"" for segment in chapter.segments)
+    assert (chapter_dir / "chapter_001.wav").exists()
+    assert (chapter_dir / "chapter_001.json").exists()
+
+
+def test_chapter_fails_after_retries(chapter_dir):
+    renderer = make_renderer(StubNarrator(failures=10))
+    with pytest.raises(RuntimeError):
+        render(renderer, CHAPTER, chapter_dir)
+    assert not (chapter_dir / "chapter_001.json").exists()
+
+
+def test_rendered_chapter_is_reused(chapter_dir):
+    first, _ = render(make_renderer(StubNarrator()), CHAPTER, chapter_dir)
+
+    narrator = StubNarrator()
+    second, progress = render(make_renderer(narrator), CHAPTER, chapter_dir)
+
+    assert narrator.calls == []
+    assert progress["status"] == "resumed"
+    assert second == first
+
+
+def test_stale_fingerprint_forces_rerender(chapter_dir):
+    render(make_renderer(StubNarrator()), CHAPTER, chapter_dir)
+
+    edited = dict(CHAPTER, content="The first chapter, now rewritten.")
+    narrator = StubNarrator()
+    renderer = make_renderer(narrator)
+    assert renderer._load_rendered_chapter(
+        chapter_dir, 1, renderer._chapter_fingerprint(edited, StubNarratorProfile())
+    ) is None
+
+    chapter, progress = render(renderer, edited, chapter_dir)
+    assert narrator.calls == ["Chapter 1: Beginnings", edited["content"]]
+    assert progress["status"] == "done"
+    assert chapter.segments[1].text == edited["content"]
+
+    # the re-rendered chapter replaced the stale one on disk
+    assert renderer._load_rendered_chapter(
+        chapter_dir, 1, renderer._chapter_fingerprint(edited, StubNarratorProfile())
+    ) == chapter
+
+
+def test_export_streams_chapters_from_disk(chapter_dir, tmp_path):
+    renderer = make_renderer(StubNarrator())
+    chapters_data = [CHAPTER, {"title": "Middles", "content": "A second chapter follows.", "content_type": "nonfiction"}]
+    chapters = [render(renderer, data, chapter_dir, num)[0] for num, data in enumerate(chapters_data, 1)]
+
+    output_path = tmp_path / "out" / "book.wav"
+    export = asyncio.run(renderer._export_audiobook(chapters, chapter_dir, str(output_path), {"title": "Book"}, 0.0))
+
+    # reference built in memory: each chapter opens with a 2 s pause, each segment is followed by 0.5 s
+    chapter_pause = bytes(2 * 22050 * 2)
+    segment_pause = bytes(2 * 11025)
+    audio = b""
+    markers = []
+    for num, data in enumerate(chapters_data, 1):
+        start = len(audio)
+        audio += chapter_pause
+        for text in (f"Chapter {num}: {data['title']}", data["content"]):
+            audio += bytes(i % 251 for i in range(2 * len(text))) + segment_pause
+        markers.append({
+            "chapter": num,
+            "title": data["title"],
+            "start_sec": start / 2 / 22050,
+            "duration_sec": (len(audio) - start) / 2 / 22050
+        })
+    reference = renderer._wav_header(len(audio)) + audio
+
+    written = output_path.read_bytes()
+    assert written == reference
+    assert int.from_bytes(written[4:8], "little") == len(reference) - 8
+    assert int.from_bytes(written[40:44], "little") == len(audio)
+    assert export["checksum_sha256"] == hashlib.sha256(reference).hexdigest()
+    assert export["chapter_markers"] == markers
+
+    metadata = json.loads(output_path.with_suffix(".json").read_text())
+    assert metadata["checksum_sha256"] == export["checksum_sha256"]
+    assert metadata["chapters"] == markers
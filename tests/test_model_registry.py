@@ -0,0 +1,167 @@
+# test_model_registry.py
+"""
+Test the TTS model registry
+Validates LRU eviction, memory limits, required models and worker status merging
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from engines.model_registry import ModelRegistry, merge_statuses
+
+GB = 1024**3
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+
+    def tts(self, text):
+        return f"{self.name}:{text}"
+
+
+def make_registry(budget_gb=3, available_gb=None, required=None):
+    """Registry of 1 GB fake models; available_gb fakes the free system memory"""
+    loads = []
+
+    def loader(name):
+        loads.append(name)
+        return FakeModel(name)
+
+    registry = ModelRegistry(
+        loader=loader,
+        memory_budget_bytes=budget_gb * GB,
+        reserve_bytes=GB,
+        estimate_size=lambda name: GB,
+        required=required
+    )
+    registry._available_bytes = lambda: None if available_gb is None else available_gb * GB
+    return registry, loads
+
+
+def test_models_are_loaded_once():
+    registry, loads = make_registry()
+    assert registry.synthesize("a", text="hi") == "a:hi"
+    assert registry.synthesize("a", text="again") == "a:again"
+    assert loads == ["a"]
+    assert registry.status()["models"]["a"]["hits"] == 1
+
+
+def test_least_recently_used_is_evicted():
+    registry, loads = make_registry(budget_gb=2)
+    registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+    assert registry.loaded_models() == ["a", "c"]
+    assert registry.status()["models"]["b"]["state"] == "cold"
+
+    # peek neither loads nor refreshes the LRU position
+    assert registry.peek("b") is None
+    registry.peek("a")
+    registry.get("b")
+    assert registry.loaded_models() == ["c", "b"]
+    assert loads == ["a", "b", "c", "b"]
+
+
+def test_ensure_reports_whether_the_model_was_loaded():
+    registry, _ = make_registry()
+    assert registry.ensure("a") is False
+    assert registry.ensure("a") is True
+
+
+def test_share_budget():
+    registry, _ = make_registry(budget_gb=4)
+    assert registry.share_budget(2) is registry
+    assert registry.memory_budget_bytes == 2 * GB
+    assert registry.share_budget(0).memory_budget_bytes == 2 * GB
+
+    registry.get("a")
+    registry.get("b")
+    registry.get("c")
+    assert registry.loaded_models() == ["b", "c"]
+
+
+def test_required_models_are_never_evicted():
+    registry, _ = make_registry(budget_gb=2, required=["default"])
+    registry.get("default")
+    registry.get("a")
+    registry.get("b")
+    assert registry.loaded_models() == ["default", "b"]
+
+
+def test_low_memory_refuses_other_models_without_evicting_required():
+    registry, loads = make_registry(budget_gb=8, available_gb=1, required=["default"])
+    registry.get("default")
+    with pytest.raises(MemoryError):
+        registry.get("a")
+    assert registry.loaded_models() == ["default"]
+    assert loads == ["default"]
+
+
+def test_low_memory_evicts_other_models_before_refusing():
+    registry, _ = make_registry(budget_gb=8, available_gb=1, required=["default"])
+    registry._available_bytes = lambda: 3 * GB
+    registry.get("default")
+    registry.get("a")
+    registry._available_bytes = lambda: GB
+    with pytest.raises(MemoryError):
+        registry.get("b")
+    assert registry.loaded_models() == ["default"]
+
+
+def test_required_model_loads_when_memory_is_short():
+    registry, loads = make_registry(budget_gb=0, available_gb=0, required=["default"])
+    registry.get("default")
+    assert loads == ["default"]
+    assert registry.status()["models"]["default"]["state"] == "warm"
+
+
+def test_failed_load_is_reported():
+    def loader(name):
+        raise RuntimeError("missing checkpoint")
+
+    registry = ModelRegistry(loader=loader, memory_budget_bytes=GB, estimate_size=lambda name: 0)
+    with pytest.raises(RuntimeError):
+        registry.get("a")
+    entry = registry.status()["models"]["a"]
+    assert entry["state"] == "failed"
+    assert entry["error"] == "missing checkpoint"
+
+
+def test_merge_statuses():
+    first, _ = make_registry(budget_gb=2)
+    second, _ = make_registry(budget_gb=2)
+    first.get("a")
+    first.get("b")
+    second.get("a")
+    second.get("c")
+    second.evict("c")
+
+    assert merge_statuses([first.status()]) == first.status()
+
+    merged = merge_statuses([first.status(), second.status()])
+    assert merged["models"]["a"]["warm_workers"] == 2
+    assert merged["models"]["b"]["warm_workers"] == 1
+    assert merged["models"]["c"]["warm_workers"] == 0
+    assert merged["models"]["c"]["state"] == "cold"
+    assert merged["memory"]["budget_bytes"] == 4 * GB
+    assert merged["memory"]["used_bytes"] == 3 * GB
+    assert len(merged["workers"]) == 2
+
+
+def test_merged_model_is_warm_if_any_worker_holds_it():
+    first, _ = make_registry()
+    second, _ = make_registry()
+    first.get("a")
+    first.evict("a")
+    second.get("a")
+
+    merged = merge_statuses([first.status(), second.status()])
+    assert merged["models"]["a"]["state"] == "warm"
+    assert merged["models"]["a"]["warm_workers"] == 1
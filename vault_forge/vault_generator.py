@@ -1,10 +1,11 @@
 # vault_generator.py
 import os
 import json
-import zipfile
 from datetime import datetime
 import requests  # For API uploads
 
+from organizer.zip_builder import StreamingZipBuilder
+
 # API Keys (rotated for security)
 PINATA_API_KEY = os.getenv("PINATA_API_KEY")
 WEB3_STORAGE_TOKEN = os.getenv("WEB3_STORAGE_TOKEN")
@@ -141,10 +142,6 @@ def create_vault(project_name, tier="basic", deliverables_path=".", auto_upload=
 
     # Zip it
     zip_name = f"{root}.zip"
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as z:
-        for folder_name, subs, files in os.walk(root):
-            for file in files:
-                z.write(os.path.join(folder_name, file),
-                        os.path.relpath(os.path.join(folder_name, file), os.path.join(root, '..')))
+    StreamingZipBuilder(root, arc_root=os.path.basename(root), include_manifest=False).write_to(zip_name)
 
     return zip_name
\ No newline at end of file
@@ -4,14 +4,25 @@ Implements mini-SKG integration, temp vault management, and UCM/CALI communicati
 Version: 1.1 (Surgically Improved)
 """
 
+import hashlib
 import json
+import math
 import os
+import re
 import sqlite3
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import uuid
 
+try:
+    from knowledge.vector_index import VectorIndex, HashingEmbedder
+    VECTOR_INDEX_AVAILABLE = True
+except ImportError:
+    VectorIndex = HashingEmbedder = None
+    VECTOR_INDEX_AVAILABLE = False
+
 class WorkerSKG:
     """
     Base class for all GOAT workers.
@@ -87,6 +98,10 @@ class WorkerSKG:
                 return json.load(f)
         return {"script": [], "metadata": {"version": "1.0", "last_updated": None}}
 
+    def _script_version(self) -> Optional[str]:
+        """Version bumped by _apply_script_updates, used to key the cached section index"""
+        return self.script_data.get("metadata", {}).get("version")
+
     def _save_script(self):
         """Save updated script"""
         with open(self.script_path, 'w') as f:
@@ -105,7 +120,8 @@ class WorkerSKG:
             Response to user
         """
         # 1. Query mini-SKG for relevant script sections
-        relevant_sections = self.mini_skg.query(user_input, self.script_data["script"])
+        relevant_sections = self.mini_skg.query(user_input, self.script_data["script"],
+                                                script_version=self._script_version())
 
         # 2. Attempt to generate response
         response = self._generate_response(user_input, relevant_sections, user_context)
@@ -245,7 +261,7 @@ class WorkerSKG:
         self._save_script()
 
         # Reindex mini-SKG
-        self.mini_skg.reindex(self.script_data["script"])
+        self.mini_skg.reindex(self.script_data["script"], script_version=self._script_version())
 
     def _apply_logic_updates(self, updates: Dict[str, Any]):
         """Apply updates to logic.json"""
@@ -277,15 +293,62 @@ class WorkerSKG:
         }
 
 
+# Section indexes warm-loaded once per process, keyed by mini-SKG directory
+_SECTION_INDEXES: Dict[str, Dict[str, Any]] = {}
+
+
+# Function words that match nearly every section and carry no intent
+_STOPWORDS = frozenset("""
+a about an and any are as at be been but by can could do does for from had has have how i if in into is it
+its me my no not of on or our so than that the their them then there these they this to was we were what
+when where which who why will with would you your
+""".split())
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in re.findall(r"\w+", text.lower()) if token not in _STOPWORDS]
+
+
 class MiniSKG:
     """Mini-SKG for job-specific knowledge (already exists per user)"""
 
+    EMBEDDING_DIM = 256
+
+    # Term weight per section field when building the inverted index
+    FIELD_WEIGHTS = {"keywords": 3.0, "title": 2.0, "expected_questions": 1.0, "content": 0.5}
+
+    # Dense similarity needed for a section to be returned on embeddings alone
+    DENSE_MIN_SCORE = 0.35
+    DENSE_WEIGHT = 2.0
+
+    # Combined score a section needs to be returned at all
+    MIN_SCORE = 0.5
+
+    # Bump when tokenization or weighting changes so stored indexes rebuild
+    INDEX_VERSION = 2
+
     def __init__(self, skg_dir: Path):
         self.skg_dir = skg_dir
         self.kg_path = skg_dir / "knowledge_graph.json"
         self.embeddings_path = skg_dir / "embeddings.db"
+        self.vector_index_dir = skg_dir / "vector_index"
+        self._vector_index = None
+        self._embedder = HashingEmbedder(self.EMBEDDING_DIM) if VECTOR_INDEX_AVAILABLE else None
         self._initialize_skg()
 
+    @property
+    def vector_index(self) -> Optional["VectorIndex"]:
+        """Shared ANN index for this mini-SKG, opened on first use"""
+        if self._vector_index is None and VECTOR_INDEX_AVAILABLE:
+            self._vector_index = VectorIndex(self.vector_index_dir, dim=self.EMBEDDING_DIM)
+        return self._vector_index
+
+    def semantic_search(self, text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Nearest indexed items to the text as (id, score) pairs"""
+        if self.vector_index is None:
+            return []
+        return self.vector_index.search(self._embedder.embed(text), top_k)
+
     def _initialize_skg(self):
         """Initialize mini-SKG storage"""
         if not self.kg_path.exists():
@@ -303,27 +366,169 @@ class MiniSKG:
         """)
         conn.close()
 
-    def query(self, user_input: str, script_sections: List[Dict]) -> List[Dict]:
-        """Query mini-SKG for relevant script sections"""
-        # Simplified implementation - in production you'd use embeddings
-        relevant = []
-        input_lower = user_input.lower()
+    def query(self, user_input: str, script_sections: List[Dict], top_k: int = 5,
+              script_version: Optional[str] = None) -> List[Dict]:
+        """
+        Ranked lookup of script sections relevant to the input
 
-        for section in script_sections:
-            # Simple keyword matching for demo
-            keywords = section.get("keywords", [])
-            if any(keyword.lower() in input_lower for keyword in keywords):
-                relevant.append(section)
+        Scores are tf-idf weighted over the inverted index, blended with
+        dense similarity when embeddings are available. Only postings for
+        the input's terms are visited, so cost does not grow with script size.
+        Stopwords are ignored and sections below MIN_SCORE are dropped, so
+        input with no relevant terms returns [].
 
-        return relevant
+        The cached index is reused while the same sections list is passed
+        with the same script_version; whoever edits the script bumps the
+        version (or calls reindex).
+        """
+        terms = set(_tokenize(user_input))
+        if not terms:
+            return []
+
+        index = self._get_section_index(script_sections, script_version)
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in terms:
+            postings = index["postings"].get(token)
+            if not postings:
+                continue
+            idf = index["idf"][token]
+            for position, weight in postings.items():
+                scores[int(position)] += weight * idf
+
+        if index.get("dense"):
+            for item_id, similarity in self.semantic_search(" ".join(sorted(terms)), top_k):
+                position = int(item_id.split(":", 1)[1])
+                if similarity >= self.DENSE_MIN_SCORE or position in scores:
+                    scores[position] += self.DENSE_WEIGHT * max(similarity, 0.0)
+
+        ranked = sorted(((position, score) for position, score in scores.items() if score >= self.MIN_SCORE),
+                        key=lambda item: (-item[1], item[0]))
+        return [script_sections[position] for position, _ in ranked[:top_k]
+                if position < len(script_sections)]
+
+    def _sections_digest(self, script_sections: List[Dict]) -> str:
+        """Content hash of the script sections the index was built from"""
+        payload = json.dumps([self.INDEX_VERSION, script_sections], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _get_section_index(self, script_sections: List[Dict],
+                           script_version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Section index for this mini-SKG, loaded from disk or rebuilt when the sections change
+
+        Lookups for the indexed list and version are O(1). The content digest
+        is only computed when they differ, e.g. on the first query after a
+        restart, to decide whether the persisted index is still current.
+        """
+        cache_key = str(self.skg_dir)
+        index = _SECTION_INDEXES.get(cache_key)
+        if (index is not None and index.get("sections") is script_sections
+                and index.get("script_version") == script_version):
+            return index
+
+        digest = self._sections_digest(script_sections)
+        if index is not None and index["sections_digest"] == digest:
+            index.update(sections=script_sections, script_version=script_version)
+            return index
+
+        if self.kg_path.exists():
+            kg_data = json.loads(self.kg_path.read_text())
+            if "inverted_index" in kg_data and kg_data.get("sections_digest") == digest:
+                index = {
+                    "postings": kg_data["inverted_index"],
+                    "idf": kg_data["idf"],
+                    "section_count": kg_data["section_count"],
+                    "sections_digest": digest,
+                    "dense": kg_data.get("dense", False) and VECTOR_INDEX_AVAILABLE,
+                    "sections": script_sections,
+                    "script_version": script_version
+                }
+                _SECTION_INDEXES[cache_key] = index
+                return index
+
+        return self.reindex(script_sections, script_version)
+
+    def _build_section_index(self, script_sections: List[Dict]) -> Dict[str, Any]:
+        """Build the token -> {section position: weight} inverted index"""
+        postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+
+        for position, section in enumerate(script_sections):
+            key = str(position)
+            for field, weight in self.FIELD_WEIGHTS.items():
+                value = section.get(field, "")
+                text = " ".join(value) if isinstance(value, list) else str(value)
+                for token in set(_tokenize(text)):
+                    postings[token][key] = postings[token].get(key, 0.0) + weight
+
+        section_count = len(script_sections)
+        idf = {token: math.log(1 + section_count / len(sections)) for token, sections in postings.items()}
 
-    def reindex(self, script_sections: List[Dict]):
+        return {
+            "postings": dict(postings),
+            "idf": idf,
+            "section_count": section_count,
+            "sections_digest": self._sections_digest(script_sections),
+            "dense": False
+        }
+
+    def _section_text(self, section: Dict) -> str:
+        parts = [section.get("title", ""), section.get("content", "")]
+        parts.extend(section.get("expected_questions", []))
+        parts.extend(section.get("keywords", []))
+        return " ".join(str(part) for part in parts if part)
+
+    def _store_embeddings(self, script_sections: List[Dict], previous_count: int):
+        """Write section embeddings to embeddings.db and the shared vector index"""
+        texts = [self._section_text(section) for section in script_sections]
+        vectors = self._embedder.embed_batch([" ".join(_tokenize(text)) for text in texts])
+        ids = [f"section:{position}" for position in range(len(script_sections))]
+
+        conn = sqlite3.connect(self.embeddings_path)
+        with conn:
+            conn.execute("DELETE FROM embeddings WHERE id LIKE 'section:%'")
+            conn.executemany(
+                "INSERT INTO embeddings (id, content, embedding, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (item_id, text, vector.tobytes(),
+                     json.dumps({"section_id": section.get("id"), "position": position}))
+                    for position, (item_id, text, vector, section)
+                    in enumerate(zip(ids, texts, vectors, script_sections))
+                ]
+            )
+        conn.close()
+
+        if ids:
+            self.vector_index.add(ids, vectors)
+        stale = [f"section:{position}" for position in range(len(script_sections), previous_count)]
+        if stale:
+            self.vector_index.delete(stale)
+
+    def reindex(self, script_sections: List[Dict], script_version: Optional[str] = None) -> Dict[str, Any]:
         """Reindex mini-SKG when script updates"""
+        previous_count = 0
+        if self.kg_path.exists():
+            try:
+                previous_count = json.loads(self.kg_path.read_text()).get("section_count", 0)
+            except json.JSONDecodeError:
+                pass
+
+        index = self._build_section_index(script_sections)
+
+        if VECTOR_INDEX_AVAILABLE:
+            self._store_embeddings(script_sections, previous_count)
+            index["dense"] = True
+
         # Extract keywords and embeddings from script sections
         kg_data = {
             "nodes": [],
             "edges": [],
-            "last_indexed": datetime.utcnow().isoformat()
+            "last_indexed": datetime.utcnow().isoformat(),
+            "section_count": index["section_count"],
+            "sections_digest": index["sections_digest"],
+            "dense": index["dense"],
+            "inverted_index": index["postings"],
+            "idf": index["idf"]
         }
 
         for section in script_sections:
@@ -335,4 +540,8 @@ class MiniSKG:
             }
             kg_data["nodes"].append(node)
 
-        self.kg_path.write_text(json.dumps(kg_data, indent=2))
\ No newline at end of file
+        self.kg_path.write_text(json.dumps(kg_data, indent=2))
+
+        index.update(sections=script_sections, script_version=script_version)
+        _SECTION_INDEXES[str(self.skg_dir)] = index
+        return index